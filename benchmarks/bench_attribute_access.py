@@ -0,0 +1,136 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+"""Benchmark attribute access and dynamic property access of instruments.
+
+Compares the former implementation, which searched a list of special names and resolved the
+dynamic parameters with string joins and ``hasattr`` on every access, with the current
+:class:`~pymeasure.instruments.common_base.CommonBase` and
+:class:`~pymeasure.instruments.common_base.DynamicProperty`.
+The instrument does not communicate, such that only the attribute access is measured.
+
+Run it with ``python benchmarks/bench_attribute_access.py``.
+"""
+
+import argparse
+import timeit
+
+from pymeasure.instruments.common_base import CommonBase, DynamicProperty
+
+
+class LegacyDynamicProperty(DynamicProperty):
+    """The former access of the dynamic parameters."""
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        kwargs = {}
+        for attr in self.fget_params_list:
+            attr_instance_name = self.prefix + "_".join([self.name, attr])
+            if hasattr(obj, attr_instance_name):
+                kwargs[attr] = getattr(obj, attr_instance_name)
+        return self.fget(obj, **kwargs)
+
+    def __set__(self, obj, value):
+        kwargs = {}
+        for attr in self.fset_params_list:
+            attr_instance_name = self.prefix + "_".join([self.name, attr])
+            if hasattr(obj, attr_instance_name):
+                kwargs[attr] = getattr(obj, attr_instance_name)
+        self.fset(obj, value, **kwargs)
+
+
+class Bench(CommonBase):
+    """Instrument without communication."""
+
+    def __init__(self):
+        self.name = "bench"
+        super().__init__()
+
+    def values(self, command, **kwargs):
+        return [1.0]
+
+    def write(self, command, **kwargs):
+        pass
+
+    def wait_for(self, query_delay=None):
+        pass
+
+    voltage = CommonBase.control("VOLT?", "VOLT %g", "Control the voltage.", dynamic=True)
+    current = CommonBase.control("CURR?", "CURR %g", "Control the current.")
+    voltage_values = (0, 10)
+
+
+class LegacyBench(Bench):
+    """Instrument with the former attribute access."""
+
+    def __setattr__(self, name, value):
+        if hasattr(self, '_special_names'):
+            if name in self._special_names:
+                name = "___" + name
+        object.__setattr__(self, name, value)
+
+    def __getattribute__(self, name):
+        if name in ('_special_names', '__dict__'):
+            return object.__getattribute__(self, name)
+        if hasattr(self, '_special_names'):
+            if name in self._special_names:
+                raise AttributeError(
+                    f"{name} is a reserved variable name and it cannot be read")
+        return object.__getattribute__(self, name)
+
+    def _setup_special_names(self):
+        return list(super()._setup_special_names())
+
+    voltage = LegacyDynamicProperty(Bench.voltage.fget, Bench.voltage.fset,
+                                    fget_params_list=Bench.voltage.fget_params_list,
+                                    fset_params_list=Bench.voltage.fset_params_list,
+                                    prefix="___")
+
+
+def measure(name, statement, namespace, number):
+    duration = min(timeit.repeat(statement, globals=namespace, number=number, repeat=5))
+    print(f"  {name:<36} {duration / number * 1e9:8.1f} ns")
+    return duration
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=200_000, help="accesses per repetition")
+    args = parser.parse_args()
+
+    for title, cls in (("former implementation", LegacyBench), ("current", Bench)):
+        instrument = cls()
+        namespace = {"instrument": instrument}
+        print(title)
+        measure("instance attribute", "instrument.name", namespace, args.number)
+        measure("method", "instrument.write", namespace, args.number)
+        measure("property get", "instrument.current", namespace, args.number)
+        measure("dynamic property get", "instrument.voltage", namespace, args.number)
+        measure("dynamic property set", "instrument.voltage = 5", namespace, args.number)
+
+
+if __name__ == "__main__":
+    main()
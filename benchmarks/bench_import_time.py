@@ -0,0 +1,89 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+"""Benchmark the import time of pymeasure with ``python -X importtime``.
+
+Every import is measured in a new interpreter, repeatedly, reporting the fastest run.
+Modules imported by the interpreter at startup are not counted.
+Pass several source trees to compare them, for example a worktree of an older commit
+created with ``git worktree add ../pymeasure-old <commit>``.
+
+Run it with ``python benchmarks/bench_import_time.py [path ...]``.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+STATEMENTS = (
+    "import pymeasure",
+    "import pymeasure.experiment",
+    "from pymeasure.instruments.keithley import Keithley2400",
+    "from pymeasure.adapters import VISAAdapter",
+)
+
+
+def import_times(statement, path):
+    """Return the import time in s of each top-level module imported by `statement`."""
+    env = dict(os.environ, PYTHONPATH=path, PYTHONWARNINGS="ignore")
+    # The working directory is searched first with -c, use the tree there as well.
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], env=env,
+                            cwd=path, capture_output=True, text=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not name.startswith("  "):  # top-level, not imported by another module
+            times[name.strip()] = int(cumulative) * 1e-6
+    return times
+
+
+def measure(statement, path, repeat, startup):
+    durations = []
+    for _ in range(repeat):
+        times = import_times(statement, path)
+        durations.append(sum(t for name, t in times.items() if name not in startup))
+    return min(durations)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", default=[os.getcwd()],
+                        help="source trees containing the pymeasure package")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per import")
+    args = parser.parse_args()
+
+    for path in map(os.path.abspath, args.paths):
+        startup = set(import_times("pass", path))
+        print(path)
+        for statement in STATEMENTS:
+            duration = measure(statement, path, args.repeat, startup)
+            print(f"  {statement:<58} {duration * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
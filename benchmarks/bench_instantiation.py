@@ -0,0 +1,128 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+"""Benchmark the instantiation of every instrument driver in :mod:`pymeasure.instruments`.
+
+Compares instantiation with the class metadata (special names of dynamic properties and
+channel creators) computed once per class with computing it for every instance, as formerly.
+Drivers are instantiated with a :class:`~pymeasure.adapters.ProtocolAdapter`, drivers, which
+communicate or need further arguments during instantiation, are skipped.
+
+Run it with ``python benchmarks/bench_instantiation.py``.
+"""
+
+import argparse
+import importlib
+import inspect
+import logging
+import pkgutil
+import time
+import warnings
+from unittest import mock
+
+import pymeasure.instruments
+from pymeasure.adapters import ProtocolAdapter
+from pymeasure.instruments import Instrument
+from pymeasure.instruments.common_base import CommonBase, DynamicProperty
+
+
+def find_drivers():
+    """Return all instrument classes defined in the modules of pymeasure.instruments."""
+    drivers = []
+    for module_info in pkgutil.walk_packages(pymeasure.instruments.__path__,
+                                             "pymeasure.instruments.",
+                                             onerror=lambda name: None):
+        try:
+            module = importlib.import_module(module_info.name)
+        except Exception:
+            continue  # e.g. missing optional dependency
+        for name, cls in inspect.getmembers(module, inspect.isclass):
+            if issubclass(cls, Instrument) and cls.__module__ == module.__name__:
+                drivers.append(cls)
+    return drivers
+
+
+def instantiable(drivers):
+    """Return the drivers, which can be instantiated without communication."""
+    result = []
+    for cls in drivers:
+        start = time.perf_counter()
+        try:
+            cls(ProtocolAdapter())
+        except Exception:
+            continue
+        if time.perf_counter() - start < 0.1:  # skip drivers sleeping during instantiation
+            result.append(cls)
+    return result
+
+
+def legacy_setup_special_names(self):
+    """The former implementation, introspecting the class for every instance."""
+    special_names = []
+    dynamic_params = tuple(set(self._fget_params_list + self._fset_params_list))
+    for attr_name, attr in inspect.getmembers(self.__class__):
+        if isinstance(attr, DynamicProperty):
+            special_names += [attr_name + "_" + key for key in dynamic_params]
+    for attr, value in inspect.getmembers(self.__class__):
+        if attr in special_names:
+            setattr(self, "___" + attr, value)
+    return frozenset(special_names)
+
+
+def legacy_get_channels(cls):
+    """The former implementation, introspecting the class for every instance."""
+    return [(name, member) for name, member in inspect.getmembers(cls)
+            if isinstance(member, CommonBase.BaseChannelCreator)]
+
+
+def measure(name, drivers, number):
+    adapter = ProtocolAdapter()
+    total = 0
+    for cls in drivers:
+        for i in range(number):
+            start = time.perf_counter()
+            cls(adapter)
+            total += time.perf_counter() - start
+    print(f"{name:<40} {total / number * 1e3:8.1f} ms for all drivers, "
+          f"{total / number / len(drivers) * 1e6:8.1f} µs per driver")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=10, help="repetitions")
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    warnings.simplefilter("ignore")
+    drivers = instantiable(find_drivers())
+    print(f"{len(drivers)} drivers instantiated")
+    with mock.patch.object(CommonBase, "_setup_special_names", legacy_setup_special_names), \
+            mock.patch.object(CommonBase, "get_channels", staticmethod(legacy_get_channels)):
+        measure("metadata computed per instance", drivers, args.number)
+    measure("metadata computed once per class", drivers, args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+"""Benchmark the round-trip latency of queries over TCP with :class:`SocketAdapter` and
+:class:`VISAAdapter` (``TCPIP::...::SOCKET`` resource with pyvisa-py).
+
+The instrument is a local simulator (:class:`~pymeasure.instruments.simulator.SimulatorServer`).
+
+Run it with ``python benchmarks/bench_socket_roundtrip.py``.
+"""
+
+import argparse
+import statistics
+import time
+
+from pymeasure.adapters import SocketAdapter, VISAAdapter
+from pymeasure.instruments import Instrument
+from pymeasure.instruments.simulator import SimulatorServer
+
+
+class Simulated(Instrument):
+    voltage = Instrument.control("VOLT?", "VOLT %g", """Control the voltage.""")
+
+
+def measure(name, adapter, number):
+    durations = []
+    for i in range(number):
+        start = time.perf_counter()
+        adapter.write("VOLT?")
+        adapter.read()
+        durations.append(time.perf_counter() - start)
+    print(f"{name:<30} median {statistics.median(durations) * 1e6:8.1f} µs, "
+          f"mean {statistics.mean(durations) * 1e6:8.1f} µs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2000, help="number of queries")
+    args = parser.parse_args()
+
+    with SimulatorServer(Simulated) as server:
+        adapter = SocketAdapter(*server.address)
+        measure("SocketAdapter", adapter, args.number)
+        adapter.close()
+        try:
+            adapter = VISAAdapter(server.resource_name, visa_library="@py",
+                                  read_termination="\n", write_termination="\n")
+        except Exception as exc:
+            print(f"VISAAdapter not available: {exc}")
+        else:
+            measure("VISAAdapter (pyvisa-py)", adapter, args.number)
+            adapter.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+"""Benchmark parsing of long ASCII numeric replies with :meth:`CommonBase.values`.
+
+Compares the former implementation, which cast every element of the split reply on its own,
+with the current one, which parses numeric replies with NumPy, returning a list or, with
+``as_array=True``, the array itself.
+The instrument does not communicate, such that only the parsing is measured.
+
+Run it with ``python benchmarks/bench_values.py``.
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+from pymeasure.instruments.common_base import CommonBase
+
+
+class Bench(CommonBase):
+    """Instrument, which replies with a fixed string."""
+
+    def __init__(self, reply):
+        self.reply = reply
+        super().__init__()
+
+    def ask(self, command, query_delay=None):
+        return self.reply
+
+
+def legacy_values(self, command, separator=',', cast=float, preprocess_reply=None, maxsplit=-1,
+                  **kwargs):
+    """The former implementation of :meth:`CommonBase.values`."""
+    results = self.ask(command, **kwargs).strip()
+    if callable(preprocess_reply):
+        results = preprocess_reply(results)
+    results = results.split(separator, maxsplit=maxsplit)
+    for i, result in enumerate(results):
+        try:
+            if cast == bool:
+                results[i] = bool(float(result))
+            else:
+                results[i] = cast(result)
+        except Exception:
+            pass
+    return results
+
+
+def measure(name, function, number):
+    duration = min(timeit.repeat(function, number=number, repeat=5))
+    print(f"  {name:<36} {duration / number * 1e6:10.1f} µs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20, help="replies per repetition")
+    args = parser.parse_args()
+
+    for points in (10, 1001, 100_001):
+        reply = ",".join(f"{value:+.8E}" for value in np.linspace(-100, 100, points))
+        instrument = Bench(reply)
+        number = max(args.number, args.number * 1000 // points)
+        print(f"{points} values")
+        measure("former list", lambda: legacy_values(instrument, "TRAC?"), number)
+        measure("former list to array",
+                lambda: np.array(legacy_values(instrument, "TRAC?"), dtype=np.float64), number)
+        measure("list", lambda: instrument.values("TRAC?"), number)
+        measure("array", lambda: instrument.values("TRAC?", as_array=True), number)
+
+
+if __name__ == "__main__":
+    main()
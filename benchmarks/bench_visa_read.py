@@ -0,0 +1,127 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+"""Benchmark reading a response of unknown length with :class:`VISAAdapter`.
+
+Compares the former byte-by-byte loop with the chunked reading of
+``VISAAdapter.read_bytes(-1)`` for an IEEE 488.2 block and for plain data.
+The connection is a :class:`ProtocolAdapter` stand-in with a configurable latency per call,
+which emulates the overhead of a VISA call.
+
+Run it with ``python benchmarks/bench_visa_read.py``.
+"""
+
+import argparse
+import time
+import timeit
+
+import pyvisa
+
+from pymeasure.adapters import ProtocolAdapter, VISAAdapter
+
+
+class StandInConnection(ProtocolAdapter):
+    """ProtocolAdapter which behaves like a pyvisa resource, which times out when empty."""
+
+    def __init__(self, response, latency=0, report_buffer=True):
+        super().__init__()
+        self.response = response
+        self.latency = latency
+        self.report_buffer = report_buffer
+        self.read_termination = None
+        self.calls = 0
+        self.reload()
+
+    def reload(self):
+        self._read_buffer = self.response
+
+    @property
+    def bytes_in_buffer(self):
+        if not self.report_buffer:
+            raise AttributeError("bytes_in_buffer")
+        return len(self._read_buffer or b"")
+
+    def read_bytes(self, count, **kwargs):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if not self._read_buffer:
+            raise pyvisa.errors.VisaIOError(pyvisa.constants.StatusCode.error_timeout)
+        return self._read_bytes(count)
+
+
+def legacy_read(connection):
+    """The former implementation: one call per byte until a timeout."""
+    result = bytearray()
+    while True:
+        try:
+            result.extend(connection.read_bytes(1))
+        except pyvisa.errors.VisaIOError as exc:
+            if exc.error_code == pyvisa.constants.StatusCode.error_timeout:
+                return bytes(result)
+            raise
+
+
+def chunked_read(adapter):
+    return adapter.read_bytes(-1)
+
+
+def measure(name, function, argument, connection, number):
+    def run():
+        connection.reload()
+        function(argument)
+    connection.calls = 0
+    duration = timeit.timeit(run, number=number) / number
+    print(f"{name:<40} {duration * 1e3:10.3f} ms {connection.calls // number:10d} calls")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=10_000, help="number of data bytes")
+    parser.add_argument("--latency", type=float, default=0, help="latency per call in s")
+    parser.add_argument("--number", type=int, default=5, help="repetitions")
+    args = parser.parse_args()
+
+    data = bytes(i % 256 for i in range(args.size))
+    length = str(len(data)).encode()
+    block = b"#" + str(len(length)).encode() + length + data
+
+    adapter = VISAAdapter(ProtocolAdapter())
+    # Use the VISAAdapter implementation instead of the ProtocolAdapter shortcut.
+    del adapter.read_bytes
+    for title, response, report_buffer in (
+            ("IEEE block, no buffer information", block, False),
+            ("IEEE block, bytes in buffer", block, True),
+            ("plain data, bytes in buffer", data, True),
+    ):
+        print(title)
+        connection = StandInConnection(response, args.latency, report_buffer)
+        adapter.connection = connection
+        measure("  byte-by-byte loop", legacy_read, connection, connection, args.number)
+        measure("  VISAAdapter.read_bytes(-1)", chunked_read, adapter, connection, args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -23,20 +23,23 @@
 #
 import logging
 
+from ..lazy import lazy_attributes
 from .adapter import Adapter, FakeAdapter
+from .asynchronous import AsyncAdapter
+from .statistics import AdapterStatistics, export_stats, reset_stats
+from .tracing import Tracer
+from .tuning import QueryDelayTuner
 
-from .protocol import ProtocolAdapter
+from .protocol import ProtocolAdapter, AsyncProtocolAdapter
+from .replay import RecordingAdapter, ReplayAdapter
+from .socket import SocketAdapter, AsyncSocketAdapter
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
-try:
-    from pymeasure.adapters.visa import VISAAdapter
-    from pymeasure.adapters.prologix import PrologixAdapter
-except ImportError:
-    log.warning("PyVISA library could not be loaded")
-
-try:
-    from pymeasure.adapters.serial import SerialAdapter
-except ImportError:
-    log.warning("PySerial library could not be loaded")
+# The adapters depending on PyVISA and PySerial are imported when they are accessed.
+__getattr__, __dir__, _ = lazy_attributes(__name__, {
+    ".visa": ["VISAAdapter", "AsyncVISAAdapter"],
+    ".prologix": ["PrologixAdapter", "PrologixEthernetAdapter"],
+    ".serial": ["SerialAdapter", "AsyncSerialAdapter"],
+})
@@ -23,10 +23,49 @@
 #
 
 import logging
+import threading
+import time
 
 import numpy as np
 from copy import copy
-from pyvisa.util import to_ieee_block, to_hp_block, to_binary_block
+
+from .statistics import AdapterStatistics
+
+
+def _parse_ieee_block_header(data):
+    """Parse the header of an IEEE 488.2 definite length arbitrary block at the start of `data`.
+
+    :param data: Bytes starting with the block, e.g. ``b"#3100..."``.
+    :returns: Tuple of the header length and the data length or None, if `data` does not
+        (yet) contain a complete header of a definite length block.
+    """
+    if len(data) < 2 or data[0:1] != b"#":
+        return None
+    digits = data[1] - 0x30  # ASCII digit
+    if not 0 < digits <= 9 or len(data) < 2 + digits:
+        # Indefinite length block (#0) or incomplete header
+        return None
+    try:
+        return 2 + digits, int(data[2:2 + digits])
+    except ValueError:
+        return None
+
+
+def _command_key(content, length=40):
+    """Return the beginning of the bytes `content` as a string to identify the command."""
+    return content[:length].decode("ascii", errors="backslashreplace")
+
+
+def _is_timeout(exc):
+    """Return whether the exception `exc` indicates a timeout of the connection."""
+    if isinstance(exc, TimeoutError):
+        return True
+    error_code = getattr(exc, "error_code", None)
+    if error_code is None:
+        return False
+    # PyVISA is imported only when needed, as importing it takes long.
+    from pyvisa.constants import StatusCode
+    return error_code == StatusCode.error_timeout
 
 
 class Adapter:
@@ -36,6 +75,13 @@ class Adapter:
 
     This class should only be inherited from.
 
+    Each adapter has a re-entrant lock, which is held during every read and write. Use
+    :meth:`transaction` to hold it for a whole exchange of several messages.
+    Adapters sharing a connection share the lock as well.
+
+    Monitors (see :meth:`add_monitor`) may observe the duration of every read and write, for
+    example the statistics enabled with :meth:`enable_stats`.
+
     :param log: Parent logger of the 'Adapter' logger.
     :param \\**kwargs: Keyword arguments just to be cooperative.
     """
@@ -43,6 +89,10 @@ class Adapter:
     def __init__(self, log=None, **kwargs):
         super().__init__(**kwargs)
         self.connection = None
+        self._lock = threading.RLock()
+        self._monitors = ()
+        self._last_command = None
+        self._stats = None
         if log is None:
             self.log = logging.getLogger("Adapter")
         else:
@@ -58,6 +108,124 @@ class Adapter:
         if self.connection is not None:
             self.connection.close()
 
+    def transaction(self):
+        """Return a context manager, which grants the current thread exclusive access to the
+        connection for the duration of its block.
+
+        Other threads wait with their communication until the block is left.
+        Transactions may be nested.
+
+        .. code::
+
+            with instrument.adapter.transaction():
+                instrument.write("TRAC:DATA?")
+                header = instrument.read_bytes(2)
+                data = instrument.read_bytes(int(header[1:]))
+        """
+        return self._lock
+
+    # Monitoring of the communication
+    def add_monitor(self, monitor):
+        """Add a monitor, which observes the communication of this adapter.
+
+        The monitor's method ``record(kind, command, start, duration, size, timeout)`` is called
+        after each event, see :meth:`AdapterStatistics.record()
+        <pymeasure.adapters.statistics.AdapterStatistics.record>`.
+        Without monitors, the communication is not timed at all.
+        """
+        self._monitors = self._monitors + (monitor,)
+
+    def remove_monitor(self, monitor):
+        """Remove a monitor added with :meth:`add_monitor`."""
+        self._monitors = tuple(m for m in self._monitors if m is not monitor)
+
+    def record(self, kind, command, start, duration, size=0, timeout=False):
+        """Report an event of the communication to the monitors, if there are any.
+
+        Instruments report for example their query delay as ``"delay"`` event.
+
+        :param str kind: Kind of the event, e.g. "write", "read", "delay" or "garbled" (see
+            :meth:`Instrument.reject_reply() <pymeasure.instruments.Instrument.reject_reply>`).
+        :param command: Command of the event. If None, the command written last.
+        :param float start: Start time (:func:`time.perf_counter`) of the event in s.
+        :param float duration: Duration of the event in s.
+        :param int size: Number of bytes transferred.
+        :param bool timeout: Whether the event ended with a timeout.
+        """
+        if command is None:
+            command = self._last_command
+        for monitor in self._monitors:
+            monitor.record(kind, command, start, duration, size, timeout)
+
+    def _call_monitored(self, kind, command, function, *args, **kwargs):
+        """Call `function` and report the event to the monitors.
+
+        :returns: The return value of `function`.
+        """
+        if command is not None:
+            self._last_command = command
+        start = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        except Exception as exc:
+            self.record(kind, command, start, time.perf_counter() - start,
+                        timeout=_is_timeout(exc))
+            raise
+        duration = time.perf_counter() - start
+        if kind == "write":  # a string command or bytes
+            size = self._write_size(args[0]) if isinstance(args[0], str) else len(args[0])
+        else:  # the bytes read or their number
+            size = result if isinstance(result, int) else len(result)
+        self.record(kind, command, start, duration, size)
+        return result
+
+    def _write_size(self, command):
+        """Return the number of bytes sent by writing the string `command`, including the
+        write termination."""
+        return len((command + getattr(self, "write_termination", "")).encode())
+
+    def enable_stats(self, name=None):
+        """Enable the collection of latency and throughput statistics, see :meth:`stats`.
+
+        :param str name: Name of the statistics for
+            :func:`~pymeasure.adapters.statistics.export_stats`, e.g. the instrument name.
+            Defaults to the representation of the adapter.
+        """
+        if self._stats is None:
+            self._stats = AdapterStatistics(repr(self) if name is None else name)
+            self.add_monitor(self._stats)
+        elif name is not None:
+            self._stats.name = name
+
+    def disable_stats(self):
+        """Disable the collection of statistics and discard them."""
+        if self._stats is not None:
+            self.remove_monitor(self._stats)
+            self._stats = None
+
+    def stats(self):
+        """Return the statistics of the communication per command.
+
+        .. code::
+
+            adapter.enable_stats("Keithley 2400")
+            ...  # communicate
+            adapter.stats()
+            # {"MEAS:VOLT?": {"write": {"count": 10, "total": 0.0021, "mean": ...},
+            #                 "read": {"count": 10, "total": 0.31, ..., "timeouts": 0}}}
+
+        :returns: Dictionary of commands with a dictionary of the events ("write", "read" or
+            "delay") and their counters: count, total, mean, min and max duration in s,
+            number of bytes, timeouts and a latency histogram.
+            Empty, if the statistics are not enabled.
+        """
+        return {} if self._stats is None else self._stats.as_dict()
+
+    def reset_stats(self):
+        """Reset the statistics of :meth:`stats`."""
+        if self._stats is not None:
+            self._stats.reset()
+
     # Directly called methods, which ensure proper logging of the communication
     # without the termination characters added by the particular adapters.
     # DO NOT OVERRIDE IN SUBCLASS!
@@ -70,8 +238,12 @@ class Adapter:
             (without termination).
         :param \\**kwargs: Keyword arguments for the connection itself.
         """
-        self.log.debug("WRITE:%s", command)
-        self._write(command, **kwargs)
+        with self._lock:
+            self.log.debug("WRITE:%s", command)
+            if self._monitors:
+                self._call_monitored("write", command, self._write, command, **kwargs)
+            else:
+                self._write(command, **kwargs)
 
     def write_bytes(self, content, **kwargs):
         """Write the bytes `content` to the instrument.
@@ -81,8 +253,13 @@ class Adapter:
         :param bytes content: The bytes to write to the instrument.
         :param \\**kwargs: Keyword arguments for the connection itself.
         """
-        self.log.debug("WRITE:%s", content)
-        self._write_bytes(content, **kwargs)
+        with self._lock:
+            self.log.debug("WRITE:%s", content)
+            if self._monitors:
+                self._call_monitored("write", _command_key(content), self._write_bytes, content,
+                                     **kwargs)
+            else:
+                self._write_bytes(content, **kwargs)
 
     def read(self, **kwargs):
         """Read up to (excluding) `read_termination` or the whole read buffer.
@@ -92,7 +269,11 @@ class Adapter:
         :param \\**kwargs: Keyword arguments for the connection itself.
         :returns str: ASCII response of the instrument (excluding read_termination).
         """
-        read = self._read(**kwargs)
+        with self._lock:
+            if self._monitors:
+                read = self._call_monitored("read", None, self._read, **kwargs)
+            else:
+                read = self._read(**kwargs)
         self.log.debug("READ:%s", read)
         return read
 
@@ -107,10 +288,35 @@ class Adapter:
         :param \\**kwargs: Keyword arguments for the connection itself.
         :returns bytes: Bytes response of the instrument (including termination).
         """
-        read = self._read_bytes(count, break_on_termchar, **kwargs)
+        with self._lock:
+            if self._monitors:
+                read = self._call_monitored("read", None, self._read_bytes, count,
+                                            break_on_termchar, **kwargs)
+            else:
+                read = self._read_bytes(count, break_on_termchar, **kwargs)
         self.log.debug("READ:%s", read)
         return read
 
+    def read_bytes_into(self, buffer, **kwargs):
+        """Read bytes from the instrument into the writable `buffer` until it is full.
+
+        Do not override in a subclass!
+
+        :param buffer: Writable, contiguous bytes-like object, e.g. a :class:`bytearray` or a
+            NumPy array, which is filled with the received bytes.
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        :returns int: Number of bytes read, which is smaller than the size of `buffer`, if a
+            timeout occurred.
+        """
+        view = memoryview(buffer).cast("B")
+        with self._lock:
+            if self._monitors:
+                count = self._call_monitored("read", None, self._read_bytes_into, view, **kwargs)
+            else:
+                count = self._read_bytes_into(view, **kwargs)
+        self.log.debug("READ:%d bytes into buffer", count)
+        return count
+
     # Methods to implement in the subclasses.
     def _write(self, command, **kwargs):
         """Write string to the instrument. Implement in subclass."""
@@ -128,26 +334,104 @@ class Adapter:
         """Read bytes from the instrument. Implement in subclass."""
         raise NotImplementedError("Adapter class has not implemented reading bytes.")
 
+    def _read_bytes_into(self, view, **kwargs):
+        """Read bytes into the memoryview `view` until it is full and return their number.
+
+        Override in subclass, if the connection can read into a buffer without a copy.
+        """
+        count = 0
+        while count < len(view):
+            chunk = self._read_bytes(len(view) - count, False, **kwargs)
+            if not chunk:
+                break
+            view[count:count + len(chunk)] = chunk
+            count += len(chunk)
+        return count
+
     def flush_read_buffer(self):
         """Flush and discard the input buffer. Implement in subclass."""
         raise NotImplementedError("Adapter class has not implemented input flush.")
 
     # Binary format methods
     def read_binary_values(self, header_bytes=0, termination_bytes=None,
-                           dtype=np.float32, **kwargs):
+                           dtype=np.float32, out=None, **kwargs):
         """ Returns a numpy array from a query for binary data
 
+        If a preallocated array `out` is given, the data is read directly into it, which avoids
+        allocating new memory for every acquisition of the same size:
+
+        .. code::
+
+            buffer = np.empty(10000, dtype=">f4")
+            while measuring:
+                adapter.write("TRAC:DATA?")
+                values = adapter.read_binary_values(out=buffer, termination_bytes=-1)
+
+        In this case, an IEEE 488.2 definite length block header (``#<n><length>``) is parsed,
+        if `header_bytes` is 0 and the response starts with ``#``.
+        The data type of `out` defines the data type of the values.
+
         :param int header_bytes: Number of bytes to ignore in header.
         :param int termination_bytes: Number of bytes to strip at end of message or None.
+            If `out` is given, a negative number of trailing bytes is read and discarded after
+            the data.
         :param dtype: The NumPy data type to format the values with.
+        :param out: A contiguous NumPy array to read the values into, or None.
         :param \\**kwargs: Further arguments for the NumPy fromstring method.
-        :returns: NumPy array of values
+        :returns: NumPy array of values. If `out` is given, `out` itself, or a flattened view
+            of its beginning, if fewer values were received.
         """
+        if out is not None:
+            view = memoryview(out).cast("B")
+            with self._lock:
+                if self._monitors:
+                    count = self._call_monitored("read", None, self._read_block_into, view,
+                                                 header_bytes, termination_bytes)
+                else:
+                    count = self._read_block_into(view, header_bytes, termination_bytes)
+            self.log.debug("READ:%d bytes into buffer", count)
+            if count == out.nbytes:
+                return out
+            return out.reshape(-1)[:count // out.itemsize]
         binary = self.read_bytes(-1)
         # header = binary[:header_bytes]
         data = binary[header_bytes:termination_bytes]
         return np.fromstring(data, dtype=dtype, **kwargs)
 
+    def _read_block_into(self, view, header_bytes, termination_bytes, **kwargs):
+        """Read a binary block into the memoryview `view` and return the number of data bytes.
+
+        :param view: Memoryview of unsigned bytes to fill.
+        :param int header_bytes: Number of header bytes to skip. If 0, an IEEE 488.2 definite
+            length header is parsed, if present.
+        :param int termination_bytes: Negative number of bytes to discard after the data.
+        :param \\**kwargs: Keyword arguments for :meth:`_read_bytes_into`.
+        """
+        offset = 0
+        length = len(view)
+        if header_bytes:
+            self._read_bytes_into(memoryview(bytearray(header_bytes)), **kwargs)
+        elif self._read_bytes_into(view[:1], **kwargs) == 0:
+            return 0
+        elif view[0] == ord("#"):
+            digits = bytearray(1)
+            self._read_bytes_into(memoryview(digits), **kwargs)
+            if not digits.isdigit():
+                raise ValueError(f"Invalid IEEE 488.2 block header '#{digits.decode()}'.")
+            if int(digits) > 0:  # definite length block, otherwise read until full / timeout
+                length_field = bytearray(int(digits))
+                self._read_bytes_into(memoryview(length_field), **kwargs)
+                length = int(length_field)
+                if length > len(view):
+                    raise ValueError(f"Block of {length} bytes does not fit into the buffer of "
+                                     f"{len(view)} bytes.")
+        else:
+            offset = 1  # no header, the first byte is data already
+        count = offset + self._read_bytes_into(view[offset:length], **kwargs)
+        if termination_bytes is not None and termination_bytes < 0:
+            self._read_bytes_into(memoryview(bytearray(-termination_bytes)), **kwargs)
+        return count
+
     def _format_binary_values(self, values, datatype='f', is_big_endian=False, header_fmt="ieee"):
         """Format values in binary format, used internally in :meth:`Adapter.write_binary_values`.
 
@@ -158,6 +442,8 @@ class Adapter:
         :return: binary string.
         :rtype: bytes
         """
+        from pyvisa.util import to_ieee_block, to_hp_block, to_binary_block
+
         if header_fmt == "ieee":
             block = to_ieee_block(values, datatype, is_big_endian)
         elif header_fmt == "hp":
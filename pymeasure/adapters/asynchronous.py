@@ -0,0 +1,162 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class AsyncAdapter:
+    """ Base class for asyncio adapters, the awaitable counterpart of
+    :class:`~pymeasure.adapters.Adapter`.
+
+    An AsyncAdapter wraps a synchronous adapter and executes its blocking calls in a single
+    worker thread owned by the AsyncAdapter. Messages to one connection are therefore still sent
+    in order, while one event loop can overlap the communication with instruments on different
+    buses.
+
+    .. code::
+
+        adapter = AsyncVISAAdapter("GPIB::4")
+        await adapter.write("*IDN?")
+        identification = await adapter.read()
+
+    :param adapter: The synchronous :class:`~pymeasure.adapters.Adapter` instance to wrap.
+    :param \\**kwargs: Keyword arguments just to be cooperative.
+    """
+
+    def __init__(self, adapter, **kwargs):
+        super().__init__(**kwargs)
+        self.adapter = adapter
+        self._executor = ThreadPoolExecutor(max_workers=1,
+                                            thread_name_prefix=self.__class__.__name__)
+
+    def __del__(self):
+        """Stop the worker thread upon garbage collection."""
+        self._shutdown()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def connection(self):
+        """Get the connection of the wrapped adapter."""
+        return self.adapter.connection
+
+    @property
+    def log(self):
+        """Get the logger of the wrapped adapter."""
+        return self.adapter.log
+
+    def close(self):
+        """Close the connection and stop the worker thread."""
+        self.adapter.close()
+        self._shutdown()
+
+    def _shutdown(self):
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    async def run(self, function, *args, **kwargs):
+        """Run a blocking callable in the worker thread of this adapter and return its result.
+
+        All communication of this adapter happens via this method, such that it is
+        serialized in the worker thread.
+
+        :param function: Callable to execute.
+        :param \\*args, \\**kwargs: Arguments for the callable.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor,
+                                          functools.partial(function, *args, **kwargs))
+
+    async def write(self, command, **kwargs):
+        """Write a string command to the instrument appending `write_termination`.
+
+        :param str command: Command string to be sent to the instrument
+            (without termination).
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        """
+        await self.run(self.adapter.write, command, **kwargs)
+
+    async def write_bytes(self, content, **kwargs):
+        """Write the bytes `content` to the instrument.
+
+        :param bytes content: The bytes to write to the instrument.
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        """
+        await self.run(self.adapter.write_bytes, content, **kwargs)
+
+    async def read(self, **kwargs):
+        """Read up to (excluding) `read_termination` or the whole read buffer.
+
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        :returns str: ASCII response of the instrument (excluding read_termination).
+        """
+        return await self.run(self.adapter.read, **kwargs)
+
+    async def read_bytes(self, count=-1, break_on_termchar=False, **kwargs):
+        """Read a certain number of bytes from the instrument.
+
+        :param int count: Number of bytes to read. A value of -1 indicates to
+            read from the whole read buffer.
+        :param bool break_on_termchar: Stop reading at a termination character.
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        :returns bytes: Bytes response of the instrument (including termination).
+        """
+        return await self.run(self.adapter.read_bytes, count, break_on_termchar, **kwargs)
+
+    async def read_binary_values(self, header_bytes=0, termination_bytes=None,
+                                 dtype=np.float32, **kwargs):
+        """ Returns a numpy array from a query for binary data
+
+        See :meth:`pymeasure.adapters.Adapter.read_binary_values` for the parameters.
+        """
+        return await self.run(self.adapter.read_binary_values, header_bytes=header_bytes,
+                              termination_bytes=termination_bytes, dtype=dtype, **kwargs)
+
+    async def write_binary_values(self, command, values, *args, **kwargs):
+        """ Write binary data to the instrument, e.g. waveform for signal generators
+
+        See :meth:`pymeasure.adapters.Adapter.write_binary_values` for the parameters.
+        """
+        return await self.run(self.adapter.write_binary_values, command, values, *args,
+                              **kwargs)
+
+    async def flush_read_buffer(self):
+        """Flush and discard the input buffer."""
+        await self.run(self.adapter.flush_read_buffer)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}({self.adapter!r})>"
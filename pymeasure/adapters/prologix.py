@@ -21,97 +21,64 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 #
+import re
+import select
+import threading
 import time
+import weakref
 
 from pymeasure.adapters import VISAAdapter
 from pyvisa.constants import VI_ATTR_ASRL_AVAIL_NUM
 
+from .adapter import Adapter
+from .socket import SocketAdapter
 
-class PrologixAdapter(VISAAdapter):
-    """ Encapsulates the additional commands necessary
-    to communicate over a Prologix GPIB-USB Adapter,
-    using the :class:`VISAAdapter`.
-
-    Each PrologixAdapter is constructed based on a connection to the Prologix device
-    itself and the GPIB address of the instrument to be communicated to.
-    Connection sharing is achieved by using the :meth:`.gpib`
-    method to spawn new PrologixAdapters for different GPIB addresses.
-
-    :param resource_name: A
-        `VISA resource string <https://pyvisa.readthedocs.io/en/latest/introduction/names.html>`__
-        that identifies the connection to the Prologix device itself, for example
-        "ASRL5" for the 5th COM port.
-    :param address: Integer GPIB address of the desired instrument.
-    :param auto: Enable or disable read-after-write and address instrument to listen.
-    :param eoi: Enable or disable EOI assertion.
-    :param eos: Set command termination string (CR+LF, CR, LF, or "")
-    :param gpib_read_timeout: Set read timeout for GPIB communication in milliseconds from 1..3000
-    :param kwargs: Key-word arguments if constructing a new serial object
-
-    :ivar address: Integer GPIB address of the desired instrument.
-
-    Usage example:
-
-    .. code::
+# Characters of binary data, which the Prologix controller would interpret.
+_SPECIAL_CHARACTERS = re.compile(rb"[\r\n\x1b+]")
 
-        adapter = PrologixAdapter("ASRL5::INSTR", 7)
-        sourcemeter = Keithley2400(adapter)  # at GPIB address 7
-        # generate another instance with a different GPIB address:
-        adapter2 = adapter.gpib(9)
-        multimeter = Keithley2000(adapter2)  # at GPIB address 9
 
+def _escape(block):
+    """Escape the special characters (CR, LF, ESC and '+') of `block` with a preceding ESC."""
+    return _SPECIAL_CHARACTERS.sub(b"\x1b\\g<0>", block)
 
-    To allow user access to the Prologix adapter in Linux, create the file:
-    :code:`/etc/udev/rules.d/51-prologix.rules`, with contents:
 
-    .. code-block:: bash
+class _ControllerState:
+    """State of a Prologix controller, shared by all adapters using its connection."""
 
-        SUBSYSTEMS=="usb",ATTRS{idVendor}=="0403",ATTRS{idProduct}=="6001",MODE="0666"
+    def __init__(self):
+        self.address = None  # currently selected GPIB address, None if unknown
+        self.auto = None  # read-after-write setting, None if unknown
+        self.pending = b""  # controller commands to send with the next message
 
-    Then reload the udev rules with:
 
-    .. code-block:: bash
+# Controller states by connection, such that all adapters using one connection share it.
+_controllers = weakref.WeakKeyDictionary()
+_controllers_lock = threading.Lock()
 
-        sudo udevadm control --reload-rules
-        sudo udevadm trigger
 
-    Since the Prologix adapter uses the same communication channel (an USB
-    CDC) for both, communication with the adapter itself, as well as
-    communication over GPIB, certain things need to be kept in mind:
+def _controller_state(connection):
+    """Return the controller state of `connection`, creating it on first use."""
+    with _controllers_lock:
+        try:
+            state = _controllers.get(connection)
+        except TypeError:  # connection does not support weak references
+            return _ControllerState()
+        if state is None:
+            state = _controllers[connection] = _ControllerState()
+        return state
 
-    - Operations that need to read from GPIB use the standard :meth:`read`
-      method.
 
-    - Operations that just read responses from the Prologix itself need to
-      add the parameter :code:`prologix=True` to :meth:`read`; this avoids
-      requesting data from GPIB. This is also necessary when the adapter is
-      put into "listen-only" mode, where all GPIB traffic is automatically
-      being passed up.
+class _PrologixMixin:
+    """Commands and state of Prologix GPIB controllers, shared by :class:`PrologixAdapter` and
+    :class:`PrologixEthernetAdapter`."""
 
-    - Binary data must be passed to the bus using :meth:`write_binary_values`.
-      This takes care of properly escaping those binary values that would
-      otherwise be interpreted by the Prologix adapter. Note that the default
-      for :meth:`write_binary_values` are to assume floating-point binary
-      data, and prepend IEEE headers. In order to pass just plain bytes to the
-      adapter, tune the :code:`datatype` and :code:`header_fmt` parameters:
-
-      .. code::
-
-         multimeter.write_binary_values('W', [addr], datatype='B', header_fmt='empty')
-
-    """
-
-    def __init__(self, resource_name, address=None,
-                 auto=False, eoi=True, eos="\n", gpib_read_timeout=None,
-                 **kwargs):
-        super().__init__(resource_name,
-                         asrl={
-                             'timeout': 500,
-                             'write_termination': "\n",
-                         },
-                         **kwargs)
-        self.address = address
-        if not isinstance(resource_name, PrologixAdapter):
+    def _setup_controller(self, parent, auto, eoi, eos, gpib_read_timeout):
+        """Share the controller state of the `parent` adapter or configure the controller."""
+        if isinstance(parent, _PrologixMixin):
+            self._controller = parent._controller
+        else:
+            # Other adapters might use the same connection, e.g. a shared VISA session.
+            self._controller = _controller_state(self.connection)
             self.auto = auto
             self.eoi = eoi
             self.eos = eos
@@ -128,8 +95,10 @@ class PrologixAdapter(VISAAdapter):
         feature called, Read-After-Write, saves the user from having to issue read commands
         repeatedly. This property enables (True) or disables (False) this feature.
         """
-        self.write("++auto")
-        return bool(int(self.read(prologix=True)))
+        with self._lock:
+            self.write("++auto")
+            self._controller.auto = bool(int(self.read(prologix=True)))
+            return self._controller.auto
 
     @auto.setter
     def auto(self, value):
@@ -143,9 +112,9 @@ class PrologixAdapter(VISAAdapter):
         Some instruments require EOI signal to be
         asserted in order to properly detect the end of a command.
         """
-        self.write("++eoi")
-        return bool(int(self.read(prologix=True)))
-        self.read(prologix=True)
+        with self._lock:
+            self.write("++eoi")
+            return bool(int(self.read(prologix=True)))
 
     @eoi.setter
     def eoi(self, value):
@@ -167,8 +136,9 @@ class PrologixAdapter(VISAAdapter):
         instruments received over GPIB port.
         """
         values = {0: "\r\n", 1: "\r", 2: "\n", 3: ""}
-        self.write("++eos")
-        return values[int(self.read(prologix=True))]
+        with self._lock:
+            self.write("++eos")
+            return values[int(self.read(prologix=True))]
 
     @eos.setter
     def eos(self, value):
@@ -181,8 +151,9 @@ class PrologixAdapter(VISAAdapter):
 
         possible values: 1 - 3000
         """
-        self.write("++read_tmo_ms")
-        return int(self.read(prologix=True))
+        with self._lock:
+            self.write("++read_tmo_ms")
+            return int(self.read(prologix=True))
 
     @gpib_read_timeout.setter
     def gpib_read_timeout(self, value):
@@ -192,8 +163,9 @@ class PrologixAdapter(VISAAdapter):
     def version(self):
         """Get the version string of the Prologix controller.
         """
-        self.write('++ver')
-        return self.read(prologix=True)
+        with self._lock:
+            self.write('++ver')
+            return self.read(prologix=True)
 
     def reset(self):
         """Perform a power-on reset of the controller.
@@ -213,9 +185,33 @@ class PrologixAdapter(VISAAdapter):
         :param kwargs: Keyword arguments for the connection itself.
         """
         # Overrides write instead of _write in order to ensure proper logging
-        if self.address is not None and not command.startswith("++"):
+        with self._lock:
+            if command.startswith("++"):
+                self._track_controller_command(command)
+            else:
+                self._select_address(**kwargs)
+            super().write(command, **kwargs)
+
+    def _select_address(self, **kwargs):
+        """Send the GPIB address of this adapter, unless it is already selected."""
+        if self.address is not None and self._controller.address != self.address:
             super().write("++addr %d" % self.address, **kwargs)
-        super().write(command, **kwargs)
+            self._controller.address = self.address
+
+    def _track_controller_command(self, command):
+        """Keep the cached controller state consistent with a command sent to the controller."""
+        name, _, value = command.strip().partition(" ")
+        value = value.strip()
+        if name == "++addr":
+            # A query ("++addr") does not change the address, a setting does.
+            if value:
+                self._controller.address = int(value.split()[0])
+        elif name == "++auto":
+            if value:
+                self._controller.auto = bool(int(value))
+        elif name == "++rst":
+            self._controller.address = None
+            self._controller.auto = None
 
     def _format_binary_values(self, values, datatype='f', is_big_endian=False, header_fmt="ieee"):
         """Format values in binary format, used internally in :meth:`.write_binary_values`.
@@ -233,15 +229,7 @@ class PrologixAdapter(VISAAdapter):
         # following characters occur in the binary data -- CR (ASCII 13), LF (ASCII 10), ESC
         # (ASCII 27), '+' (ASCII 43) - they must be escaped by preceding them with an ESC
         # character.
-        special_chars = b'\x0d\x0a\x1b\x2b'
-        new_block = b''
-        for b in block:
-            escape = b''
-            if b in special_chars:
-                escape = b'\x1b'
-            new_block += (escape + bytes((b,)))
-
-        return new_block
+        return _escape(block)
 
     def write_binary_values(self, command, values, **kwargs):
         """ Write binary data to the instrument, e.g. waveform for signal generators.
@@ -254,10 +242,9 @@ class PrologixAdapter(VISAAdapter):
         :param kwargs: Key-word arguments to pass onto :meth:`._format_binary_values`
         :returns: number of bytes written
         """
-        if self.address is not None:
-            address_command = "++addr %d\n" % self.address
-            self.write(address_command)
-        super().write_binary_values(command, values, "\n", **kwargs)
+        with self._lock:
+            self._select_address()
+            super().write_binary_values(command, values, "\n", **kwargs)
 
     def _read(self, prologix=False, **kwargs):
         """Read up to (excluding) `read_termination` or the whole read buffer.
@@ -266,40 +253,104 @@ class PrologixAdapter(VISAAdapter):
         :param kwargs: Keyword arguments for the connection itself.
         :returns str: ASCII response of the instrument (excluding read_termination).
         """
-        if not prologix:
-            self.write("++read eoi")
+        if not prologix and not self._controller.auto:
+            self._request_data()
         return super()._read()
 
-    def _read_bytes(self, count, break_on_termchar=False, **kwargs):
+    def _read_bytes(self, count, break_on_termchar=False, requested=False, **kwargs):
         """Read bytes from the instrument.
 
         :param int count: Number of bytes to read. A value of -1 indicates to
             read from the whole read buffer.
         :param bool break_on_termchar: Stop reading at a termination character.
+        :param bool requested: The data has already been requested from the Prologix adapter
+            or is a response of the Prologix adapter itself.
         :param \\**kwargs: Keyword arguments for the connection itself.
         :returns bytes: Bytes response of the instrument (including termination).
         """
-        avail = self.connection.get_visa_attribute(VI_ATTR_ASRL_AVAIL_NUM)
-        if avail == 0:
+        if not requested and not self._controller.auto and not self._data_available():
             # nothing buffered, need to request data from Prologix
-            self.write("++read eoi")
+            self._request_data()
         return super()._read_bytes(count, break_on_termchar, **kwargs)
 
+    def _read_bytes_into(self, view, requested=False, **kwargs):
+        """Read bytes into the memoryview `view` until it is full and return their number.
+
+        :param view: Memoryview of unsigned bytes to fill.
+        :param bool requested: The data has already been requested from the Prologix adapter.
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        """
+        if not requested and not self._controller.auto and not self._data_available():
+            self._request_data()
+        return super()._read_bytes_into(view, **kwargs)
+
+    def _read_block_into(self, view, header_bytes, termination_bytes, **kwargs):
+        """Request the data once and read a binary block into the memoryview `view`."""
+        if not self._controller.auto:
+            self._request_data()
+        return super()._read_block_into(view, header_bytes, termination_bytes, requested=True,
+                                        **kwargs)
+
+    def _data_available(self):
+        """Return whether received data is waiting to be read. Implement in subclass."""
+        raise NotImplementedError("Implement in subclass!")
+
+    def _request_data(self):
+        """Request data from the instrument at :attr:`address`."""
+        self._select_address()
+        self.write("++read eoi")
+
     def gpib(self, address, **kwargs):
-        """ Return a PrologixAdapter object that references the GPIB
-        address specified, while sharing the Serial connection with other
+        """ Return an adapter of the same type that references the GPIB
+        address specified, while sharing the connection with other
         calls of this function
 
         :param address: Integer GPIB address of the desired instrument
         :param kwargs: Arguments for the initialization
-        :returns: PrologixAdapter for specific GPIB address
+        :returns: Adapter for specific GPIB address
         """
-        return PrologixAdapter(self, address, **kwargs)
+        return type(self)(self, address, **kwargs)
+
+    def run_grouped(self, transactions):
+        """Execute transactions grouped by GPIB address and return their results.
+
+        Transactions for the same address keep their order, but transactions for different
+        addresses are reordered to minimize the number of address switches on the bus.
+        The group of the currently selected address runs first.
+        The connection is locked for the whole execution.
+
+        .. code::
+
+            adapter = PrologixAdapter("ASRL5::INSTR", 7)
+            sourcemeter = Keithley2400(adapter)
+            multimeter = Keithley2000(adapter.gpib(9))
+            voltage, current, resistance = adapter.run_grouped([
+                (sourcemeter, lambda: sourcemeter.voltage),
+                (multimeter, lambda: multimeter.resistance),
+                (sourcemeter, lambda: sourcemeter.current),
+            ])
+
+        :param transactions: Iterable of (target, callable) tuples. The target is a
+            PrologixAdapter sharing this controller or an instrument using one as its adapter.
+        :returns: List of the results of the callables in the original order.
+        """
+        groups = {}
+        for index, (target, function) in enumerate(transactions):
+            address = getattr(target, "adapter", target).address
+            groups.setdefault(address, []).append((index, function))
+        results = [None] * sum(len(group) for group in groups.values())
+        with self._lock:
+            addresses = sorted(groups, key=lambda a: a != self._controller.address)
+            for address in addresses:
+                for index, function in groups[address]:
+                    results[index] = function()
+        return results
 
     def _check_for_srq(self):
-        # it was int(self.ask("++srq"))
-        self.write("++srq")
-        return int(self.read())
+        # The controller answers itself, do not address the instrument to talk.
+        with self._lock:
+            self.write("++srq")
+            return int(self.read(prologix=True))
 
     def wait_for_srq(self, timeout=25, delay=0.1):
         """ Blocks until a SRQ, and leaves the bit high
@@ -314,9 +365,189 @@ class PrologixAdapter(VISAAdapter):
                 raise TimeoutError("Waiting for SRQ timed out.")
             time.sleep(delay)
 
+
+class PrologixAdapter(_PrologixMixin, VISAAdapter):
+    """ Encapsulates the additional commands necessary
+    to communicate over a Prologix GPIB-USB Adapter,
+    using the :class:`VISAAdapter`.
+
+    Each PrologixAdapter is constructed based on a connection to the Prologix device
+    itself and the GPIB address of the instrument to be communicated to.
+    Connection sharing is achieved by using the :meth:`.gpib`
+    method to spawn new PrologixAdapters for different GPIB addresses.
+
+    :param resource_name: A
+        `VISA resource string <https://pyvisa.readthedocs.io/en/latest/introduction/names.html>`__
+        that identifies the connection to the Prologix device itself, for example
+        "ASRL5" for the 5th COM port.
+    :param address: Integer GPIB address of the desired instrument.
+    :param auto: Enable or disable read-after-write and address instrument to listen.
+    :param eoi: Enable or disable EOI assertion.
+    :param eos: Set command termination string (CR+LF, CR, LF, or "")
+    :param gpib_read_timeout: Set read timeout for GPIB communication in milliseconds from 1..3000
+    :param kwargs: Key-word arguments if constructing a new serial object
+
+    :ivar address: Integer GPIB address of the desired instrument.
+
+    Usage example:
+
+    .. code::
+
+        adapter = PrologixAdapter("ASRL5::INSTR", 7)
+        sourcemeter = Keithley2400(adapter)  # at GPIB address 7
+        # generate another instance with a different GPIB address:
+        adapter2 = adapter.gpib(9)
+        multimeter = Keithley2000(adapter2)  # at GPIB address 9
+
+
+    To allow user access to the Prologix adapter in Linux, create the file:
+    :code:`/etc/udev/rules.d/51-prologix.rules`, with contents:
+
+    .. code-block:: bash
+
+        SUBSYSTEMS=="usb",ATTRS{idVendor}=="0403",ATTRS{idProduct}=="6001",MODE="0666"
+
+    Then reload the udev rules with:
+
+    .. code-block:: bash
+
+        sudo udevadm control --reload-rules
+        sudo udevadm trigger
+
+    The adapters sharing a controller (created with :meth:`gpib`, on the same connection or a
+    shared VISA session) remember the currently selected GPIB address, such that
+    the address is sent only when switching to another instrument. Use :meth:`run_grouped` to
+    execute several transactions grouped by address, which reduces the switching further.
+
+    Since the Prologix adapter uses the same communication channel (an USB
+    CDC) for both, communication with the adapter itself, as well as
+    communication over GPIB, certain things need to be kept in mind:
+
+    - Operations that need to read from GPIB use the standard :meth:`read`
+      method.
+
+    - Operations that just read responses from the Prologix itself need to
+      add the parameter :code:`prologix=True` to :meth:`read`; this avoids
+      requesting data from GPIB. This is also necessary when the adapter is
+      put into "listen-only" mode, where all GPIB traffic is automatically
+      being passed up.
+
+    - Binary data must be passed to the bus using :meth:`write_binary_values`.
+      This takes care of properly escaping those binary values that would
+      otherwise be interpreted by the Prologix adapter. Note that the default
+      for :meth:`write_binary_values` are to assume floating-point binary
+      data, and prepend IEEE headers. In order to pass just plain bytes to the
+      adapter, tune the :code:`datatype` and :code:`header_fmt` parameters:
+
+      .. code::
+
+         multimeter.write_binary_values('W', [addr], datatype='B', header_fmt='empty')
+
+    """
+
+    def __init__(self, resource_name, address=None,
+                 auto=False, eoi=True, eos="\n", gpib_read_timeout=None,
+                 **kwargs):
+        super().__init__(resource_name,
+                         asrl={
+                             'timeout': 500,
+                             'write_termination': "\n",
+                         },
+                         **kwargs)
+        self.address = address
+        self._setup_controller(resource_name, auto, eoi, eos, gpib_read_timeout)
+
+    def _data_available(self):
+        """Return whether received data is waiting in the serial buffer."""
+        return self.connection.get_visa_attribute(VI_ATTR_ASRL_AVAIL_NUM) > 0
+
     def __repr__(self):
         if self.address is not None:
             return (f"<PrologixAdapter(resource_name='{self.connection.resource_name}', "
                     f"address={self.address:d})>")
         else:
             return f"<PrologixAdapter(resource_name='{self.connection.resource_name}')>"
+
+
+class PrologixEthernetAdapter(_PrologixMixin, SocketAdapter):
+    """ Encapsulates the additional commands necessary to communicate over a Prologix
+    GPIB-ETHERNET controller, talking to its TCP port directly with the :class:`SocketAdapter`.
+
+    It offers the same commands as the :class:`PrologixAdapter`. Address selection commands
+    are sent in the same network packet as the following message or data request
+    (``++read eoi``), and the availability of received data is checked without blocking.
+
+    .. code::
+
+        adapter = PrologixEthernetAdapter("192.168.1.20", 7)
+        sourcemeter = Keithley2400(adapter)  # at GPIB address 7
+        multimeter = Keithley2000(adapter.gpib(9))  # at GPIB address 9
+
+    :param host: Host name or IP address of the controller.
+    :param address: Integer GPIB address of the desired instrument.
+    :param int port: TCP port of the controller.
+    :param auto: Enable or disable read-after-write and address instrument to listen.
+    :param eoi: Enable or disable EOI assertion.
+    :param eos: Set command termination string (CR+LF, CR, LF, or "")
+    :param gpib_read_timeout: Set read timeout for GPIB communication in milliseconds from 1..3000
+    :param kwargs: Key-word arguments for the :class:`SocketAdapter`.
+
+    :ivar address: Integer GPIB address of the desired instrument.
+    """
+
+    def __init__(self, host, address=None, port=1234,
+                 auto=False, eoi=True, eos="\n", gpib_read_timeout=None,
+                 **kwargs):
+        if isinstance(host, PrologixEthernetAdapter):
+            parent = host
+            Adapter.__init__(self, log=kwargs.get("log"))
+            # Share the connection, its lock and the received data.
+            self.connection = parent.connection
+            self._lock = parent._lock
+            self._chunk = parent._chunk
+            self._received = parent._received
+            self.write_termination = parent.write_termination
+            self.read_termination = parent.read_termination
+        else:
+            super().__init__(host, port, **kwargs)
+        self.address = address
+        self._setup_controller(host, auto, eoi, eos, gpib_read_timeout)
+
+    def _read(self, prologix=False, **kwargs):
+        """Read up to (excluding) `read_termination` or the whole read buffer.
+
+        :param prologix: Read the prologix adapter itself.
+        :param kwargs: Keyword arguments for the connection itself.
+        :returns str: ASCII response of the instrument (excluding read_termination).
+        """
+        if not prologix and not self._controller.auto:
+            self._request_data()
+        # The socket reads via _read_bytes, which must not request data a second time.
+        return SocketAdapter._read(self, requested=True, **kwargs)
+
+    def _select_address(self, **kwargs):
+        """Select the GPIB address of this adapter with the next message, unless it is already
+        selected."""
+        if self.address is not None and self._controller.address != self.address:
+            command = "++addr %d" % self.address
+            self.log.debug("WRITE:%s", command)
+            self._controller.pending += (command + self.write_termination).encode()
+            self._controller.address = self.address
+
+    def _write_bytes(self, content, **kwargs):
+        """Write the bytes `content` preceded by pending controller commands."""
+        pending, self._controller.pending = self._controller.pending, b""
+        super()._write_bytes(pending + content, **kwargs)
+
+    def _data_available(self):
+        """Return whether received data is waiting to be read, without blocking."""
+        return bool(self._received) or bool(select.select([self.connection], [], [], 0)[0])
+
+    def __repr__(self):
+        try:
+            host, port = self.connection.getpeername()[:2]
+        except (OSError, TypeError, ValueError):
+            host, port = "?", "?"
+        if self.address is not None:
+            return f"<PrologixEthernetAdapter(host='{host}:{port}', address={self.address:d})>"
+        return f"<PrologixEthernetAdapter(host='{host}:{port}')>"
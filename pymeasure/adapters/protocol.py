@@ -29,6 +29,7 @@ from unittest.mock import MagicMock
 from warnings import warn
 
 from .adapter import Adapter
+from .asynchronous import AsyncAdapter
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
@@ -187,3 +188,23 @@ class ProtocolAdapter(Adapter):
         encountering an END indicator (which causes loss of data).
         """
         self.connection.flush("pyvisa.constants.BufferOperation.discard_read_buffer")
+
+
+class AsyncProtocolAdapter(AsyncAdapter):
+    """ Asyncio adapter for testing the command exchange protocol without instrument hardware.
+
+    It wraps a :class:`ProtocolAdapter` and, as there is nothing to wait for, executes its
+    calls directly in the event loop instead of a worker thread.
+
+    :param list comm_pairs: List of "reference" message pair tuples, see :class:`ProtocolAdapter`.
+    :param \\**kwargs: Keyword arguments for the :class:`ProtocolAdapter`.
+    """
+
+    def __init__(self, comm_pairs=None, **kwargs):
+        if not isinstance(comm_pairs, ProtocolAdapter):
+            comm_pairs = ProtocolAdapter(comm_pairs, **kwargs)
+        super().__init__(comm_pairs)
+
+    async def run(self, function, *args, **kwargs):
+        """Run a callable directly and return its result."""
+        return function(*args, **kwargs)
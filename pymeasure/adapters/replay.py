@@ -0,0 +1,228 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import gzip
+import json
+import logging
+import time
+
+from .adapter import Adapter, _is_timeout
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+FORMAT = "pymeasure-recording"
+VERSION = 1
+
+
+def _open(file, mode):
+    """Open `file`, compressed with gzip if its name ends with '.gz'."""
+    if str(file).endswith(".gz"):
+        return gzip.open(file, mode + "t", encoding="utf-8")
+    return open(file, mode, encoding="utf-8")
+
+
+def save_recording(file, messages):
+    """Save recorded messages to a JSON file (compressed, if the name ends with '.gz').
+
+    :param file: Path of the file.
+    :param messages: List of messages ``[kind, data, duration]``, see :class:`RecordingAdapter`.
+    """
+    with _open(file, "w") as f:
+        json.dump({"format": FORMAT, "version": VERSION, "messages": messages}, f,
+                  separators=(",", ":"))
+
+
+def load_recording(file):
+    """Load and return the messages saved by :func:`save_recording`."""
+    with _open(file, "r") as f:
+        content = json.load(f)
+    if content.get("format") != FORMAT or content.get("version") != VERSION:
+        raise ValueError(f"'{file}' is not a recording of version {VERSION}.")
+    return content["messages"]
+
+
+class RecordingAdapter(Adapter):
+    """Adapter which records the traffic of another adapter with the latency of each message.
+
+    The messages are stored as ``[kind, data, duration]`` lists in :attr:`messages`, where
+    kind is "w" or "wb" (write a string or bytes), "r" or "rb" (read a string or bytes) or
+    "t" (timeout of a read), data the message as string (bytes are decoded as latin-1) and
+    duration the time the wrapped adapter took in s.
+    Replay them with :class:`ReplayAdapter`.
+
+    .. code::
+
+        adapter = RecordingAdapter(VISAAdapter("GPIB0::12::INSTR"), file="procedure.json.gz")
+        instrument = Keithley2400(adapter)
+        ...  # run the procedure
+        adapter.close()  # closes the connection and saves the recording
+
+    :param adapter: Adapter which communicates with the instrument.
+    :param file: Path of the file to save the recording to, when the adapter is closed.
+        If the name ends with '.gz', the file is compressed.
+    :param log: Parent logger of the 'Adapter' logger.
+    """
+
+    def __init__(self, adapter, file=None, log=None, **kwargs):
+        super().__init__(log=log, **kwargs)
+        self.adapter = adapter
+        self.file = file
+        self.messages = []
+        # Use the lock of the connection.
+        self._lock = adapter._lock
+
+    def _record(self, kind, data, function, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+        except Exception as exc:
+            if _is_timeout(exc):
+                self.messages.append(["t", "", time.perf_counter() - start])
+            raise
+        duration = time.perf_counter() - start
+        if data is None:
+            data = result
+        if isinstance(data, (bytes, bytearray)):
+            kind += "b"
+            data = bytes(data).decode("latin-1")
+        self.messages.append([kind, data, duration])
+        return result
+
+    def _write(self, command, **kwargs):
+        """Write a string command and record it."""
+        self._record("w", command, self.adapter.write, command, **kwargs)
+
+    def _write_bytes(self, content, **kwargs):
+        """Write the bytes `content` and record them."""
+        self._record("w", content, self.adapter.write_bytes, content, **kwargs)
+
+    def _read(self, **kwargs):
+        """Read a string and record it."""
+        return self._record("r", None, self.adapter.read, **kwargs)
+
+    def _read_bytes(self, count, break_on_termchar, **kwargs):
+        """Read bytes and record them."""
+        return self._record("r", None, self.adapter.read_bytes, count, break_on_termchar,
+                            **kwargs)
+
+    def flush_read_buffer(self):
+        """Flush and discard the input buffer of the wrapped adapter."""
+        self.adapter.flush_read_buffer()
+
+    def save(self, file=None):
+        """Save the recorded messages to `file` or the file given at initialization."""
+        save_recording(self.file if file is None else file, self.messages)
+
+    def close(self):
+        """Close the wrapped adapter and save the recording, if a file is given."""
+        self.adapter.close()
+        if self.file is not None and self.messages:
+            self.save()
+
+    def __repr__(self):
+        return f"<RecordingAdapter(adapter={self.adapter!r})>"
+
+
+class ReplayAdapter(Adapter):
+    """Adapter which plays back the messages recorded by a :class:`RecordingAdapter`.
+
+    Written messages are compared to the recorded ones and reads return the recorded responses.
+    Each message takes the recorded time multiplied with `time_scale`, such that procedures
+    can be benchmarked and profiled with realistic timing without hardware.
+
+    :param recording: Path of a recording file or a list of recorded messages.
+    :param float time_scale: Factor for the recorded latencies: 1 replays at real speed,
+        0.5 twice as fast, 0 without any delay.
+    :param log: Parent logger of the 'Adapter' logger.
+    """
+
+    def __init__(self, recording, time_scale=1, log=None, **kwargs):
+        super().__init__(log=log, **kwargs)
+        if not isinstance(recording, (list, tuple)):
+            recording = load_recording(recording)
+        self.messages = recording
+        self.time_scale = time_scale
+        self._index = 0
+
+    @property
+    def remaining(self):
+        """Number of messages not yet replayed."""
+        return len(self.messages) - self._index
+
+    def _next(self, kind, binary):
+        """Return the data of the next message of `kind` after its (scaled) latency.
+
+        :param str kind: "w" or "r".
+        :param bool binary: Return the data as bytes instead of a string.
+        """
+        try:
+            recorded_kind, data, duration = self.messages[self._index]
+        except IndexError:
+            raise ValueError("No recorded message left to replay.")
+        if recorded_kind == "t" and kind == "r":
+            self._index += 1
+            self._sleep(duration)
+            raise TimeoutError(f"Recorded timeout of message {self._index - 1}.")
+        if recorded_kind[0] != kind:
+            raise ValueError(f"Recorded message {self._index} is a '{recorded_kind}' "
+                             f"message, not a '{kind}' message: {data!r}.")
+        self._index += 1
+        self._sleep(duration)
+        if recorded_kind.endswith("b"):  # recorded as bytes
+            return data.encode("latin-1") if binary else data.encode("latin-1").decode()
+        return data.encode() if binary else data
+
+    def _sleep(self, duration):
+        if self.time_scale:
+            time.sleep(duration * self.time_scale)
+
+    def _write(self, command, **kwargs):
+        """Compare the command with the recorded one."""
+        self._compare(command, self._next("w", binary=False))
+
+    def _write_bytes(self, content, **kwargs):
+        """Compare the bytes `content` with the recorded ones."""
+        self._compare(bytes(content), self._next("w", binary=True))
+
+    def _compare(self, content, recorded):
+        if content != recorded:
+            raise ValueError(f"Written {content!r} does not match recorded {recorded!r} "
+                             f"(message {self._index - 1}).")
+
+    def _read(self, **kwargs):
+        """Return the recorded response."""
+        return self._next("r", binary=False)
+
+    def _read_bytes(self, count, break_on_termchar, **kwargs):
+        """Return the recorded response as bytes."""
+        return self._next("r", binary=True)
+
+    def flush_read_buffer(self):
+        """Nothing to flush."""
+        pass
+
+    def __repr__(self):
+        return f"<ReplayAdapter(messages={len(self.messages)}, time_scale={self.time_scale})>"
@@ -26,6 +26,7 @@ import logging
 
 import serial
 from .adapter import Adapter
+from .asynchronous import AsyncAdapter
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
@@ -49,6 +50,8 @@ class SerialAdapter(Adapter):
             self.connection = serial.Serial(port, **kwargs)
         self.write_termination = write_termination
         self.read_termination = read_termination
+        self._received = bytearray()  # bytes read from the port, but not yet returned
+        self._scanned = 0  # number of received bytes searched for the read termination
 
     def _write(self, command, **kwargs):
         """Write a string command to the instrument appending `write_termination`.
@@ -77,6 +80,33 @@ class SerialAdapter(Adapter):
         read = self._read_bytes(-1, break_on_termchar=True, **kwargs).decode()
         return read.removesuffix(self.read_termination) if self.read_termination else read
 
+    def _receive(self, size=1, **kwargs):
+        """Append the bytes waiting in the input buffer, but at least `size` bytes, to the
+        received bytes.
+
+        Blocks until `size` bytes arrived or the timeout elapsed.
+
+        :returns int: Number of bytes received, 0 in case of a timeout.
+        """
+        try:
+            size = max(self.connection.in_waiting, size)
+        except (AttributeError, OSError, serial.SerialException):
+            pass  # the port cannot tell, read the requested size only
+        chunk = self.connection.read(size, **kwargs)
+        self._received += chunk
+        return len(chunk)
+
+    def _take(self, count=None):
+        """Remove and return the first `count` (all if None) received bytes."""
+        if count is None or count >= len(self._received):
+            data = bytes(self._received)
+            self._received.clear()
+        else:
+            data = bytes(self._received[:count])
+            del self._received[:count]
+        self._scanned = 0
+        return data
+
     def _read_bytes(self, count, break_on_termchar, **kwargs):
         """Read a certain number of bytes from the instrument.
 
@@ -87,32 +117,124 @@ class SerialAdapter(Adapter):
         :returns bytes: Bytes response of the instrument (including termination).
         """
         if break_on_termchar and self.read_termination:
-            return self.connection.read_until(self.read_termination.encode(),
-                                              count if count > 0 else None,
-                                              **kwargs)
+            return self._read_bytes_until_termination(self.read_termination.encode(), count,
+                                                      **kwargs)
         elif count >= 0:
-            return self.connection.read(count, **kwargs)
+            while len(self._received) < count:
+                if not self._receive(count - len(self._received), **kwargs):
+                    break  # timeout
+            return self._take(count)
         else:
             # For -1 we empty the buffer completely
-            return self._read_bytes_until_timeout()
+            return self._read_bytes_until_timeout(**kwargs)
+
+    def _read_bytes_until_termination(self, termination, count=-1, **kwargs):
+        """Read up to and including `termination`, at most `count` bytes (if positive).
+
+        Bytes already searched for the termination are not scanned again after receiving more.
+        """
+        while True:
+            # The termination might have been split between two receptions.
+            index = self._received.find(termination,
+                                        max(self._scanned - len(termination) + 1, 0))
+            if index >= 0:
+                end = index + len(termination)
+                return self._take(min(end, count) if count > 0 else end)
+            if 0 < count <= len(self._received):
+                return self._take(count)
+            self._scanned = len(self._received)
+            if not self._receive(**kwargs):
+                return self._take()  # timeout
 
     def _read_bytes_until_timeout(self, chunk_size=256, **kwargs):
         """Read from the serial until a timeout occurs, regardless of the number of bytes.
 
-        :chunk_size: The number of bytes attempted to in a single transaction.
+        Each transaction reads all the bytes waiting in the input buffer, but at least
+        `chunk_size` bytes.
+
+        :chunk_size: The minimum number of bytes attempted to read in a single transaction.
             Multiple of these transactions will occur.
         """
         # `Serial.readlines()` has an unpredictable timeout, see PR #866
-        data = bytes()
-        while True:
-            chunk = self.connection.read(chunk_size, **kwargs)
-            data += chunk
-            if len(chunk) < chunk_size:  # If fewer bytes got returned, we had a timeout
-                return data
+        while self._receive(chunk_size, **kwargs) >= chunk_size:
+            pass  # fewer bytes got returned at a timeout
+        return self._take()
+
+    def _read_bytes_into(self, view, **kwargs):
+        """Read bytes into the memoryview `view` until it is full or a timeout occurs.
+
+        :param view: Memoryview of unsigned bytes to fill.
+        :returns int: Number of bytes read.
+        """
+        buffered = min(len(self._received), len(view))
+        view[:buffered] = self._take(buffered)
+        if buffered == len(view):
+            return buffered
+        return buffered + self.connection.readinto(view[buffered:])
+
+    def read_frame(self, length_offset, length_size=1, extra=0, byteorder="big", **kwargs):
+        """Read a binary frame, whose header contains the length of the following data.
+
+        The frame consists of `length_offset` bytes, the length field of `length_size`
+        bytes, the data of the indicated length, and `extra` bytes (e.g. a checksum).
+
+        .. code::
+
+            # address, function code, number of data bytes, data, CRC16
+            frame = adapter.read_frame(2, extra=2)
+
+        :param int length_offset: Number of bytes before the length field.
+        :param int length_size: Number of bytes of the length field.
+        :param int extra: Number of bytes after the data.
+        :param str byteorder: Byte order of the length field, "big" or "little".
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        :returns bytes: The whole frame including the header.
+        """
+        with self._lock:
+            if self._monitors:
+                frame = self._call_monitored("read", None, self._read_frame, length_offset,
+                                             length_size, extra, byteorder, **kwargs)
+            else:
+                frame = self._read_frame(length_offset, length_size, extra, byteorder, **kwargs)
+        self.log.debug("READ:%s", frame)
+        return frame
+
+    def _read_frame(self, length_offset, length_size, extra, byteorder, **kwargs):
+        header_size = length_offset + length_size
+        header = self._read_bytes(header_size, False, **kwargs)
+        if len(header) < header_size:
+            raise ConnectionError(f"Timeout while reading the frame header, got {header}.")
+        length = int.from_bytes(header[length_offset:], byteorder)
+        body = self._read_bytes(length + extra, False, **kwargs)
+        if len(body) < length + extra:
+            raise ConnectionError(
+                f"Timeout while reading the frame, got {len(body)} of {length + extra} bytes.")
+        return header + body
 
     def flush_read_buffer(self):
-        """Flush and discard the input buffer."""
+        """Flush and discard the input buffer and the bytes received already."""
+        self._take()
         self.connection.reset_input_buffer()
 
     def __repr__(self):
         return "<SerialAdapter(port='%s')>" % self.connection.port
+
+
+class AsyncSerialAdapter(AsyncAdapter):
+    """ Asyncio adapter for serial communication, the awaitable counterpart of
+    :class:`SerialAdapter`.
+
+    The PySerial calls are executed in the worker thread of this adapter, see
+    :class:`~pymeasure.adapters.AsyncAdapter`.
+
+    :param port: Serial port or :class:`SerialAdapter` instance to wrap.
+    :param write_termination: String appended to messages before writing them.
+    :param read_termination: String expected at end of read message and removed.
+    :param \\**kwargs: Any valid key-word argument for serial.Serial
+    """
+
+    def __init__(self, port, write_termination="", read_termination="", **kwargs):
+        if not isinstance(port, SerialAdapter):
+            port = SerialAdapter(port, write_termination=write_termination,
+                                 read_termination=read_termination, **kwargs)
+        super().__init__(port)
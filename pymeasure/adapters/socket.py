@@ -0,0 +1,278 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import logging
+import socket
+
+from .adapter import Adapter, _parse_ieee_block_header
+from .asynchronous import AsyncAdapter
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+# Time in s to wait for the read termination after a definite length block.
+_TERMINATION_WAIT = 0.05
+
+
+class SocketAdapter(Adapter):
+    """ Adapter class for raw TCP socket communication, e.g. SCPI-RAW on port 5025.
+
+    It talks to the socket directly, without the overhead of a VISA library. Small messages
+    are sent immediately (``TCP_NODELAY``), received data is collected in a reusable buffer,
+    and IEEE 488.2 definite length blocks are received in bulk.
+
+    :param host: Host name or IP address of the instrument, or a connected
+        :class:`socket.socket` to use.
+    :param int port: TCP port of the instrument.
+    :param write_termination: String appended to messages before writing them.
+    :param read_termination: String expected at end of read message and removed.
+    :param float timeout: Timeout of the connection in s.
+    :param int chunk_size: Size of the receive buffer in bytes.
+    :param log: Parent logger of the 'Adapter' logger.
+    """
+
+    def __init__(self, host, port=5025, write_termination="\n", read_termination="\n",
+                 timeout=10, chunk_size=65536, log=None, **kwargs):
+        super().__init__(log=log, **kwargs)
+        if isinstance(host, socket.socket):
+            self.connection = host
+        else:
+            self.connection = socket.create_connection((host, port), timeout=timeout)
+        if self.connection.family in (socket.AF_INET, socket.AF_INET6):
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.connection.settimeout(timeout)
+        self.write_termination = write_termination
+        self.read_termination = read_termination
+        self._chunk = bytearray(chunk_size)
+        self._received = bytearray()  # received, but not yet read bytes
+
+    @property
+    def timeout(self):
+        """Control the timeout of the connection in s."""
+        return self.connection.gettimeout()
+
+    @timeout.setter
+    def timeout(self, value):
+        self.connection.settimeout(value)
+
+    def _receive(self):
+        """Receive the available bytes (at least one) into the buffer of received bytes."""
+        count = self.connection.recv_into(self._chunk)
+        if count == 0:
+            raise ConnectionError("The connection has been closed by the instrument.")
+        self._received += memoryview(self._chunk)[:count]
+
+    def _take(self, count):
+        """Remove the first `count` received bytes and return them."""
+        data = bytes(self._received[:count])
+        del self._received[:count]
+        return data
+
+    def _receive_until(self, termination):
+        """Receive until `termination` and return the bytes including it."""
+        start = 0
+        while True:
+            index = self._received.find(termination, start)
+            if index >= 0:
+                return self._take(index + len(termination))
+            # Do not search the old bytes again, but a termination split between chunks.
+            start = max(len(self._received) - len(termination) + 1, 0)
+            self._receive()
+
+    def _write(self, command, **kwargs):
+        """Write a string command to the instrument appending `write_termination`.
+
+        :param str command: Command string to be sent to the instrument
+            (without termination).
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        """
+        self._write_bytes((command + self.write_termination).encode(), **kwargs)
+
+    def _write_bytes(self, content, **kwargs):
+        """Write the bytes `content` to the instrument.
+
+        :param bytes content: The bytes to write to the instrument.
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        """
+        self.connection.sendall(content, **kwargs)
+
+    def _read(self, **kwargs):
+        """Read up to (excluding) `read_termination` or the whole read buffer.
+
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        :returns str: ASCII response of the instrument (read_termination is removed first).
+        """
+        read = self._read_bytes(-1, break_on_termchar=True, **kwargs).decode()
+        return read.removesuffix(self.read_termination) if self.read_termination else read
+
+    def _read_bytes(self, count, break_on_termchar, **kwargs):
+        """Read a certain number of bytes from the instrument.
+
+        :param int count: Number of bytes to read. A value of -1 indicates to read an
+            IEEE 488.2 definite length block (with the read termination) or, for other data,
+            all the bytes which have been received.
+        :param bool break_on_termchar: Stop reading at a termination character.
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        :returns bytes: Bytes response of the instrument (including termination).
+        """
+        termination = self.read_termination.encode()
+        if break_on_termchar and termination:
+            if count < 0:
+                return self._receive_until(termination)
+            while True:
+                index = self._received.find(termination, 0, count)
+                if index >= 0:
+                    return self._take(index + len(termination))
+                if len(self._received) >= count:
+                    return self._take(count)
+                self._receive()
+        elif count >= 0:
+            while len(self._received) < count:
+                self._receive()
+            return self._take(count)
+        else:
+            return self._read_available_or_block()
+
+    def _read_available_or_block(self):
+        """Read an IEEE 488.2 definite length block in bulk or all the received bytes."""
+        if not self._received:
+            self._receive()
+        while self._missing_header_bytes():
+            self._receive()
+        header = _parse_ieee_block_header(self._received)
+        if header is None:
+            # No block: return what is there, and what arrives without waiting.
+            self._receive_nonblocking()
+            return self._take(len(self._received))
+        size = sum(header)
+        block = bytearray(size)
+        view = memoryview(block)
+        filled = min(size, len(self._received))
+        view[:filled] = self._received[:filled]
+        del self._received[:filled]
+        while filled < size:
+            received = self.connection.recv_into(view[filled:])
+            if received == 0:
+                raise ConnectionError("The connection has been closed by the instrument.")
+            filled += received
+        view.release()
+        if self.read_termination:
+            block += self._read_optional_termination(self.read_termination.encode())
+        return bytes(block)
+
+    def _read_optional_termination(self, termination):
+        """Read the termination following a definite length block and return it.
+
+        Some devices end the block with EOI only or with a shorter termination, therefore
+        the termination is waited for a short time only, and only the bytes of the termination
+        are read.
+        """
+        if len(self._received) < len(termination):
+            self._receive_nonblocking()
+        timeout = self.connection.gettimeout()
+        wait = _TERMINATION_WAIT if timeout is None else min(timeout, _TERMINATION_WAIT)
+        self.connection.settimeout(wait)
+        try:
+            while (len(self._received) < len(termination)
+                   and termination.startswith(self._received)):
+                self._receive()
+        except (TimeoutError, ConnectionError):
+            pass
+        finally:
+            self.connection.settimeout(timeout)
+        count = 0
+        while (count < min(len(termination), len(self._received))
+               and self._received[count] in termination):
+            count += 1
+        return self._take(count)
+
+    def _missing_header_bytes(self):
+        """Return the number of bytes missing of a started IEEE 488.2 block header."""
+        received = self._received
+        if received[:1] != b"#":
+            return 0
+        if len(received) < 2:
+            return 1
+        digits = received[1] - 0x30
+        if not 0 < digits <= 9:
+            return 0  # not a definite length block
+        return max(2 + digits - len(received), 0)
+
+    def _receive_nonblocking(self):
+        """Receive all the bytes, which have arrived already."""
+        timeout = self.connection.gettimeout()
+        self.connection.setblocking(False)
+        try:
+            while True:
+                self._receive()
+        except (BlockingIOError, ConnectionError):
+            pass
+        finally:
+            self.connection.settimeout(timeout)
+
+    def _read_bytes_into(self, view, **kwargs):
+        """Read bytes directly into the memoryview `view` until it is full.
+
+        :param view: Memoryview of unsigned bytes to fill.
+        :returns int: Number of bytes read.
+        """
+        count = min(len(view), len(self._received))
+        view[:count] = self._received[:count]
+        del self._received[:count]
+        while count < len(view):
+            received = self.connection.recv_into(view[count:])
+            if received == 0:
+                break
+            count += received
+        return count
+
+    def flush_read_buffer(self):
+        """Flush and discard the input buffer."""
+        self._receive_nonblocking()
+        self._received.clear()
+
+    def __repr__(self):
+        try:
+            return "<SocketAdapter(address='%s:%s')>" % self.connection.getpeername()[:2]
+        except (OSError, TypeError):
+            return "<SocketAdapter>"
+
+
+class AsyncSocketAdapter(AsyncAdapter):
+    """ Asyncio adapter for raw TCP socket communication, the awaitable counterpart of
+    :class:`SocketAdapter`.
+
+    The socket calls are executed in the worker thread of this adapter, see
+    :class:`~pymeasure.adapters.AsyncAdapter`.
+
+    :param host: Host name or IP address of the instrument, or a :class:`SocketAdapter`
+        instance to wrap.
+    :param \\**kwargs: Keyword arguments for the :class:`SocketAdapter`.
+    """
+
+    def __init__(self, host, **kwargs):
+        if not isinstance(host, SocketAdapter):
+            host = SocketAdapter(host, **kwargs)
+        super().__init__(host)
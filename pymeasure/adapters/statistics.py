@@ -0,0 +1,155 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import json
+import threading
+import weakref
+from bisect import bisect_right
+
+#: Upper edges (in s) of the latency histogram bins. A last bin collects longer durations.
+LATENCY_BINS = (1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1, 10)
+
+# All statistics objects alive, for exporting them together.
+_registry = weakref.WeakSet()
+
+
+class _Counter:
+    """Counters and latency histogram of one kind of event (e.g. writes) of one command."""
+
+    __slots__ = ("count", "total", "minimum", "maximum", "size", "timeouts", "histogram")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.
+        self.minimum = float("inf")
+        self.maximum = 0.
+        self.size = 0
+        self.timeouts = 0
+        self.histogram = [0] * (len(LATENCY_BINS) + 1)
+
+    def add(self, duration, size, timeout):
+        self.count += 1
+        self.total += duration
+        if duration < self.minimum:
+            self.minimum = duration
+        if duration > self.maximum:
+            self.maximum = duration
+        self.size += size
+        self.timeouts += timeout
+        self.histogram[bisect_right(LATENCY_BINS, duration)] += 1
+
+    def as_dict(self):
+        return {"count": self.count,
+                "total": self.total,
+                "mean": self.total / self.count,
+                "min": self.minimum,
+                "max": self.maximum,
+                "bytes": self.size,
+                "timeouts": self.timeouts,
+                "histogram": list(self.histogram),
+                }
+
+
+class AdapterStatistics:
+    """Latency and throughput statistics of the communication of one adapter.
+
+    It counts the events (``"write"``, ``"read"`` and ``"delay"`` for the query delay of an
+    instrument) per command, their duration, the number of bytes transferred and timeouts, and
+    sorts the durations into a histogram with the bins :data:`LATENCY_BINS`.
+    Reads and delays are attributed to the command written last.
+
+    Enable it with :meth:`Adapter.enable_stats() <pymeasure.adapters.Adapter.enable_stats>`.
+
+    :param str name: Name of the statistics, e.g. the name of the instrument.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+        self._counters = {}
+        _registry.add(self)
+
+    def record(self, kind, command, start, duration, size=0, timeout=False):
+        """Record an event, the interface of an adapter monitor.
+
+        :param str kind: Kind of the event, e.g. "write" or "read".
+        :param str command: Command to which the event belongs.
+        :param float start: Start time (:func:`time.perf_counter`) of the event in s.
+        :param float duration: Duration of the event in s.
+        :param int size: Number of bytes transferred.
+        :param bool timeout: Whether the event ended with a timeout.
+        """
+        with self._lock:
+            counter = self._counters.get((command, kind))
+            if counter is None:
+                counter = self._counters[(command, kind)] = _Counter()
+            counter.add(duration, size, timeout)
+
+    def as_dict(self):
+        """Return the statistics as a dictionary of commands, kinds of events and values."""
+        result = {}
+        with self._lock:
+            for (command, kind), counter in self._counters.items():
+                result.setdefault(command, {})[kind] = counter.as_dict()
+        return result
+
+    def reset(self):
+        """Reset all counters."""
+        with self._lock:
+            self._counters.clear()
+
+    def __repr__(self):
+        return f"<AdapterStatistics(name={self.name!r})>"
+
+
+def export_stats(file=None):
+    """Return the statistics of all adapters with enabled statistics, keyed by their names.
+
+    Several statistics with the same name are distinguished by a suffix, e.g. ``"name #2"``.
+
+    :param file: Path or file object to write the statistics to as JSON, or None.
+    :returns: Dictionary of names and statistics (see :meth:`AdapterStatistics.as_dict`).
+    """
+    result = {}
+    for statistics in sorted(_registry, key=lambda s: str(s.name)):
+        name = str(statistics.name)
+        index = 1
+        while name in result:
+            index += 1
+            name = f"{statistics.name} #{index}"
+        result[name] = statistics.as_dict()
+    if file is not None:
+        if hasattr(file, "write"):
+            json.dump(result, file, indent=2)
+        else:
+            with open(file, "w") as f:
+                json.dump(result, f, indent=2)
+    return result
+
+
+def reset_stats():
+    """Reset the statistics of all adapters."""
+    for statistics in list(_registry):
+        statistics.reset()
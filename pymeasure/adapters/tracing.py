@@ -0,0 +1,163 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import json
+import os
+import threading
+import time
+from collections import deque
+
+
+class _TraceMonitor:
+    """Adapter monitor, which puts the events of one instrument into the tracer's buffer."""
+
+    def __init__(self, buffer, thread_names, name):
+        self._buffer = buffer
+        self._thread_names = thread_names
+        self.name = name
+
+    def record(self, kind, command, start, duration, size=0, timeout=False):
+        thread = threading.get_ident()
+        if thread not in self._thread_names:
+            self._thread_names[thread] = threading.current_thread().name
+        self._buffer.append((self.name, kind, command, start, duration, size, timeout, thread))
+
+
+class Tracer:
+    """Write the communication of instruments as a timeline to a JSON file in the
+    `Chrome trace event format
+    <https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU>`__,
+    which can be viewed with `Perfetto <https://ui.perfetto.dev>`__ or ``chrome://tracing``.
+
+    Every write, read and query delay becomes a span with the instrument name, thread,
+    command, duration and number of bytes. Threads waiting for a shared bus show up as
+    consecutive spans in different threads.
+
+    The adapters only append the events to a ring buffer, a background thread writes them to
+    the file. If the writer cannot keep up, the oldest events are dropped.
+
+    .. code::
+
+        with Tracer("trace.json") as tracer:
+            tracer.attach(instrument)
+            ...  # run the procedure
+
+    :param file: Path of the file to write.
+    :param int capacity: Maximum number of events kept in the buffer.
+    :param float interval: Time in s between writing the buffered events.
+    """
+
+    def __init__(self, file, capacity=65536, interval=0.5):
+        self._buffer = deque(maxlen=capacity)
+        self._interval = interval
+        self._monitors = []
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._thread_names = {}  # names of the threads seen by the monitors
+        self._threads = set()  # threads already named in the file
+        self._file = open(file, "w")
+        self._file.write("[")
+        self._first = True
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._writer = threading.Thread(target=self._run, name="Tracer", daemon=True)
+        self._writer.start()
+
+    def attach(self, instrument, name=None):
+        """Trace the communication of an instrument or adapter.
+
+        :param instrument: Instrument or adapter to trace.
+        :param str name: Name in the trace. Defaults to the instrument name.
+        """
+        adapter = getattr(instrument, "adapter", instrument)
+        if name is None:
+            name = getattr(instrument, "name", repr(adapter))
+        monitor = _TraceMonitor(self._buffer, self._thread_names, name)
+        adapter.add_monitor(monitor)
+        self._monitors.append((adapter, monitor))
+
+    def detach(self, instrument):
+        """Stop tracing an instrument or adapter."""
+        adapter = getattr(instrument, "adapter", instrument)
+        for entry in [e for e in self._monitors if e[0] is adapter]:
+            adapter.remove_monitor(entry[1])
+            self._monitors.remove(entry)
+
+    def _run(self):
+        while not self._stop.wait(self._interval):
+            self.flush()
+
+    def flush(self):
+        """Write the buffered events to the file."""
+        with self._write_lock:
+            events = []
+            while True:
+                try:
+                    events.append(self._buffer.popleft())
+                except IndexError:
+                    break
+            if events and not self._file.closed:
+                self._write(events)
+
+    def _write(self, events):
+        lines = []
+        for name, kind, command, start, duration, size, timeout, thread in events:
+            if thread not in self._threads:
+                self._threads.add(thread)
+                lines.append({"name": "thread_name", "ph": "M", "pid": self._pid, "tid": thread,
+                              "args": {"name": self._thread_names.get(thread, str(thread))}})
+            lines.append({"name": f"{kind} {command}" if command is not None else kind,
+                          "cat": name,
+                          "ph": "X",
+                          "ts": (start - self._origin) * 1e6,
+                          "dur": duration * 1e6,
+                          "pid": self._pid,
+                          "tid": thread,
+                          "args": {"instrument": name, "command": command, "bytes": size,
+                                   "timeout": timeout},
+                          })
+        text = ",\n".join(json.dumps(line) for line in lines)
+        self._file.write(("\n" if self._first else ",\n") + text)
+        self._file.flush()
+        self._first = False
+
+    def close(self):
+        """Stop tracing all instruments, write the remaining events and close the file."""
+        for adapter, monitor in self._monitors:
+            adapter.remove_monitor(monitor)
+        self._monitors.clear()
+        self._stop.set()
+        self._writer.join()
+        self.flush()
+        with self._write_lock:
+            if not self._file.closed:
+                self._file.write("\n]\n")
+                self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,215 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import json
+import os
+import threading
+
+#: Identifier of the file format of the delay profiles.
+FORMAT = "pymeasure-delay-profile"
+#: Version of the file format of the delay profiles.
+VERSION = 1
+
+
+def load_profiles(file):
+    """Load and return the delay profiles saved by :meth:`QueryDelayTuner.save`.
+
+    :returns: Dictionary of instrument keys with a dictionary of commands and their entries,
+        empty if the file does not exist.
+    """
+    try:
+        with open(file) as f:
+            content = json.load(f)
+    except FileNotFoundError:
+        return {}
+    if content.get("format") != FORMAT or content.get("version") != VERSION:
+        raise ValueError(f"'{file}' is not a delay profile of version {VERSION}.")
+    return content["instruments"]
+
+
+class _Entry:
+    """Learned query delay of one command."""
+
+    __slots__ = ("delay", "failed", "latency", "streak", "used")
+
+    def __init__(self, delay, failed=None, latency=None):
+        self.delay = delay  # delay in use
+        self.failed = failed  # largest delay, which failed, None if none did
+        self.latency = latency  # moving average of the reply duration
+        self.streak = 0  # number of successful queries since the last change
+        self.used = delay  # delay of the last query
+
+    def as_dict(self):
+        return {"delay": self.delay, "failed": self.failed, "latency": self.latency}
+
+
+class QueryDelayTuner:
+    """Learn the shortest safe query delay of each command of an instrument.
+
+    The tuner starts with the query delay requested by the instrument driver. After
+    `confirmations` successful queries with the same delay, it shortens the delay by `factor`,
+    down to no delay at all, once it would be shorter than `minimum`.
+    A query failed, if the reply timed out, was empty or was rejected as garbled (see
+    :meth:`~pymeasure.instruments.Instrument.reject_reply`). Then the delay is increased again
+    and never shortened below `margin` times the failed delay.
+
+    The tuner is a monitor of the adapter (see :meth:`~pymeasure.adapters.Adapter.add_monitor`)
+    and usually created with :meth:`~pymeasure.instruments.Instrument.enable_delay_tuning`.
+
+    :param file: Path of a JSON file to load the profile from and to save it to.
+    :param str key: Key of the profile in the file, e.g. instrument model and firmware.
+    :param int confirmations: Number of successful queries before shortening a delay.
+    :param float factor: Factor to shorten a delay with.
+    :param float margin: Factor applied to a failed delay to get the smallest allowed one.
+    :param float minimum: Shortest delay in s, shorter ones are replaced by no delay.
+    :param float save_interval: Time in s after a change, after which the profile is saved to
+        `file` in a background thread. None saves only with :meth:`flush`.
+
+    Changes are not saved while communicating, call :meth:`flush` to save them at once.
+    """
+
+    def __init__(self, file=None, key="default", confirmations=5, factor=0.5, margin=2.,
+                 minimum=1e-3, save_interval=10):
+        self.file = file
+        self.key = key
+        self.confirmations = confirmations
+        self.factor = factor
+        self.margin = margin
+        self.minimum = minimum
+        self.save_interval = save_interval
+        self._entries = {}
+        self._lock = threading.RLock()
+        self._save_lock = threading.Lock()
+        self._dirty = False  # whether there are unsaved changes
+        self._timer = None  # saves the changes later
+        self._command = None  # written last
+        self._pending = None  # (entry, delay) of the query waiting for its reply
+        if file is not None:
+            for command, values in load_profiles(file).get(key, {}).items():
+                self._entries[command] = _Entry(**values)
+
+    def delay(self, default):
+        """Return the query delay for the command written last.
+
+        :param float default: Query delay requested by the driver in s. Without a delay, there
+            is nothing to learn.
+        """
+        if not default or self._command is None:
+            return default
+        with self._lock:
+            entry = self._entries.get(self._command)
+            if entry is None:
+                entry = self._entries[self._command] = _Entry(default)
+            entry.used = entry.delay
+            self._pending = entry, entry.delay
+            return entry.delay
+
+    def record(self, kind, command, start, duration, size=0, timeout=False):
+        """Observe an event of the communication, see :meth:`Adapter.record()
+        <pymeasure.adapters.Adapter.record>`."""
+        if kind == "write":
+            self._command = command
+            self._pending = None
+        elif kind == "read" and self._pending is not None:
+            entry, delay = self._pending
+            self._pending = None
+            if timeout or size == 0:
+                self._fail(entry, delay)
+            else:
+                self._succeed(entry, duration)
+        elif kind == "garbled":
+            entry = self._entries.get(command)
+            if entry is not None:
+                self._fail(entry, entry.used)
+
+    def _succeed(self, entry, duration):
+        with self._lock:
+            entry.latency = duration if entry.latency is None else (
+                0.9 * entry.latency + 0.1 * duration)
+            entry.streak += 1
+            if entry.streak < self.confirmations or entry.delay == 0:
+                return
+            entry.streak = 0
+            delay = entry.delay * self.factor
+            if entry.failed is not None:
+                delay = max(delay, entry.failed * self.margin, self.minimum)
+            elif delay < self.minimum:
+                delay = 0
+            if delay < entry.delay:
+                entry.delay = delay
+                self._changed()
+
+    def _fail(self, entry, delay):
+        with self._lock:
+            entry.streak = 0
+            entry.failed = delay if entry.failed is None else max(entry.failed, delay)
+            entry.delay = max(entry.delay, entry.failed * self.margin, self.minimum)
+            self._changed()
+
+    def _changed(self):
+        """Mark the profile as changed and schedule saving it, outside the adapter lock."""
+        self._dirty = True
+        if self.file is None or self.save_interval is None or self._timer is not None:
+            return
+        self._timer = threading.Timer(self.save_interval, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def flush(self):
+        """Save the profile to :attr:`file`, if it changed since it was saved last."""
+        with self._lock:
+            timer, self._timer = self._timer, None
+            dirty, self._dirty = self._dirty, False
+        if timer is not None:
+            timer.cancel()
+        if dirty and self.file is not None:
+            self.save()
+
+    def profile(self):
+        """Return the learned delays as a dictionary of commands with a dictionary of the delay
+        in use, the largest failed delay and the mean reply duration (all in s)."""
+        with self._lock:
+            return {command: entry.as_dict() for command, entry in self._entries.items()}
+
+    def save(self, file=None):
+        """Save the profile under :attr:`key` to a JSON file, keeping the other profiles.
+
+        :param file: Path of the file, defaults to :attr:`file`.
+        """
+        file = self.file if file is None else file
+        profile = self.profile()
+        with self._save_lock:
+            profiles = load_profiles(file)
+            profiles[self.key] = profile
+            temporary = f"{file}.tmp"
+            with open(temporary, "w") as f:
+                json.dump({"format": FORMAT, "version": VERSION, "instruments": profiles}, f,
+                          indent=1)
+            os.replace(temporary, file)
+
+    def reset(self):
+        """Forget the learned delays."""
+        with self._lock:
+            self._entries.clear()
+            self._pending = None
@@ -23,16 +23,90 @@
 #
 
 import logging
+import threading
 
 import pyvisa
 
-from .adapter import Adapter
+from .adapter import Adapter, _parse_ieee_block_header
+from .asynchronous import AsyncAdapter
 from .protocol import ProtocolAdapter
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 
+class ResourceRegistry:
+    """Process-wide registry of open VISA sessions, which are shared by reference counting.
+
+    :class:`VISAAdapter` instances created with ``shared=True`` acquire their session here.
+    A session is opened by its first user and closed only when its last user releases it.
+    Sessions are identified by the resource name (as given) and the VISA library.
+    Use the module level instance :data:`pymeasure.adapters.visa.registry`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Dictionary of (resource_name, visa_library) keys and [session, count] values.
+        self._entries = {}
+        # Dictionary of the keys of sessions being opened and events set afterwards.
+        self._opening = {}
+
+    def acquire(self, key, open_session):
+        """Return the session for `key`, opening it with `open_session` if necessary.
+
+        The session is opened outside the registry lock, such that a slow resource does not
+        block the sessions of other resources. Concurrent users of the same key wait for it.
+
+        :param key: Tuple of the resource name and the VISA library.
+        :param open_session: Callable returning a new session, if none is open yet.
+        """
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry[1] += 1
+                    return entry[0]
+                opened = self._opening.get(key)
+                if opened is None:
+                    opened = self._opening[key] = threading.Event()
+                    break
+            # Another user opens the session, try again afterwards (opening might fail).
+            opened.wait()
+        try:
+            session = open_session()
+        except BaseException:
+            with self._lock:
+                del self._opening[key]
+            opened.set()
+            raise
+        with self._lock:
+            del self._opening[key]
+            self._entries[key] = [session, 1]
+        opened.set()
+        return session
+
+    def release(self, key):
+        """Release a session and return the number of its remaining users."""
+        with self._lock:
+            entry = self._entries[key]
+            entry[1] -= 1
+            if entry[1] <= 0:
+                del self._entries[key]
+                return 0
+            return entry[1]
+
+    def count(self, resource_name, visa_library=""):
+        """Return the number of users of a session."""
+        entry = self._entries.get((resource_name, visa_library))
+        return 0 if entry is None else entry[1]
+
+    def __len__(self):
+        return len(self._entries)
+
+
+registry = ResourceRegistry()
+
+
 # noinspection PyPep8Naming,PyUnresolvedReferences
 class VISAAdapter(Adapter):
     """ Adapter class for the VISA library, using PyVISA to communicate with instruments.
@@ -45,6 +119,12 @@ class VISAAdapter(Adapter):
     :param visa_library: PyVISA VisaLibrary Instance, path of the VISA library or VisaLibrary spec
         string (``@py`` or ``@ivi``). If not given, the default for the platform will be used.
     :param log: Parent logger of the 'Adapter' logger.
+    :param bool shared: If True, reuse an open session to the same resource (and VISA library)
+        of another shared adapter, see :class:`ResourceRegistry`. Closing a shared adapter
+        closes the session only if no other shared adapter uses it anymore.
+        The connection settings of the adapter, which opened the session, are kept.
+        Use it to avoid reopening sessions, e.g. when instantiating instruments in every
+        :meth:`Procedure.startup() <pymeasure.experiment.Procedure.startup>`.
     :param \\**kwargs: Keyword arguments for configuring the PyVISA connection.
 
     :Kwargs:
@@ -70,7 +150,9 @@ class VISAAdapter(Adapter):
         *implementing an instrument*.
     """
 
-    def __init__(self, resource_name, visa_library="", log=None, **kwargs):
+    _shared_key = None
+
+    def __init__(self, resource_name, visa_library="", log=None, shared=False, **kwargs):
         super().__init__(log=log)
         if isinstance(resource_name, ProtocolAdapter):
             self.connection = resource_name
@@ -81,16 +163,27 @@ class VISAAdapter(Adapter):
             # Allow to reuse the connection.
             self.resource_name = getattr(resource_name, "resource_name", None)
             self.connection = resource_name.connection
-            self.manager = resource_name.manager
+            self.manager = getattr(resource_name, "manager", None)
+            self._lock = resource_name._lock
             return
         elif isinstance(resource_name, int):
             resource_name = "GPIB0::%d::INSTR" % resource_name
 
         self.resource_name = resource_name
-        self.manager = pyvisa.ResourceManager(visa_library)
+        if shared:
+            key = (resource_name, visa_library)
+            self.manager, self.connection, self._lock = registry.acquire(
+                key, lambda: self._open(visa_library, kwargs))
+            self._shared_key = key
+        else:
+            self.manager, self.connection, self._lock = self._open(visa_library, kwargs)
+
+    def _open(self, visa_library, kwargs):
+        """Open a session to :attr:`resource_name` and return the manager, connection and lock."""
+        manager = pyvisa.ResourceManager(visa_library)
 
         # Clean up kwargs considering the interface type matching resource_name
-        if_type = self.manager.resource_info(self.resource_name).interface_type
+        if_type = manager.resource_info(self.resource_name).interface_type
         for key in list(kwargs.keys()):  # iterate over a copy of the keys as we modify kwargs
             # Remove all interface-specific kwargs:
             if key in pyvisa.constants.InterfaceType.__members__:
@@ -102,10 +195,11 @@ class VISAAdapter(Adapter):
                         kwargs.setdefault(k, v)
                 del kwargs[key]
 
-        self.connection = self.manager.open_resource(
-            resource_name,
+        connection = manager.open_resource(
+            self.resource_name,
             **kwargs
         )
+        return manager, connection, self._lock
 
     def close(self):
         """Close the connection.
@@ -114,7 +208,15 @@ class VISAAdapter(Adapter):
 
             This closes the connection to the resource for all adapters using
             it currently (e.g. different adapters using the same GPIB line).
+            Shared adapters (see ``shared`` parameter) close it only, if they are the last user.
         """
+        if self._shared_key is not None:
+            key, self._shared_key = self._shared_key, None
+            if registry.release(key):
+                # Other adapters still use the session.
+                self.connection = None
+                self.manager = None
+                return
         super().close()
         try:
             if self.manager.visalib.library_path == "unset":
@@ -134,6 +236,12 @@ class VISAAdapter(Adapter):
         """
         self.connection.write(command, **kwargs)
 
+    def _write_size(self, command):
+        """Return the number of bytes sent by writing the string `command`, including the
+        write termination."""
+        connection = self.connection
+        return len((command + connection.write_termination).encode(connection.encoding))
+
     def _write_bytes(self, content, **kwargs):
         """Write the bytes `content` to the instrument.
 
@@ -167,14 +275,62 @@ class VISAAdapter(Adapter):
             # pyvisa's `read_raw` reads until newline, if no termination_character defined
             # and if not configured to stop at a termination lane etc.
             # see https://github.com/pyvisa/pyvisa/issues/728
-            result = bytearray()
-            while True:
-                try:
-                    result.extend(self.connection.read_bytes(1))
-                except pyvisa.errors.VisaIOError as exc:
-                    if exc.error_code == pyvisa.constants.StatusCode.error_timeout:
-                        return bytes(result)
-                    raise
+            return self._read_bytes_until_timeout(**kwargs)
+
+    def _read_bytes_until_timeout(self, **kwargs):
+        """Read from the connection until a timeout occurs, in as few calls as possible.
+
+        The bytes already received by the interface are read in one call, where the interface
+        reports them (e.g. serial connections). Otherwise single bytes are read.
+        If the response is an IEEE 488.2 definite length block, the rest of the block is read in
+        one call as soon as its header is known, and reading stops after the block and the
+        read termination, without waiting for a timeout.
+
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        :returns bytes: All the bytes read.
+        """
+        result = bytearray()
+        while True:
+            header = _parse_ieee_block_header(result)
+            if header is not None:
+                remaining = sum(header) - len(result)
+                if remaining > 0:
+                    result.extend(self.connection.read_bytes(remaining, **kwargs))
+                termination = getattr(self.connection, "read_termination", None)
+                if termination and remaining >= 0:
+                    # Some devices end the block with EOI only or a shorter termination.
+                    try:
+                        result.extend(self.connection.read_bytes(len(termination), **kwargs))
+                    except pyvisa.errors.VisaIOError as exc:
+                        if exc.error_code != pyvisa.constants.StatusCode.error_timeout:
+                            raise
+                return bytes(result)
+            try:
+                result.extend(self.connection.read_bytes(max(self._bytes_available(), 1),
+                                                         **kwargs))
+            except pyvisa.errors.VisaIOError as exc:
+                if exc.error_code == pyvisa.constants.StatusCode.error_timeout:
+                    return bytes(result)
+                raise
+
+    def _read_bytes_into(self, view, **kwargs):
+        """Read bytes into the memoryview `view` until it is full and return their number.
+
+        PyVISA returns a new bytes object, which is copied once into `view`.
+
+        :param view: Memoryview of unsigned bytes to fill.
+        :param \\**kwargs: Keyword arguments for the connection itself.
+        """
+        chunk = self.connection.read_bytes(len(view), **kwargs)
+        view[:len(chunk)] = chunk
+        return len(chunk)
+
+    def _bytes_available(self):
+        """Return the number of bytes received by the interface, if it reports them, else 0."""
+        try:
+            return self.connection.bytes_in_buffer
+        except (AttributeError, NotImplementedError, pyvisa.errors.VisaIOError):
+            return 0
 
     def wait_for_srq(self, timeout=25, delay=0.1):
         """ Block until a SRQ, and leave the bit high
@@ -210,3 +366,34 @@ class VISAAdapter(Adapter):
 
     def __repr__(self):
         return "<VISAAdapter(resource='%s')>" % self.connection.resource_name
+
+
+class AsyncVISAAdapter(AsyncAdapter):
+    """ Asyncio adapter for the VISA library, the awaitable counterpart of :class:`VISAAdapter`.
+
+    The PyVISA calls are executed in the worker thread of this adapter, see
+    :class:`~pymeasure.adapters.AsyncAdapter`.
+
+    :param resource_name: A
+        `VISA resource string <https://pyvisa.readthedocs.io/en/latest/introduction/names.html>`__,
+        GPIB address integer, or :class:`VISAAdapter` instance to wrap.
+    :param visa_library: PyVISA VisaLibrary Instance, path of the VISA library or VisaLibrary spec
+        string (``@py`` or ``@ivi``). If not given, the default for the platform will be used.
+    :param log: Parent logger of the 'Adapter' logger.
+    :param \\**kwargs: Keyword arguments for configuring the PyVISA connection,
+        see :class:`VISAAdapter`.
+    """
+
+    def __init__(self, resource_name, visa_library="", log=None, **kwargs):
+        if not isinstance(resource_name, VISAAdapter):
+            resource_name = VISAAdapter(resource_name, visa_library=visa_library, log=log,
+                                        **kwargs)
+        super().__init__(resource_name)
+
+    async def wait_for_srq(self, timeout=25, delay=0.1):
+        """ Wait until a SRQ, and leave the bit high
+
+        :param timeout: Timeout duration in seconds
+        :param delay: Time delay between checking SRQ in seconds
+        """
+        await self.run(self.adapter.wait_for_srq, timeout=timeout, delay=delay)
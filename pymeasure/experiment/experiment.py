@@ -37,11 +37,6 @@ from pymeasure.experiment import Results, Worker
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
-try:
-    from IPython import display
-except ImportError:
-    log.warning("IPython could not be imported")
-
 
 def get_array(start, stop, step):
     """Returns a numpy array from start to stop"""
@@ -156,6 +151,9 @@ class Experiment:
         """Live plotting loop for jupyter notebook, which automatically updates
         (an) in-line matplotlib graph(s). Will create a new plot as specified by input
         arguments, or will update (an) existing plot(s)."""
+        # IPython is imported only when plotting, as importing it takes long.
+        from IPython import display
+
         if self.wait_for_data():
             if not (self.plots):
                 self.plot(*args, **kwargs)
@@ -190,6 +188,8 @@ class Experiment:
     def update_plot(self):
         """Update the plots in the plots list with new data from the experiment.data
         pandas dataframe."""
+        from IPython import display
+
         try:
             self.data
             for plot in self.plots:
@@ -22,7 +22,13 @@
 # THE SOFTWARE.
 #
 
+from ..lazy import lazy_attributes
 from .channel import Channel
 from .instrument import Instrument
-from .resources import find_serial_port, list_resources
 from .generic_types import SCPIMixin, SCPIUnknownMixin
+from .waiting import all_of, wait_until
+
+# Listing resources requires PyVISA and PySerial, which are imported when needed.
+__getattr__, __dir__, _ = lazy_attributes(__name__, {
+    ".resources": ["find_serial_port", "list_resources"],
+})
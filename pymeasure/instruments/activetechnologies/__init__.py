@@ -22,5 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .AWG401x import AWG401x_AFG
-from .AWG401x import AWG401x_AWG
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".AWG401x": ["AWG401x_AFG", "AWG401x_AWG"],
+})
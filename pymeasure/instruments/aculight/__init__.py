@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .argos import Argos
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".argos": ["Argos"],
+})
@@ -26,10 +26,10 @@ from pymeasure.instruments import Instrument, SCPIMixin, Channel
 from pymeasure.instruments.validators import strict_range, strict_discrete_range, \
     strict_discrete_set
 
-from pyvisa.errors import VisaIOError
 import numpy as np
 
 import functools
+from warnings import warn
 
 
 DISPLAY_LAYOUT_OPTIONS = [
@@ -582,21 +582,31 @@ class AgilentE5062A(SCPIMixin, Instrument):
         """
         self.write('TRIGger:SINGle')
 
-    def wait_for_complete(self, attempt=1, max_attempts=20):
+    def wait_for_complete(self, attempt=None, max_attempts=None, should_stop=lambda: False,
+                          timeout=60):
         """Wait a potentially long time for the synchronization bit.  This is
         useful in conjunction with `agilentE5062A.trigger_single()` to wait for
         a single sweep to complete.
 
+        Unlike the `complete` SCPI property, the connection is not blocked
+        while waiting (see :meth:`.SCPIMixin.wait_for_operation_complete`).
+        The event status and service request enable registers are set
+        temporarily and restored afterwards.
+
+        :param attempt: Deprecated and ignored.
+        :param max_attempts: Deprecated, use `timeout` instead.
+        :param should_stop: A function that returns True to stop waiting early.
+        :param timeout: Time in seconds to wait at most.
+        :return: True if the sweep is complete, False if stopped early.
+        :raises TimeoutError: If the sweep does not complete in time.
+
+        .. deprecated:: 0.16.0
+            The `attempt` and `max_attempts` parameters, use `timeout` instead.
         """
-        try:
-            self.complete
-        except VisaIOError:
-            if attempt == max_attempts:
-                raise
-            else:
-                self.wait_for_complete(
-                    attempt=attempt+1,
-                    max_attempts=max_attempts)
+        if attempt is not None or max_attempts is not None:
+            warn("`attempt` and `max_attempts` are deprecated and ignored, use `timeout` "
+                 "instead.", FutureWarning)
+        return self.wait_for_operation_complete(should_stop, timeout)
 
     def pop_err(self):
 
@@ -22,5 +22,9 @@
 # THE SOFTWARE.
 #
 
-from .aimttiPL import PL068P, PL155P, PL303P, PL601P, PL303QMDP, PL303QMTP
-from .ld400p import LD400P
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".aimttiPL": ["PL068P", "PL155P", "PL303P", "PL601P", "PL303QMDP", "PL303QMTP"],
+    ".ld400p": ["LD400P"],
+})
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .ami430 import AMI430
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".ami430": ["AMI430"],
+})
@@ -22,8 +22,7 @@
 # THE SOFTWARE.
 #
 
-from pymeasure.instruments import Instrument, SCPIMixin
-from time import sleep, time
+from pymeasure.instruments import Instrument, SCPIMixin, wait_until
 
 import logging
 log = logging.getLogger(__name__)
@@ -194,15 +193,18 @@ class AMI430(SCPIMixin, Instrument):
 
     def wait_for_holding(self, should_stop=lambda: False,
                          timeout=800, interval=0.1):
+        """ Block the program, until the magnet is holding, at zero or paused.
+        The state is checked in increasing intervals, starting at `interval`
+        seconds, up to one second.
+
+        :param should_stop: A function that returns True if waiting should stop
+        :param timeout: A timeout in seconds after which a TimeoutError is raised
+        :param interval: Initial interval between two checks in seconds
+        :return: True if the magnet is holding, False if stopped early.
         """
-        """
-        t = time()
-        while self.state != 2 and self.state != 3 and self.state != 8:
-            sleep(interval)
-            if should_stop():
-                return
-            if (time() - t) > timeout:
-                raise Exception("Timed out waiting for AMI430 switch to warm up.")
+        return wait_until(lambda: self.state in (2, 3, 8), should_stop, timeout,
+                          interval=interval, max_interval=max(interval, 1),
+                          description="AMI430 switch to warm up")
 
     def shutdown(self, ramp_rate=0.0357):
         """ Turns on the persistent switch,
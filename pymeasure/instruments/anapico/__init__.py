@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .apsin12G import APSIN12G
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".apsin12G": ["APSIN12G"],
+})
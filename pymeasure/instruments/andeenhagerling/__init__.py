@@ -22,5 +22,9 @@
 # THE SOFTWARE.
 #
 
-from .ah2500a import AH2500A
-from .ah2700a import AH2700A
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".ah2500a": ["AH2500A"],
+    ".ah2700a": ["AH2700A"],
+})
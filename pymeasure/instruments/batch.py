@@ -0,0 +1,208 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from concurrent.futures import Future
+import logging
+import threading
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+
+class _Deferred(BaseException):
+    """Raised to abort a getter after its query has been queued.
+
+    It derives from BaseException in order not to be caught by `except Exception` clauses.
+    """
+
+
+class Batch:
+    """Queue of commands for an :class:`~pymeasure.instruments.Instrument`, which are sent
+    joined into as few messages as possible.
+
+    Do not instantiate it directly, use :meth:`Instrument.batch()
+    <pymeasure.instruments.Instrument.batch>` instead.
+
+    Written commands are queued. Reading a response sends all queued commands, such that a
+    property getter sends the preceding setters together with its own query.
+    Use :meth:`get` to defer a getter until the batch is sent, such that several queries share
+    a single message as well.
+
+    Commands are joined with `separator`. In order to follow the SCPI header path rules, a colon
+    is prepended to joined commands, unless they start with a colon or an asterisk.
+
+    :param instrument: Instrument whose messages are batched.
+    :param int max_length: Maximum length of a joined message. None means no limit.
+    :param str separator: Separator between the commands and between the query responses.
+    """
+
+    def __init__(self, instrument, max_length=None, separator=";"):
+        self.instrument = instrument
+        self.max_length = max_length
+        self.separator = separator
+        self.thread_id = threading.get_ident()
+        # List of [command, future, parse] entries, future and parse are None for non-queries.
+        self._queue = []
+        self._flushing = False
+        self._collecting = None
+        self._replay = None
+
+    def get(self, name, obj=None):
+        """Queue getting the property `name` and return a future for its value.
+
+        The future's result is available after the batch has been sent:
+
+        .. code::
+
+            with instrument.batch() as batch:
+                voltage = batch.get("voltage")
+                current = batch.get("current", obj=instrument.ch_A)
+            print(voltage.result(), current.result())
+
+        :param str name: Name of the property.
+        :param obj: Instrument or channel owning the property. Defaults to the instrument.
+        :returns: :class:`concurrent.futures.Future` for the value of the property.
+        """
+        obj = self.instrument if obj is None else obj
+        future = Future()
+
+        def parse(reply):
+            self._replay = reply
+            try:
+                return getattr(obj, name)
+            finally:
+                self._replay = None
+
+        self._collecting = (future, parse)
+        try:
+            value = getattr(obj, name)
+        except _Deferred:
+            pass
+        else:
+            # The getter did not read anything, e.g. it returned a cached value.
+            future.set_result(value)
+        finally:
+            self._collecting = None
+        return future
+
+    def write(self, command, **kwargs):
+        """Queue a command, used by :meth:`Instrument.write`."""
+        if self._replay is not None:
+            # The query has been sent already.
+            return
+        if self._flushing:
+            self.instrument.adapter.write(command, **kwargs)
+        else:
+            self._queue.append([command, None, None])
+
+    def read(self, **kwargs):
+        """Send the queued commands and return the response to the last one.
+
+        Used by :meth:`Instrument.read`.
+        """
+        if self._replay is not None:
+            reply, self._replay = self._replay, None
+            return reply
+        if self._flushing or not self._queue:
+            return self.instrument.adapter.read(**kwargs)
+        if self._collecting is not None:
+            self._queue[-1][1:] = self._collecting
+            raise _Deferred
+        future = Future()
+        self._queue[-1][1:] = future, None
+        self.flush(**kwargs)
+        return future.result()
+
+    def flush(self, **kwargs):
+        """Send all queued commands and distribute the responses.
+
+        :param \\**kwargs: Keyword arguments for reading from the adapter.
+        """
+        queue, self._queue = self._queue, []
+        self._flushing = True
+        try:
+            for chunk in self._chunks(queue):
+                self.instrument.adapter.write(self._join(entry[0] for entry in chunk))
+                queries = [entry for entry in chunk if entry[1] is not None]
+                if not queries:
+                    continue
+                self.instrument.wait_for()
+                replies = self.instrument.adapter.read(**kwargs).split(self.separator)
+                if len(replies) != len(queries):
+                    raise ValueError(f"Received {len(replies)} responses for {len(queries)} "
+                                     "batched queries.")
+                for (command, future, parse), reply in zip(queries, replies):
+                    try:
+                        future.set_result(reply if parse is None else parse(reply))
+                    except Exception as exc:
+                        future.set_exception(exc)
+        except Exception as exc:
+            for command, future, parse in queue:
+                if future is not None and not future.done():
+                    future.set_exception(exc)
+            raise
+        finally:
+            self._flushing = False
+
+    def cancel(self):
+        """Discard all queued commands and cancel the pending futures."""
+        queue, self._queue = self._queue, []
+        for command, future, parse in queue:
+            if future is not None:
+                future.cancel()
+        if queue:
+            # Cached values of settings might refer to discarded commands.
+            self.instrument.clear_cache(settable_only=True)
+
+    def _join(self, commands):
+        """Join commands to a single message following the SCPI header path rules."""
+        message = ""
+        for command in commands:
+            if message:
+                if not command.startswith((":", "*")):
+                    command = ":" + command
+                message += self.separator
+            message += command
+        return message
+
+    def _chunks(self, queue):
+        """Split the queue into chunks, whose joined messages do not exceed `max_length`."""
+        chunk = []
+        length = 0
+        for entry in queue:
+            command = entry[0]
+            added = len(command) + len(self.separator)
+            if not command.startswith((":", "*")):
+                added += 1
+            if (chunk and self.max_length is not None
+                    and length + added > self.max_length):
+                yield chunk
+                chunk = []
+            if chunk:
+                length += added
+            else:
+                length = len(command)
+            chunk.append(entry)
+        if chunk:
+            yield chunk
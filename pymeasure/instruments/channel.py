@@ -60,6 +60,10 @@ class Channel(CommonBase):
         """
         return command.format_map({self.placeholder: self.id})
 
+    def _cache_store(self):
+        """Return the dictionary of cached property values, shared with the instrument."""
+        return self.parent._cache_store()
+
     # Calls to the instrument
     def write(self, command, **kwargs):
         """Write a string command to the instrument appending `write_termination`.
@@ -88,6 +92,15 @@ class Channel(CommonBase):
         """
         return self.parent.read_bytes(count, **kwargs)
 
+    def read_bytes_into(self, buffer, **kwargs):
+        """Read bytes from the instrument into the writable `buffer` until it is full.
+
+        :param buffer: Writable, contiguous bytes-like object, e.g. a NumPy array.
+        :param kwargs: Keyword arguments for the adapter.
+        :returns int: Number of bytes read.
+        """
+        return self.parent.read_bytes_into(buffer, **kwargs)
+
     def write_binary_values(self, command, values, *args, **kwargs):
         """Write binary values to the instrument.
 
@@ -102,6 +115,14 @@ class Channel(CommonBase):
         """Read binary values from the instrument."""
         return self.parent.read_binary_values(**kwargs)
 
+    def transaction(self):
+        """Return a context manager, which grants exclusive access to the parent's connection."""
+        return self.parent.transaction()
+
+    async def run_async(self, function, *args, **kwargs):
+        """Run a blocking callable without blocking the event loop, see the parent."""
+        return await self.parent.run_async(function, *args, **kwargs)
+
     def check_errors(self):
         """Read all errors from the instrument and log them.
 
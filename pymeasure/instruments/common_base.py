@@ -22,13 +22,97 @@
 # THE SOFTWARE.
 #
 
+from collections.abc import MutableMapping
+from contextlib import nullcontext
+from functools import wraps
 from inspect import getmembers
 import logging
+import threading
+import time
 from warnings import warn
 
+import numpy as np
+
+from .validators import compile_validator
+
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
+# Casts of :meth:`CommonBase.values`, which may be parsed by NumPy in one go.
+_NUMERIC_DTYPES = {float: np.float64, int: np.int64}
+# Shorter replies are parsed faster element by element.
+_MIN_PARSE_LENGTH = 200
+
+
+def _parse_numbers(text, separator, cast):
+    """Parse all the `separator` separated numbers in `text` at once.
+
+    :returns: A NumPy array, or None if not all the elements are numbers of type `cast`.
+    """
+    dtype = _NUMERIC_DTYPES.get(cast)
+    if dtype is None or not separator or separator.isspace():
+        return None
+    try:
+        array = np.fromstring(text, dtype=dtype, sep=separator)
+    except ValueError:
+        return None  # an element is not a number
+    # Older NumPy versions stop at the first invalid element instead of raising.
+    if array.size != text.count(separator) + 1:
+        return None
+    # NumPy clips integers, which do not fit, instead of raising.
+    if dtype is np.int64 and array.size and (array.max() == np.iinfo(dtype).max
+                                             or array.min() == np.iinfo(dtype).min):
+        return None
+    return array
+
+
+def _equal(a, b):
+    """Return whether the values `a` and `b` are equal, comparing arrays element-wise."""
+    if a is b:
+        return True
+    try:
+        return bool(a == b)
+    except ValueError:  # the truth value of an array is ambiguous
+        return bool(np.array_equal(a, b))
+
+
+def _prepare_values(cache, validator, values):
+    """Return the validation function and the value map of a property for `values`.
+
+    They are computed once per validator and values and stored in `cache`, which remembers
+    the entry used last, too.
+    The value map of a list or tuple maps each element to its first index, the one of a dict
+    maps each dict value to its first key. It is None for other values or unhashable elements.
+
+    :returns: Tuple of validation function, value map, validator and values.
+    """
+    entry = cache.get(None)  # the entry used last
+    if entry is not None and entry[2] is validator and entry[3] is values:
+        return entry
+    entry = cache.get((id(validator), id(values)))
+    if entry is not None:
+        cache[None] = entry
+        return entry
+    if len(cache) >= 32:
+        cache.clear()  # values have been replaced often, for example per instance
+    value_map = None
+    try:
+        if isinstance(values, (list, tuple)):
+            value_map = {}
+            for index, element in enumerate(values):
+                value_map.setdefault(element, index)
+        elif isinstance(values, dict):
+            value_map = {}
+            for element, mapped in values.items():
+                value_map.setdefault(mapped, element)
+    except TypeError:
+        value_map = None  # unhashable elements
+    validate = None if validator is None else compile_validator(validator, values)
+    # Keep references to validator and values, such that their ids remain unique.
+    entry = cache[id(validator), id(values)] = cache[None] = (
+        validate, value_map, validator, values)
+    return entry
+
 
 class DynamicProperty(property):
     """ Class that allows managing python property behaviour in a "dynamic" fashion
@@ -61,8 +145,32 @@ class DynamicProperty(property):
         super().__init__(fget, fset, fdel, doc)
         self.fget_params_list = () if fget_params_list is None else fget_params_list
         self.fset_params_list = () if fset_params_list is None else fset_params_list
-        self.name = ""
         self.prefix = prefix
+        self.__set_name__(None, "")
+
+    def _resolve(self, obj, names):
+        """Return the dictionary of the dynamic parameters `names` defined in `obj`."""
+        try:
+            attributes = obj.__dict__
+        except AttributeError:
+            return {attr: getattr(obj, name) for attr, name in names if hasattr(obj, name)}
+        return {attr: attributes[name] for attr, name in names if name in attributes}
+
+    def _parameters(self, obj):
+        """Return the dynamic parameters of fget and fset defined in `obj`.
+
+        Instances of :class:`CommonBase` keep them until a dynamic parameter changes.
+        """
+        try:
+            resolved = obj.__dict__["_dynamic_parameters"]
+        except (AttributeError, KeyError):
+            return self._resolve(obj, self._fget_names), self._resolve(obj, self._fset_names)
+        try:
+            return resolved[self]
+        except KeyError:
+            parameters = resolved[self] = (self._resolve(obj, self._fget_names),
+                                           self._resolve(obj, self._fset_names))
+            return parameters
 
     def __get__(self, obj, objtype=None):
         if obj is None:
@@ -70,26 +178,91 @@ class DynamicProperty(property):
             return self
         if self.fget is None:
             raise AttributeError(f"Unreadable attribute {self.name}")
-
-        kwargs = {}
-        for attr in self.fget_params_list:
-            attr_instance_name = self.prefix + "_".join([self.name, attr])
-            if hasattr(obj, attr_instance_name):
-                kwargs[attr] = getattr(obj, attr_instance_name)
-        return self.fget(obj, **kwargs)
+        return self.fget(obj, **self._parameters(obj)[0])
 
     def __set__(self, obj, value):
         if self.fset is None:
             raise AttributeError(f"Can't set attribute {self.name}")
-        kwargs = {}
-        for attr in self.fset_params_list:
-            attr_instance_name = self.prefix + "_".join([self.name, attr])
-            if hasattr(obj, attr_instance_name):
-                kwargs[attr] = getattr(obj, attr_instance_name)
-        self.fset(obj, value, **kwargs)
+        self.fset(obj, value, **self._parameters(obj)[1])
 
     def __set_name__(self, owner, name):
         self.name = name
+        # Instance attribute names of the dynamic parameters.
+        self._fget_names = tuple((attr, self.prefix + "_".join([name, attr]))
+                                 for attr in self.fget_params_list)
+        self._fset_names = tuple((attr, self.prefix + "_".join([name, attr]))
+                                 for attr in self.fset_params_list)
+
+
+class _LazyChannels(MutableMapping):
+    """Collection of the channels of a lazy :class:`CommonBase.MultiChannelCreator`, which
+    creates each channel on its first access.
+
+    Checking for an id and the length do not create channels, iterating over the values does.
+    """
+
+    # Guards the creation of channels against concurrent access.
+    _lock = threading.RLock()
+
+    def __init__(self, parent, name, creator):
+        self._parent = parent
+        self._name = name
+        self._creator = creator
+        self._children = {}  # the created channels and other children added later
+
+    def __getitem__(self, id):
+        try:
+            return self._children[id]
+        except KeyError:
+            cls = self._creator.classes[id]  # raises KeyError for unknown ids
+        with self._lock:
+            if id not in self._children:
+                child = self._parent.add_child(cls, id, collection=self._name,
+                                               **self._creator.kwargs)
+                child._protected = True
+            return self._children[id]
+
+    def __setitem__(self, id, child):
+        self._children[id] = child
+
+    def __delitem__(self, id):
+        del self._children[id]
+
+    def __contains__(self, id):
+        return id in self._creator.classes or id in self._children
+
+    def __iter__(self):
+        yield from self._creator.classes
+        for id in list(self._children):
+            if id not in self._creator.classes:
+                yield id
+
+    def __len__(self):
+        return len(self._creator.classes) + sum(
+            id not in self._creator.classes for id in self._children)
+
+    def __repr__(self):
+        return f"<lazy channels {list(self)}, created {list(self._children)}>"
+
+
+class _LazyChannel:
+    """Class attribute, which creates a channel of a lazy collection on first access.
+
+    Once created, the channel is stored as instance attribute, which takes precedence.
+    """
+
+    def __init__(self, collection, id):
+        self.collection = collection
+        self.id = id
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self.collection)[self.id]
+        except KeyError:
+            raise AttributeError(f"'{type(instance).__name__}' object has no channel "
+                                 f"'{self.id}' in '{self.collection}'") from None
 
 
 class CommonBase:
@@ -121,6 +294,8 @@ class CommonBase:
     __reserved_prefix = "___"
 
     def __init__(self, **kwargs):
+        # Dynamic parameters of the DynamicProperty instances, resolved on first access.
+        self._dynamic_parameters = {}
         self._special_names = self._setup_special_names()
         self._create_channels()
         super().__init__(**kwargs)
@@ -193,16 +368,29 @@ class CommonBase:
                 functions = Instrument.MultiChannelCreator((PowerChannel, VoltageChannel),
                                                 ["power", "voltage"], prefix="fn_")
 
+        For instruments with many channels, of which only few are used, create the channels
+        lazily: a channel is created on the first access to its attribute or its entry in the
+        collection, such that unused channels neither cost time nor memory.
+
+        .. code::
+
+            class Multiplexer(Instrument):
+                channels = Instrument.MultiChannelCreator(RelayChannel, range(1, 481),
+                                                          lazy=True)
+
         :param cls: Class for all children or tuple/list of classes, one for each child.
         :param id: tuple/list of ids of the channels on the instrument.
         :param prefix: Collection prefix for the attributes, e.g. `"ch_"`
             creates attribute `self.ch_A`. If prefix evaluates False,
             the child will be added directly under the variable name. Required if id is tuple/list.
+        :param bool lazy: Create each channel on its first access instead of at instantiation.
         :param \\**kwargs: Keyword arguments for all children.
         """
 
-        def __init__(self, cls, id=None, prefix="ch_", **kwargs):
+        def __init__(self, cls, id=None, prefix="ch_", lazy=False, **kwargs):
             super().__init__(cls=cls, **kwargs)
+            if isinstance(id, range):
+                id = tuple(id)
             if isinstance(id, (list, tuple)) and isinstance(cls, (list, tuple)):
                 assert (len(id) == len(cls)), "Lengths of cls and id do not match."
                 self.pairs = list(zip(cls, id))
@@ -210,38 +398,69 @@ class CommonBase:
                 self.pairs = list(zip((cls,) * len(id), id))
             else:
                 raise ValueError("Invalid definition of classes '{cls}' and ids '{id}'.")
+            if lazy and not prefix:
+                raise ValueError("Lazy channels require a prefix.")
             self.kwargs.setdefault("prefix", prefix)
+            self.lazy = lazy
+            # Channel class of each id, shared by the instances of lazy collections.
+            self.classes = {id: cls for cls, id in self.pairs}
 
-    def _setup_special_names(self):
-        """ Return list of class/instance special names.
+    @classmethod
+    def _class_metadata(cls):
+        """Return the introspected metadata of the class, which is computed once per class.
 
-        Compute the list of special names based on the list of
-        class attributes that are a DynamicProperty. Check also for class variables
-        with special name and copy them at instance level
-        Internal method, not intended to be accessed at user level."""
-        special_names = []
-        dynamic_params = tuple(set(self._fget_params_list + self._fset_params_list))
+        Internal method, not intended to be accessed at user level.
+
+        Class attributes for the channels of lazy channel creators are added to the class.
+
+        :returns: Tuple of the frozenset of special names, the special names defined at class
+            level and the tuple of (name, creator) pairs of the channel creators.
+        """
+        try:
+            return cls.__dict__["_metadata"]
+        except KeyError:
+            pass
+        members = getmembers(cls)
+        dynamic_params = tuple(set(cls._fget_params_list + cls._fset_params_list))
         # Check whether class variables of DynamicProperty type are present
-        for attr_name, attr in getmembers(self.__class__):
-            if isinstance(attr, DynamicProperty):
-                special_names += [attr_name + "_" + key for key in dynamic_params]
+        special_names = frozenset(attr_name + "_" + key
+                                  for attr_name, attr in members
+                                  if isinstance(attr, DynamicProperty)
+                                  for key in dynamic_params)
         # Check if special variables are defined at class level
-        for attr, value in getmembers(self.__class__):
-            if attr in special_names:
-                # Copy class special variable at instance level, prefixing reserved_prefix
-                setattr(self, self.__reserved_prefix + attr, value)
+        class_special_names = tuple(attr for attr, value in members if attr in special_names)
+        channels = tuple((name, member) for name, member in members
+                         if isinstance(member, CommonBase.BaseChannelCreator))
+        for name, creator in channels:
+            if not getattr(creator, "lazy", False):
+                continue
+            for id in creator.classes:
+                attr_name = f"{creator.kwargs['prefix']}{id}"
+                if not hasattr(cls, attr_name):
+                    type.__setattr__(cls, attr_name, _LazyChannel(name, id))
+        metadata = special_names, class_special_names, channels
+        type.__setattr__(cls, "_metadata", metadata)
+        return metadata
+
+    def _setup_special_names(self):
+        """ Return the frozenset of class/instance special names.
+
+        The set of special names is based on the class attributes that are a DynamicProperty.
+        Special variables defined at class level are copied at instance level.
+        Internal method, not intended to be accessed at user level."""
+        special_names, class_special_names, *_ = self._class_metadata()
+        for attr in class_special_names:
+            # Copy class special variable at instance level, prefixing reserved_prefix
+            setattr(self, self.__reserved_prefix + attr, getattr(self.__class__, attr))
         return special_names
 
     @staticmethod
     def get_channels(cls):
         """Return a list of all the Instrument's ChannelCreator and MultiChannelCreator instances"""
-        class_members = getmembers(cls)
-
-        channels = []
-        for name, member in class_members:
-            if isinstance(member, CommonBase.BaseChannelCreator):
-                channels.append((name, member))
-        return channels
+        if isinstance(cls, type) and issubclass(cls, CommonBase):
+            return list(cls._class_metadata()[2])
+        return [(name, member) for name, member in getmembers(cls)
+                if isinstance(member, CommonBase.BaseChannelCreator)]
 
     @staticmethod
     def get_channel_pairs(cls):
@@ -255,6 +474,9 @@ class CommonBase:
     def _create_channels(self):
         """Create channel interfaces for all the Instrument's channel pairs."""
         for name, creator in CommonBase.get_channels(self.__class__):
+            if getattr(creator, "lazy", False):
+                setattr(self, name, _LazyChannels(self, name, creator))
+                continue
             for cls, id in creator.pairs:
                 # If channel pair was created with MultiChannelCreator
                 # add channel interface to collection with passed attribute name
@@ -270,20 +492,23 @@ class CommonBase:
 
     def __setattr__(self, name, value):
         """ Add reserved_prefix in front of special variables."""
-        if hasattr(self, '_special_names'):
-            if name in self._special_names:
-                name = self.__reserved_prefix + name
+        attributes = object.__getattribute__(self, "__dict__")
+        if name in attributes.get("_special_names", ()):
+            name = self.__reserved_prefix + name
+        if name.startswith(self.__reserved_prefix):
+            # Resolve the dynamic parameters again and drop the values cached with the old ones.
+            if "_dynamic_parameters" in attributes:
+                attributes["_dynamic_parameters"].clear()
+            if "_property_cache" in attributes:
+                attributes["_property_cache"].clear()
         super().__setattr__(name, value)
 
     def __getattribute__(self, name):
         """ Prevent read access to variables with special names used to
         support dynamic property behaviour."""
-        if name in ('_special_names', '__dict__'):
-            return super().__getattribute__(name)
-        if hasattr(self, '_special_names'):
-            if name in self._special_names:
-                raise AttributeError(
-                    f"{name} is a reserved variable name and it cannot be read")
+        if name in object.__getattribute__(self, "__dict__").get("_special_names", ()):
+            raise AttributeError(
+                f"{name} is a reserved variable name and it cannot be read")
         return super().__getattribute__(name)
 
     # Channel management
@@ -354,6 +579,51 @@ class CommonBase:
             del collection[child.id]
         delattr(self, child._name)
 
+    # Cache of property values
+    def _cache_store(self):
+        """Return the dictionary of cached property values.
+
+        The entries are ``(obj, key): (value, expiry, settable)`` tuples, where expiry is the
+        :func:`time.monotonic` time or None and `settable` marks values of properties with a
+        set command.
+        """
+        return self.__dict__.setdefault("_property_cache", {})
+
+    def _cached(self, key, getter, ttl=None, settable=False):
+        """Return the cached value of `key` or get, cache and return it.
+
+        :param key: Key of the value for this object.
+        :param getter: Callable returning the value.
+        :param ttl: Time in s the value is valid, None means until invalidated.
+        :param bool settable: Whether the value may be invalidated by a reset or clear.
+        """
+        store = self._cache_store()
+        entry = store.get((self, key))
+        if entry is not None and (entry[1] is None or entry[1] > time.monotonic()):
+            return entry[0]
+        value = getter()
+        store[(self, key)] = (value, None if ttl is None else time.monotonic() + ttl, settable)
+        return value
+
+    def clear_cache(self, settable_only=False):
+        """Invalidate the cached values of properties (see the `cache` parameter of
+        :meth:`control`) of the instrument and all its channels.
+
+        Call it, whenever the instrument state changed by other means than the cached
+        properties, e.g. a front panel operation or a reset with a driver specific command.
+        Writing ``*RST`` or ``*CLS`` with :meth:`write` invalidates the values of settable
+        properties automatically.
+
+        :param bool settable_only: Invalidate only values of properties with a set command,
+            keeping for example the identification.
+        """
+        store = self._cache_store()
+        if settable_only:
+            for key in [key for key, entry in store.items() if entry[2]]:
+                del store[key]
+        else:
+            store.clear()
+
     # Communication functions
     def wait_for(self, query_delay=None):
         """Wait for some time. Used by 'ask' to wait before reading.
@@ -364,6 +634,15 @@ class CommonBase:
         """
         raise NotImplementedError("Implement in subclass!")
 
+    def transaction(self):
+        """Return a context manager, which grants exclusive access to the communication.
+
+        :meth:`ask` (and therefore :meth:`values`) and :meth:`binary_values` hold it for the
+        whole write-read exchange. The default implementation does not lock anything,
+        subclasses use the lock of their adapter.
+        """
+        return nullcontext()
+
     def ask(self, command, query_delay=None):
         """Write a command to the instrument and return the read response.
 
@@ -371,15 +650,19 @@ class CommonBase:
         :param query_delay: Delay between writing and reading in seconds.
         :returns: String returned by the device without read_termination.
         """
-        self.write(command)
-        self.wait_for(query_delay)
-        return self.read()
+        with self.transaction():
+            self.write(command)
+            self.wait_for(query_delay)
+            return self.read()
 
     def values(self, command, separator=',', cast=float, preprocess_reply=None, maxsplit=-1,
-               **kwargs):
+               as_array=False, **kwargs):
         """Write a command to the instrument and return a list of formatted
         values from the result.
 
+        Long replies consisting only of `float` or `int` numbers are parsed by NumPy in one
+        call, other replies element by element.
+
         :param command: SCPI command to be sent to the instrument.
         :param preprocess_reply: Optional callable used to preprocess the string
             received from the instrument, before splitting it.
@@ -389,12 +672,18 @@ class CommonBase:
         :param maxsplit: The string returned by the device is splitted at most `maxsplit` times.
             -1 (default) indicates no limit.
         :param cast: A type to cast each element of the splitted string.
+        :param as_array: Return a NumPy array instead of a list, which avoids copying long
+            numeric replies into a list first.
         :param \\**kwargs: Keyword arguments to be passed to the :meth:`ask` method.
         :returns: A list of the desired type, or strings where the casting fails.
         """
         results = self.ask(command, **kwargs).strip()
         if callable(preprocess_reply):
             results = preprocess_reply(results)
+        if maxsplit == -1 and (as_array or len(results) >= _MIN_PARSE_LENGTH):
+            array = _parse_numbers(results, separator, cast)
+            if array is not None:
+                return array if as_array else array.tolist()
         results = results.split(separator, maxsplit=maxsplit)
         for i, result in enumerate(results):
             try:
@@ -406,19 +695,74 @@ class CommonBase:
                     results[i] = cast(result)
             except Exception:
                 pass  # Keep as string
-        return results
+        return np.array(results) if as_array else results
 
     def binary_values(self, command, query_delay=None, **kwargs):
         """ Write a command to the instrument and return a numpy array of the binary data.
 
+        For repeated acquisitions of the same size, pass a preallocated array as `out` to
+        read the data into it instead of allocating new arrays:
+
+        .. code::
+
+            trace = np.empty(1000, dtype=">f4")
+            for i in range(repetitions):
+                self.binary_values("TRAC:DATA?", out=trace, termination_bytes=-1)
+                process(trace)
+
         :param command: Command to be sent to the instrument.
         :param query_delay: Delay between writing and reading in seconds.
         :param kwargs: Arguments for :meth:`~pymeasure.Adapter.read_binary_values`.
         :returns: NumPy array of values.
         """
-        self.write(command)
-        self.wait_for(query_delay)
-        return self.read_binary_values(**kwargs)
+        with self.transaction():
+            self.write(command)
+            self.wait_for(query_delay)
+            return self.read_binary_values(**kwargs)
+
+    # Awaitable communication functions
+    async def run_async(self, function, *args, **kwargs):
+        """Run a blocking callable without blocking the event loop and return its result.
+
+        Implement in subclass!
+
+        :param function: Callable to execute.
+        :param \\*args, \\**kwargs: Arguments for the callable.
+        """
+        raise NotImplementedError("Implement in subclass!")
+
+    async def aget(self, name):
+        """Get the property `name` without blocking the event loop.
+
+        .. code::
+
+            voltage = await instrument.aget("voltage")
+
+        :param str name: Name of the property, e.g. one created by :meth:`control`.
+        :returns: Value of the property.
+        """
+        return await self.run_async(getattr, self, name)
+
+    async def aset(self, name, value):
+        """Set the property `name` to `value` without blocking the event loop.
+
+        :param str name: Name of the property, e.g. one created by :meth:`control`.
+        :param value: Value to set.
+        """
+        await self.run_async(setattr, self, name, value)
+
+    async def aask(self, command, query_delay=None):
+        """Awaitable version of :meth:`ask`."""
+        return await self.run_async(self.ask, command, query_delay=query_delay)
+
+    async def avalues(self, command, **kwargs):
+        """Awaitable version of :meth:`values`."""
+        return await self.run_async(self.values, command, **kwargs)
+
+    async def abinary_values(self, command, query_delay=None, **kwargs):
+        """Awaitable version of :meth:`binary_values`."""
+        return await self.run_async(self.binary_values, command, query_delay=query_delay,
+                                    **kwargs)
 
     # Property creators
     @staticmethod
@@ -441,6 +785,7 @@ class CommonBase:
         maxsplit=-1,
         cast=float,
         values_kwargs=None,
+        cache=False,
         **kwargs
     ):
         """Return a property for the class based on the supplied
@@ -455,7 +800,8 @@ class CommonBase:
         :param validator: A function that takes both a value and a group of valid values
             and returns a valid value, while it otherwise raises an exception
         :param values: A list, tuple, range, or dictionary of valid values, that can be used
-            as to map values if :code:`map_values` is True.
+            as to map values if :code:`map_values` is True. The bounds, sorting and maps
+            derived from them are computed once, replace the values instead of modifying them.
         :param map_values: A boolean flag that determines if the values should be
             interpreted as a map
         :param get_process: A function that takes a value and allows processing
@@ -482,11 +828,30 @@ class CommonBase:
             -1 (default) indicates no limit.
         :param cast: A type to cast each element of the splitted string.
         :param dict values_kwargs: Further keyword arguments for :meth:`values`.
+        :param cache: Cache the value read or written last (see below). True caches it until
+            it is invalidated, a number is the time in s the cached value is valid.
         :param \\**kwargs: Keyword arguments for :meth:`values`.
 
             .. deprecated:: 0.12
                 Use `values_kwargs` dictionary parameter instead.
 
+        A cached property returns the value read last instead of querying the instrument again,
+        which saves the communication for settings, which change only if they are set.
+        Setting the property invalidates the cached value, such that the next read returns the
+        value the instrument actually accepted.
+        A cached property without get command (see :meth:`setting`) does not write a value
+        equal to the one written last.
+        Writing ``*RST`` or ``*CLS``, changing a dynamic parameter (e.g.
+        ``x_get_command``) of the instance and :meth:`clear_cache` invalidate the cached values.
+
+        .. code-block:: python
+
+            nplc = Instrument.control(
+                "SENS:VOLT:NPLC?", "SENS:VOLT:NPLC %g",
+                "Control the integration time in number of power line cycles (float).",
+                cache=True,
+            )
+
         Example of usage of dynamic parameter is as follows:
 
         .. code-block:: python
@@ -531,6 +896,10 @@ class CommonBase:
         else:
             warn("Do not use `command_process`, use a dynamic property instead.", FutureWarning)
 
+        # Validation functions and value maps, computed once per validator and values.
+        prepared_get = {}
+        prepared_set = {}
+
         def fget(self,
                  get_command=get_command,
                  values=values,
@@ -566,6 +935,11 @@ class CommonBase:
                 elif isinstance(values, (list, tuple, range)):
                     return values[int(value)]
                 elif isinstance(values, dict):
+                    inverse = _prepare_values(prepared_get, None, values)[1]
+                    try:
+                        return inverse[value]
+                    except (KeyError, TypeError):
+                        pass  # not hashable or not found, compare all the values
                     for k, v in values.items():
                         if v == value:
                             return k
@@ -579,6 +953,16 @@ class CommonBase:
                 vals = get_process_list(vals)
                 return vals
 
+        if cache:
+            cache_key = object()
+            ttl = None if cache is True else cache
+            uncached_fget = fget
+
+            @wraps(uncached_fget)
+            def fget(self, **kwargs):
+                return self._cached(cache_key, lambda: uncached_fget(self, **kwargs), ttl,
+                                    settable=set_command is not None)
+
         def fset(self,
                  value,
                  set_command=set_command,
@@ -593,11 +977,26 @@ class CommonBase:
             if set_command is None:
                 raise LookupError("Property can not be set.")
 
-            value = set_process(validator(value, values))
+            validate, value_map, _, _ = _prepare_values(prepared_set, validator, values)
+            value = validate(value)
+            if cache:
+                store = self._cache_store()
+                if get_command is None:
+                    entry = store.get((self, cache_key))
+                    if entry is not None and _equal(entry[0], value) and (
+                            entry[1] is None or entry[1] > time.monotonic()):
+                        return  # the value has been written already
+                else:
+                    store.pop((self, cache_key), None)
+            checked_value = value
+            value = set_process(value)
             if not map_values:
                 pass
             elif isinstance(values, (list, tuple, range)):
-                value = values.index(value)
+                try:
+                    value = value_map[value]
+                except (KeyError, TypeError):
+                    value = values.index(value)  # not hashable or not found
             elif isinstance(values, dict):
                 value = values[value]
             else:
@@ -619,6 +1018,9 @@ class CommonBase:
                         "Error received after trying to set a property with the command "
                         f"""'{command_process(set_command) % value}': '{"', '".join(errors)}'."""
                     )
+            if cache and get_command is None:
+                store[(self, cache_key)] = (
+                    checked_value, None if ttl is None else time.monotonic() + ttl, True)
 
         # Add the specified document string to the getter
         fget.__doc__ = docs
@@ -648,6 +1050,7 @@ class CommonBase:
         maxsplit=-1,
         cast=float,
         values_kwargs=None,
+        cache=False,
         **kwargs,
     ):
         """ Return a property for the class based on the supplied
@@ -681,6 +1084,9 @@ class CommonBase:
             -1 (default) indicates no limit.
         :param cast: A type to cast each element of the splitted string.
         :param dict values_kwargs: Further keyword arguments for :meth:`values`.
+        :param cache: Cache the value read last for static values like the identification.
+            True caches it until :meth:`clear_cache` is called, a number is the time in s the
+            cached value is valid. See :meth:`control`.
         :param \\**kwargs: Keyword arguments for :meth:`values`.
 
             .. deprecated:: 0.12
@@ -709,6 +1115,7 @@ class CommonBase:
                                   maxsplit=maxsplit,
                                   cast=cast,
                                   values_kwargs=values_kwargs,
+                                  cache=cache,
                                   )
 
     @staticmethod
@@ -721,6 +1128,7 @@ class CommonBase:
         set_process=lambda v: v,
         check_set_errors=False,
         dynamic=False,
+        cache=False,
     ):
         """Return a property for the class based on the supplied
         commands. This property may be set, but raises an exception
@@ -739,6 +1147,8 @@ class CommonBase:
         :param check_set_errors: Toggles checking errors after setting
         :param dynamic: Specify whether the property parameters are meant to be changed in
             instances or subclasses. See :meth:`control` for an usage example.
+        :param cache: Skip writing a value equal to the one written last. True remembers it
+            until invalidated, a number is the time in s it is remembered. See :meth:`control`.
         """
 
         return CommonBase.control(get_command=None,
@@ -750,6 +1160,7 @@ class CommonBase:
                                   set_process=set_process,
                                   check_set_errors=check_set_errors,
                                   dynamic=dynamic,
+                                  cache=cache,
                                   )
 
     def check_errors(self):
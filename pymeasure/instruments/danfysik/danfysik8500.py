@@ -22,10 +22,9 @@
 # THE SOFTWARE.
 #
 
-from pymeasure.instruments import Instrument
+from pymeasure.instruments import Instrument, wait_until
 from pymeasure.errors import RangeException
 
-from time import sleep
 import numpy as np
 import re
 
@@ -188,13 +187,14 @@ class Danfysik8500(Instrument):
         provided function :code:`has_aborted` can be supplied, which
         is checked after each delay time (in seconds) in addition to the
         stability check. This allows an abort feature to be integrated.
+        The delay time doubles after each check, up to 0.1 s.
 
         :param has_aborted: A function that returns True if the process should stop waiting
-        :param delay: The delay time in seconds between each check for stability
+        :param delay: The initial delay time in seconds between each check for stability
         """
-        self.wait_for_ready(has_aborted, delay)
-        while not has_aborted() and not self.is_current_stable():
-            sleep(delay)
+        if self.wait_for_ready(has_aborted, delay):
+            wait_until(self.is_current_stable, has_aborted, timeout=None,
+                       interval=delay, max_interval=max(delay, 0.1))
 
     def is_current_stable(self):
         """ Returns True if the current is within 0.02 A of the
@@ -212,12 +212,14 @@ class Danfysik8500(Instrument):
         provided function :code:`has_aborted` can be supplied, which
         is checked after each delay time (in seconds) in addition to the
         readiness check. This allows an abort feature to be integrated.
+        The delay time doubles after each check, up to 0.1 s.
 
         :param has_aborted: A function that returns True if the process should stop waiting
-        :param delay: The delay time in seconds between each check for readiness
+        :param delay: The initial delay time in seconds between each check for readiness
+        :return: True if the instrument is ready, False if aborted.
         """
-        while not has_aborted() and not self.is_ready():
-            sleep(delay)
+        return wait_until(self.is_ready, has_aborted, timeout=None,
+                          interval=delay, max_interval=max(delay, 0.1))
 
     @property
     def status(self):
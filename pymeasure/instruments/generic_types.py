@@ -58,15 +58,17 @@ class SCPIMixin:
 
     options = Instrument.measurement(
         "*OPT?",
-        """Get the device options installed.""",
+        """Get the device options installed (cached).""",
         cast=str,
+        cache=True,
     )
 
     id = Instrument.measurement(
         "*IDN?",
-        """Get the identification of the instrument.""",
+        """Get the identification of the instrument (cached).""",
         cast=str,
         maxsplit=0,
+        cache=True,
     )
 
     next_error = Instrument.measurement(
@@ -85,6 +87,36 @@ class SCPIMixin:
         """Reset the instrument."""
         self.write("*RST")
 
+    def wait_for_operation_complete(self, should_stop=lambda: False, timeout=60,
+                                    interval=0.01, max_interval=1):
+        """Wait until the instrument has finished all pending operations, e.g. a sweep.
+
+        The instrument is told to set the operation complete bit of the standard event status
+        register (``*OPC``) and to request service (SRQ) then (``*ESE 1;*SRE 32``). The
+        previous enable registers (``*ESE?``, ``*SRE?``) are restored afterwards, also after a
+        timeout. If the adapter supports SRQs, waiting ends as
+        soon as the instrument requests service, otherwise the standard event status register
+        (``*ESR?``) is polled in increasing intervals, see :meth:`wait_for_condition`.
+        Reading that register clears it.
+
+        Unlike querying :attr:`complete`, this does not block the connection while waiting.
+
+        :param should_stop: Callable returning True in order to stop waiting early.
+        :param timeout: Maximum waiting time in seconds, None waits indefinitely.
+        :param interval: Initial time between two checks in seconds.
+        :param max_interval: Maximum time between two checks in seconds.
+        :returns: True if the operations are complete, False if `should_stop` returned True.
+        :raises TimeoutError: If the operations are not complete within `timeout`.
+        """
+        event_enable = int(self.ask("*ESE?"))
+        service_request_enable = int(self.ask("*SRE?"))
+        self.write("*ESE 1;*SRE 32;*OPC")
+        try:
+            return self.wait_for_condition(lambda: int(self.ask("*ESR?")) & 1, should_stop,
+                                           timeout, interval, max_interval)
+        finally:
+            self.write(f"*ESE {event_enable};*SRE {service_request_enable}")
+
     def check_errors(self):
         """ Read all errors from the instrument.
 
@@ -22,5 +22,9 @@
 # THE SOFTWARE.
 #
 
-from .tc038d import TC038D
-from .tc038 import TC038
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".tc038d": ["TC038D"],
+    ".tc038": ["TC038"],
+})
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .nd287 import ND287
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".nd287": ["ND287"],
+})
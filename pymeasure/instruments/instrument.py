@@ -22,12 +22,18 @@
 # THE SOFTWARE.
 #
 
+from contextlib import contextmanager
 import logging
+import threading
 import time
 from warnings import warn
 
+from .batch import Batch
 from .common_base import CommonBase
-from ..adapters.visa import VISAAdapter
+from .waiting import wait_until
+from ..adapters.adapter import _is_timeout
+from ..adapters.asynchronous import AsyncAdapter
+from ..adapters.tuning import QueryDelayTuner
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
@@ -53,11 +59,15 @@ class Instrument(CommonBase):
 
     Otherwise, the passed :py:class:`~pymeasure.adapters.Adapter` object is used and any keyword
     arguments are discarded.
+    An :py:class:`~pymeasure.adapters.AsyncAdapter` may be passed as well, its wrapped adapter
+    is used for the synchronous methods and the AsyncAdapter for the awaitable ones
+    (e.g. :meth:`aget`).
 
     This class defines basic SCPI commands by default. This can be disabled with
     :code:`includeSCPI` for instruments not compatible with the standard SCPI commands.
 
-    :param adapter: A string, integer, or :py:class:`~pymeasure.adapters.Adapter` subclass object
+    :param adapter: A string, integer, or :py:class:`~pymeasure.adapters.Adapter` or
+        :py:class:`~pymeasure.adapters.AsyncAdapter` subclass object
     :param string name: The name of the instrument. Often the model designation by default.
     :param includeSCPI: An obligatory boolean, which toggles the inclusion of standard SCPI commands
 
@@ -74,8 +84,15 @@ class Instrument(CommonBase):
     def __init__(self, adapter, name, includeSCPI=None,
                  **kwargs):
         # Setup communication before possible children require the adapter.
-        if isinstance(adapter, (int, str)):
+        self._async_adapter = None
+        self._batch = None
+        self._delay_tuner = None
+        if isinstance(adapter, AsyncAdapter):
+            self._async_adapter = adapter
+            adapter = adapter.adapter
+        elif isinstance(adapter, (int, str)):
             try:
+                from ..adapters.visa import VISAAdapter
                 adapter = VISAAdapter(adapter, **kwargs)
             except ImportError:
                 raise Exception("Invalid Adapter provided for Instrument since"
@@ -126,17 +143,17 @@ class Instrument(CommonBase):
 
     @property
     def options(self):
-        """ Get the device options installed. """
+        """ Get the device options installed (cached). """
         if self.SCPI:
-            return self.ask("*OPT?").strip()
+            return self._cached("*OPT?", lambda: self.ask("*OPT?").strip())
         else:
             raise NotImplementedError("Non SCPI instruments require implementation in subclasses")
 
     @property
     def id(self):
-        """ Get the identification of the instrument. """
+        """ Get the identification of the instrument (cached). """
         if self.SCPI:
-            return self.ask("*IDN?").strip()
+            return self._cached("*IDN?", lambda: self.ask("*IDN?").strip())
         else:
             raise NotImplementedError("Non SCPI instruments require implementation in subclasses")
 
@@ -152,17 +169,34 @@ class Instrument(CommonBase):
     def write(self, command, **kwargs):
         """Write a string command to the instrument appending `write_termination`.
 
+        Inside a :meth:`batch` block, the command is queued instead.
+        Writing ``*RST`` or ``*CLS`` invalidates cached property values (see
+        :meth:`clear_cache`).
+
         :param command: command string to be sent to the instrument
         :param kwargs: Keyword arguments for the adapter.
         """
-        self.adapter.write(command, **kwargs)
+        if self.__dict__.get("_property_cache") and command[:4].upper() in ("*RST", "*CLS"):
+            self.clear_cache(settable_only=True)
+        batch = self._current_batch()
+        if batch is not None:
+            batch.write(command, **kwargs)
+        else:
+            self.adapter.write(command, **kwargs)
 
     def write_bytes(self, content, **kwargs):
         """Write the bytes `content` to the instrument."""
+        self._flush_batch()
         self.adapter.write_bytes(content, **kwargs)
 
     def read(self, **kwargs):
-        """Read up to (excluding) `read_termination` or the whole read buffer."""
+        """Read up to (excluding) `read_termination` or the whole read buffer.
+
+        Inside a :meth:`batch` block, the queued commands are sent first.
+        """
+        batch = self._current_batch()
+        if batch is not None:
+            return batch.read(**kwargs)
         return self.adapter.read(**kwargs)
 
     def read_bytes(self, count, **kwargs):
@@ -173,8 +207,19 @@ class Instrument(CommonBase):
         :param kwargs: Keyword arguments for the adapter.
         :returns bytes: Bytes response of the instrument (including termination).
         """
+        self._flush_batch()
         return self.adapter.read_bytes(count, **kwargs)
 
+    def read_bytes_into(self, buffer, **kwargs):
+        """Read bytes from the instrument into the writable `buffer` until it is full.
+
+        :param buffer: Writable, contiguous bytes-like object, e.g. a NumPy array.
+        :param kwargs: Keyword arguments for the adapter.
+        :returns int: Number of bytes read.
+        """
+        self._flush_batch()
+        return self.adapter.read_bytes_into(buffer, **kwargs)
+
     def write_binary_values(self, command, values, *args, **kwargs):
         """Write binary values to the device.
 
@@ -182,20 +227,250 @@ class Instrument(CommonBase):
         :param values: The values to transmit.
         :param \\*args, \\**kwargs: Further arguments to hand to the Adapter.
         """
+        self._flush_batch()
         self.adapter.write_binary_values(command, values, *args, **kwargs)
 
     def read_binary_values(self, **kwargs):
         """Read binary values from the device."""
+        self._flush_batch()
         return self.adapter.read_binary_values(**kwargs)
 
+    def transaction(self):
+        """Return a context manager, which grants the current thread exclusive access to the
+        connection, see :meth:`Adapter.transaction() <pymeasure.adapters.Adapter.transaction>`.
+
+        .. code::
+
+            with instrument.transaction():
+                instrument.write("TRAC:DATA?")
+                header = instrument.read_bytes(2)
+                data = instrument.read_bytes(int(header[1:]))
+        """
+        return self.adapter.transaction()
+
+    def _current_batch(self):
+        """Return the batch running in the current thread or None."""
+        batch = self._batch
+        if batch is not None and batch.thread_id == threading.get_ident():
+            return batch
+        return None
+
+    def _flush_batch(self):
+        """Send the queued commands of a running batch before binary communication."""
+        batch = self._current_batch()
+        if batch is not None:
+            batch.flush()
+
+    @contextmanager
+    def batch(self, max_length=None, separator=";"):
+        """Return a context manager, which joins the commands of its block into few messages.
+
+        Inside the block, written commands (e.g. by property setters) are queued. Reading a
+        response (e.g. by a property getter) sends the queued commands together with the query.
+        Use :meth:`Batch.get() <pymeasure.instruments.batch.Batch.get>` to defer getters until
+        the end of the block, such that their queries share a single message as well.
+        Leaving the block sends the remaining commands. If an exception occurs in the block,
+        the queued commands are discarded.
+
+        .. code::
+
+            with instrument.batch(max_length=256) as batch:
+                instrument.voltage = 5  # queues "VOLT 5"
+                voltage = batch.get("voltage")  # queues "VOLT?"
+                current = batch.get("current")  # queues "MEAS:CURR?"
+            # Sends "VOLT 5;:VOLT?;:MEAS:CURR?" and reads for example "5;0.1"
+            print(voltage.result(), current.result())
+
+        Binary communication sends the queued commands first and is not batched.
+        The block holds the :meth:`transaction` lock, such that other threads wait with their
+        communication until the batch is sent.
+        Batching requires instruments, which accept several commands per message,
+        like SCPI instruments.
+
+        :param int max_length: Maximum length of a joined message. None means no limit.
+        :param str separator: Separator between the commands and between the query responses.
+        :returns: :class:`~pymeasure.instruments.batch.Batch` instance.
+        """
+        batch = self._current_batch()
+        if batch is not None:
+            # Nested batch: the outer one sends the commands.
+            yield batch
+            return
+        with self.transaction():
+            self._batch = batch = Batch(self, max_length=max_length, separator=separator)
+            try:
+                yield batch
+                batch.flush()
+            except BaseException:
+                batch.cancel()
+                raise
+            finally:
+                self._batch = None
+
+    def read_properties(self, names, max_length=None, separator=";"):
+        """Read several properties with a single combined query and return their values.
+
+        The get commands of the properties are joined into one message (see :meth:`batch`),
+        the response is split by `separator` and each part is processed by its property
+        (e.g. `cast`, `get_process`, and value mapping).
+
+        .. code::
+
+            values = instrument.read_properties(["voltage", "current", "ch_A.output_enabled"])
+            # {"voltage": 5.0, "current": 0.1, "ch_A.output_enabled": True}
+
+        :param names: Iterable of property names. Properties of channels are addressed with
+            the dotted path of the channel, e.g. ``"ch_A.voltage"``.
+        :param int max_length: Maximum length of a joined message. None means no limit.
+        :param str separator: Separator between the commands and between the query responses.
+        :returns: Dictionary of the property names and their values.
+        """
+        with self.batch(max_length=max_length, separator=separator) as batch:
+            futures = {}
+            for name in names:
+                *path, attr_name = name.split(".")
+                obj = self
+                for part in path:
+                    obj = getattr(obj, part)
+                futures[name] = batch.get(attr_name, obj=obj)
+            # Send immediately, in case this batch is nested in another one.
+            batch.flush()
+        return {name: future.result() for name, future in futures.items()}
+
+    @property
+    def async_adapter(self):
+        """Get the :py:class:`~pymeasure.adapters.AsyncAdapter` used by the awaitable methods.
+
+        Unless given at instantiation, it is created on first access, wrapping :attr:`adapter`.
+        """
+        if self._async_adapter is None:
+            self._async_adapter = AsyncAdapter(self.adapter)
+        return self._async_adapter
+
+    async def run_async(self, function, *args, **kwargs):
+        """Run a blocking callable in the worker thread of :attr:`async_adapter`.
+
+        :param function: Callable to execute.
+        :param \\*args, \\**kwargs: Arguments for the callable.
+        """
+        return await self.async_adapter.run(function, *args, **kwargs)
+
     # Communication functions
     def wait_for(self, query_delay=None):
         """Wait for some time. Used by 'ask' to wait before reading.
 
         :param query_delay: Delay between writing and reading in seconds. None is default delay.
         """
+        if self._delay_tuner is not None:
+            query_delay = self._delay_tuner.delay(query_delay)
         if query_delay:
+            start = time.perf_counter()
             time.sleep(query_delay)
+            self.adapter.record("delay", None, start, time.perf_counter() - start)
+
+    def wait_for_condition(self, condition, should_stop=lambda: False, timeout=60,
+                           interval=0.01, max_interval=1):
+        """Wait until `condition` is met, checking it in increasing intervals.
+
+        Each interval is twice as long as the previous one, up to `max_interval`, see
+        :func:`~pymeasure.instruments.waiting.wait_until`. If the adapter can wait for a
+        service request (SRQ), like the :class:`~pymeasure.adapters.VISAAdapter` for GPIB and
+        USB or the :class:`~pymeasure.adapters.PrologixAdapter`, an SRQ of the instrument ends
+        the interval early. Let the instrument request service once the condition is met in order to
+        return without delay, like
+        :meth:`~pymeasure.instruments.generic_types.SCPIMixin.wait_for_operation_complete` does.
+        Checking the condition should clear the event requesting service, otherwise the SRQ is
+        ignored from then on.
+
+        .. code::
+
+            instrument.write("INIT")
+            instrument.wait_for_condition(lambda: instrument.buffer_count >= 100)
+
+        :param condition: Callable returning True once the instrument is ready.
+        :param should_stop: Callable returning True in order to stop waiting early.
+        :param timeout: Maximum waiting time in seconds, None waits indefinitely.
+        :param interval: Initial time between two checks in seconds.
+        :param max_interval: Maximum time between two checks in seconds.
+        :returns: True if the condition is met, False if `should_stop` returned True.
+        :raises TimeoutError: If the condition is not met within `timeout`.
+        """
+        wait_for_srq = getattr(self.adapter, "wait_for_srq", None)
+        srq = False  # whether the last interval ended with a service request
+
+        def pause(delay):
+            nonlocal wait_for_srq, srq
+            if srq:
+                # The service request has another cause, which might not be cleared.
+                log.debug("Service request of %s ignored, polling instead.", self.name)
+                wait_for_srq = None
+                srq = False
+            if wait_for_srq is None:
+                time.sleep(delay)
+                return
+            try:
+                wait_for_srq(timeout=delay)
+            except Exception as exc:
+                if not _is_timeout(exc):
+                    log.debug("Waiting for a service request failed, polling instead: %s", exc)
+                    wait_for_srq = None
+            else:
+                srq = True
+
+        return wait_until(condition, should_stop, timeout, interval, max_interval, pause=pause,
+                          description=self.name)
+
+    def enable_delay_tuning(self, file=None, key=None, **kwargs):
+        """Learn the shortest safe query delay of each command instead of waiting the fixed
+        delay of the driver, see :class:`~pymeasure.adapters.tuning.QueryDelayTuner`.
+
+        The delays are shortened step by step while the replies arrive, and increased again
+        after a timeout, an empty or a rejected (see :meth:`reject_reply`) reply.
+
+        .. code::
+
+            instrument.enable_delay_tuning("delays.json")
+            ...  # communicate
+            instrument.delay_tuner.profile()
+            # {"MEAS:VOLT?": {"delay": 0.0125, "failed": None, "latency": 0.012}}
+
+        :param file: Path of a JSON file to load and save the learned delays.
+        :param str key: Key of the learned delays in the file. Defaults to manufacturer, model
+            and firmware of the :attr:`id` and to :attr:`name` for instruments without it.
+        :param \\**kwargs: Further keyword arguments for the tuner.
+        :returns: The :class:`~pymeasure.adapters.tuning.QueryDelayTuner`.
+        """
+        self.disable_delay_tuning()
+        if key is None:
+            try:
+                manufacturer, model, _, firmware = (str(self.id).split(",") + [""] * 4)[:4]
+            except NotImplementedError:
+                key = self.name
+            else:
+                key = " ".join(part.strip() for part in (manufacturer, model, firmware))
+        self._delay_tuner = QueryDelayTuner(file, key, **kwargs)
+        self.adapter.add_monitor(self._delay_tuner)
+        return self._delay_tuner
+
+    def disable_delay_tuning(self):
+        """Wait again the fixed query delays of the driver and save the learned ones."""
+        if self._delay_tuner is not None:
+            self.adapter.remove_monitor(self._delay_tuner)
+            self._delay_tuner.flush()
+            self._delay_tuner = None
+
+    @property
+    def delay_tuner(self):
+        """Get the :class:`~pymeasure.adapters.tuning.QueryDelayTuner` or None."""
+        return self._delay_tuner
+
+    def reject_reply(self):
+        """Report that the last reply was garbled, e.g. had a wrong checksum.
+
+        Monitors of the adapter receive a ``"garbled"`` event, which lets delay tuning (see
+        :meth:`enable_delay_tuning`) increase the query delay of the last command.
+        """
+        self.adapter.record("garbled", None, time.perf_counter(), 0)
 
     # SCPI default methods
     def clear(self):
@@ -215,6 +490,8 @@ class Instrument(CommonBase):
 
     def shutdown(self):
         """Brings the instrument to a safe and stable state"""
+        if self._delay_tuner is not None:
+            self._delay_tuner.flush()
         self.isShutdown = True
         log.info(f"Finished shutting down {self.name}")
 
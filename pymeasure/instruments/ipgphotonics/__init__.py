@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .yar import YAR
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".yar": ["YAR"],
+})
@@ -23,13 +23,11 @@
 #
 
 import logging
-from time import sleep, time
 
 import numpy as np
 
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import truncated_range
-from pymeasure.adapters import PrologixAdapter
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
@@ -76,25 +74,23 @@ class KeithleyBuffer:
         returns early if the :code:`should_stop` function returns True or
         the timeout is reached before the buffer is full.
 
+        The buffer state is checked with increasing intervals, starting at
+        `interval`, and earlier, if the adapter supports service requests.
+
         :param should_stop: A function that returns True when this function should return early
         :param timeout: A time in seconds after which this function should return early
         :param interval: A time in seconds for how often to check if the buffer is full
+        :return: True if the buffer is full, False if stopped early.
+        :raises TimeoutError: If the buffer is not full within the timeout.
         """
-        # TODO: Use SRQ initially instead of constant polling
-        # self.adapter.wait_for_srq()
-        t = time()
-        while not self.is_buffer_full():
-            sleep(interval)
-            if should_stop():
-                return
-            if (time() - t) > timeout:
-                raise Exception("Timed out waiting for Keithley buffer to fill.")
+        return self.wait_for_condition(self.is_buffer_full, should_stop, timeout,
+                                       interval, max_interval=max(interval, 1))
 
     @property
     def buffer_data(self):
         """ Get a numpy array of values from the buffer. """
         self.write(":FORM:DATA ASCII")
-        return np.array(self.values(":TRAC:DATA?"), dtype=np.float64)
+        return np.asarray(self.values(":TRAC:DATA?", as_array=True), dtype=np.float64)
 
     def start_buffer(self):
         """ Starts the buffer. """
@@ -108,6 +104,8 @@ class KeithleyBuffer:
         """ Abort the buffering measurement, by stopping the measurement
         arming and triggering sequence. If possible, a Selected Device
         Clear (SDC) is used. """
+        from pymeasure.adapters import PrologixAdapter  # imports PyVISA, only when needed
+
         if type(self.adapter) is PrologixAdapter:
             self.write("++clr")
         else:
@@ -25,9 +25,7 @@
 import logging
 import warnings
 import numpy as np
-from time import sleep, time
-
-from pymeasure.instruments import Instrument, Channel
+from pymeasure.instruments import Instrument, Channel, wait_until
 from pymeasure.instruments.validators import strict_discrete_set
 
 log = logging.getLogger(__name__)
@@ -67,7 +65,8 @@ class LakeShoreTemperatureChannel(Channel):
                              interval=1, timeout=360,
                              should_stop=lambda: False):
         """ Blocks the program, waiting for the temperature to reach the target
-        within the accuracy (%), checking this each interval time in seconds.
+        within the accuracy (%), checking this in increasing intervals up to the
+        interval time in seconds (see :func:`~pymeasure.instruments.waiting.wait_until`).
 
         :param target: Target temperature in kelvin, celsius, or sensor units.
         :param unit: 'kelvin', 'celsius', or 'sensor' specifying the unit
@@ -75,24 +74,19 @@ class LakeShoreTemperatureChannel(Channel):
         :param accuracy: An acceptable percentage deviation between the
                          target and temperature.
         :param interval: Interval time in seconds between queries.
-        :param timeout: A timeout in seconds after which an exception is raised
+        :param timeout: A timeout in seconds after which a TimeoutError is raised
         :param should_stop: A function that returns True if waiting should stop, by
                             default this always returns False
+        :return: True if the target is reached, False if stopped early.
         """
         abs_tolerance = target * (accuracy / 100)
-        target_reached = False
-        t = time()
-        while not target_reached:
-            reading = np.array([getattr(self, unit)])
-            target_reached = np.allclose(reading, target, atol=abs_tolerance)
-            sleep(interval)
-            if (time() - t) > timeout:
-                raise Exception((
-                                    "Timeout occurred after waiting %g seconds for "
-                                    "the LakeShore 331 temperature to reach %g %s."
-                                ) % (timeout, target, unit))
-            if should_stop():
-                return
+
+        def target_reached():
+            return np.allclose(getattr(self, unit), target, atol=abs_tolerance)
+
+        return wait_until(target_reached, should_stop, timeout,
+                          interval=min(interval, 0.1), max_interval=interval,
+                          description=f"the LakeShore temperature to reach {target:g} {unit}")
 
 
 class LakeShoreHeaterChannel(Channel):
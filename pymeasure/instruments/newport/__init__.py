@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .esp300 import ESP300
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".esp300": ["ESP300"],
+})
@@ -22,9 +22,7 @@
 # THE SOFTWARE.
 #
 
-from time import sleep
-
-from pymeasure.instruments import Instrument, SCPIUnknownMixin
+from pymeasure.instruments import Instrument, SCPIUnknownMixin, wait_until
 from pymeasure.instruments.validators import strict_discrete_set
 
 
@@ -222,13 +220,22 @@ class Axis:
         """
         self.write("DH")
 
-    def wait_for_stop(self, delay=0, interval=0.05):
+    def wait_for_stop(self, delay=0, interval=0.05, should_stop=lambda: False, timeout=None):
         """ Blocks the program until the motion is completed. A further
         delay can be specified in seconds.
+
+        The motion state is checked in increasing intervals, starting at
+        `interval` seconds, up to 0.2 s.
+
+        :param should_stop: A function that returns True if waiting should stop
+        :param timeout: A timeout in seconds after which a TimeoutError is raised,
+            None waits indefinitely
+        :return: True if the motion is completed, False if stopped early.
         """
         self.write("WS%d" % (delay * 1e3))
-        while not self.motion_done:
-            sleep(interval)
+        return wait_until(lambda: self.motion_done, should_stop, timeout,
+                          interval=interval, max_interval=max(interval, 0.2),
+                          description="the ESP300 axis to stop")
 
 
 class ESP300(SCPIUnknownMixin, Instrument):
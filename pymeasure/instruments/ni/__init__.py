@@ -22,16 +22,9 @@
 # THE SOFTWARE.
 #
 
-try:
-    from .daqmx import DAQmx
-except OSError:
-    # Error Logging is handled within package
-    pass
+from pymeasure.lazy import lazy_attributes
 
-try:
-    from .virtualbench import VirtualBench
-    # direct access to armstrap/pyvirtualbench wrapper:
-    # from .virtualbench import VirtualBench_Direct
-except ModuleNotFoundError:
-    # Error Logging is handled within package
-    pass
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".daqmx": ["DAQmx"],
+    ".virtualbench": ["VirtualBench"],
+})
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .fpu60 import Fpu60
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".fpu60": ["Fpu60"],
+})
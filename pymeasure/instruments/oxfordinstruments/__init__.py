@@ -22,8 +22,11 @@
 # THE SOFTWARE.
 #
 
+from pymeasure.lazy import lazy_attributes
 
-from .itc503 import ITC503
-from .ips120_10 import IPS120_10
-from .ps120_10 import PS120_10
-from .mercuryitc import MercuryiTC
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".itc503": ["ITC503"],
+    ".ips120_10": ["IPS120_10"],
+    ".ps120_10": ["PS120_10"],
+    ".mercuryitc": ["MercuryiTC"],
+})
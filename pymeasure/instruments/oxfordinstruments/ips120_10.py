@@ -24,9 +24,9 @@
 
 
 import logging
-from time import sleep, time
+from time import sleep
 
-from pymeasure.instruments import Instrument
+from pymeasure.instruments import Instrument, wait_until
 from pymeasure.instruments.validators import strict_discrete_set
 from pymeasure.instruments.validators import truncated_range
 
@@ -387,32 +387,30 @@ class IPS120_10(OxfordInstrumentsBase):
     def wait_for_idle(self, delay=1, max_wait_time=None, should_stop=lambda: False):
         """ Wait until the system is at rest (i.e. current of field not ramping).
 
-        :param delay: Time in seconds between each query into the state of the instrument.
+        The state is checked in increasing intervals, starting at 0.1 s, up to `delay`.
+
+        :param delay: Maximum time in seconds between each query into the state of the
+            instrument.
         :param max_wait_time: Maximum time in seconds to wait before is at rest. If the system is
             not at rest within this time a :class:`TimeoutError` is raised. :code:`None` is
             interpreted as no maximum time.
         :param should_stop: A function that returns :code:`True` when this function should return
             early.
+        :return: True if the system is at rest, False if stopped early.
         """
         log.debug("waiting for magnet to be idle")
-        start_time = time()
-
-        while True:
-            log.debug("sleeping for %d s", delay)
-            sleep(delay)
 
+        def at_rest():
             log.debug("checking the status of the sweep")
-            status = self.sweep_status
-
-            if status == "at rest":
-                log.debug("status is 'at rest', waiting is done")
-                break
-            if should_stop():
-                log.debug("external function signals to stop waiting")
-                break
-
-            if max_wait_time is not None and time() - start_time > max_wait_time:
-                raise TimeoutError("IPS 120-10: Magnet not idle within max wait time.")
+            return self.sweep_status == "at rest"
+
+        if wait_until(at_rest, should_stop, max_wait_time,
+                      interval=min(delay, 0.1), max_interval=delay,
+                      description="IPS 120-10 magnet to be idle"):
+            log.debug("status is 'at rest', waiting is done")
+            return True
+        log.debug("external function signals to stop waiting")
+        return False
 
     def set_field(self, field, sweep_rate=None, persistent_mode_control=True):
         """ Change the applied magnetic field to a new specified magnitude.
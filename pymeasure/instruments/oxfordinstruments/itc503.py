@@ -24,12 +24,12 @@
 
 
 import logging
-from time import sleep, time
+from time import time
 from enum import IntFlag
 
 import numpy as np
 
-from pymeasure.instruments import Instrument
+from pymeasure.instruments import Instrument, wait_until
 from pymeasure.instruments.validators import strict_discrete_set, \
     truncated_range, strict_range
 
@@ -442,7 +442,8 @@ class ITC503(OxfordInstrumentsBase):
         :param timeout: The maximum time the waiting is allowed to take. If
                         timeout is exceeded, a TimeoutError is raised. If
                         timeout is None, no timeout will be used.
-        :param check_interval: The time between temperature queries to the ITC.
+        :param check_interval: The maximum time between temperature queries to the
+                               ITC. The queries start at shorter intervals.
         :param stability_interval: The time over which the temperature_error is
                                    to be below error to be considered stable.
         :param thermalize_interval: The time to wait after stabilizing for the
@@ -451,43 +452,30 @@ class ITC503(OxfordInstrumentsBase):
                             waiting to be stopped before its end.
         """
 
-        number_of_intervals = int(stability_interval / check_interval)
-        stable_intervals = 0
-        attempt = 0
-
-        t0 = time()
-        while True:
-            temp_error = self.temperature_error
-            if abs(temp_error) < error:
-                stable_intervals += 1
-            else:
-                stable_intervals = 0
-                attempt += 1
-
-            if stable_intervals >= number_of_intervals:
-                break
-
-            if timeout is not None and (time() - t0) > timeout:
-                raise TimeoutError(
-                    "Timeout expired while waiting for the Oxford ITC305 to "
-                    "reach the set-point temperature"
-                )
-
-            if should_stop():
-                return
-
-            sleep(check_interval)
+        stable_since = None
+        attempts = 0  # number of checks with a temperature off the set-point
+
+        def stable():
+            nonlocal stable_since, attempts
+            now = time()
+            if abs(self.temperature_error) >= error:
+                stable_since = None
+                attempts += 1
+            elif stable_since is None:
+                stable_since = now
+            return stable_since is not None and now - stable_since >= stability_interval
+
+        if not wait_until(stable, should_stop, timeout,
+                          interval=min(check_interval, 0.1), max_interval=check_interval,
+                          description="the Oxford ITC503 to reach the set-point temperature"):
+            return
 
-        if attempt == 0:
+        if attempts == 0:
             return
 
         t1 = time() + thermalize_interval
-        while time() < t1:
-            sleep(check_interval)
-            if should_stop():
-                return
-
-        return
+        wait_until(lambda: time() >= t1, should_stop, timeout=None,
+                   interval=check_interval, max_interval=check_interval)
 
     def program_sweep(self, temperatures, sweep_time, hold_time, steps=None):
         """
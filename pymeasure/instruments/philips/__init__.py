@@ -1 +1,5 @@
-from .PM6669 import PM6669
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".PM6669": ["PM6669"],
+})
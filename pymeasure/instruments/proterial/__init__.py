@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .rod4 import ROD4
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".rod4": ["ROD4"],
+})
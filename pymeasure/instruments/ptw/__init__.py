@@ -22,5 +22,9 @@
 # THE SOFTWARE.
 #
 
-from .ptwDIAMENTOR import ptwDIAMENTOR
-from .ptwUNIDOS import ptwUNIDOS
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".ptwDIAMENTOR": ["ptwDIAMENTOR"],
+    ".ptwUNIDOS": ["ptwUNIDOS"],
+})
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .racal1992 import Racal1992
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".racal1992": ["Racal1992"],
+})
@@ -1 +1,5 @@
-from .redpitaya_scpi import RedPitayaScpi
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".redpitaya_scpi": ["RedPitayaScpi"],
+})
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .rigol_dg800 import DG800
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".rigol_dg800": ["DG800"],
+})
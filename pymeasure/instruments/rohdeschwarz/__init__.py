@@ -22,6 +22,10 @@
 # THE SOFTWARE.
 #
 
-from .fsseries import FSL, FSW
-from .hmp import HMP4040
-from .sfm import SFM
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".fsseries": ["FSL", "FSW"],
+    ".hmp": ["HMP4040"],
+    ".sfm": ["SFM"],
+})
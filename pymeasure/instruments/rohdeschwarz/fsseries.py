@@ -263,7 +263,7 @@ class FSL(FSSeries):
         :param n_trace: The trace number (1-6). Default is 1.
         :return: 2d numpy array of the trace data, [[frequency], [amplitude]].
         """
-        y = np.array(self.values(f"TRAC{n_trace}? TRACE{n_trace}"))
+        y = self.values(f"TRAC{n_trace}? TRACE{n_trace}", as_array=True)
         x = np.linspace(self.freq_start, self.freq_stop, len(y))
         return np.array([x, y])
 
@@ -286,7 +286,7 @@ class FSW(FSSeries):
         :param n_trace: The trace number (1-6). Default is 1.
         :return: 2d numpy array of the trace data, [[frequency], [amplitude]].
         """
-        trace_data = np.array(self.values(f"TRAC{n_trace}? TRACE{n_trace}"))
+        trace_data = self.values(f"TRAC{n_trace}? TRACE{n_trace}", as_array=True)
         if self.available_channels.get(self.active_channel) == "PNOISE":
             y = trace_data[1::2]
             x = trace_data[0::2]
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .tsl570 import TSL570
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".tsl570": ["TSL570"],
+})
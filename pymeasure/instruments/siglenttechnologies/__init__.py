@@ -22,6 +22,10 @@
 # THE SOFTWARE.
 #
 
-from .siglent_spd1168x import SPD1168X
-from .siglent_spd1305x import SPD1305X
-from .siglent_sds1072cml import SDS1072CML
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".siglent_spd1168x": ["SPD1168X"],
+    ".siglent_spd1305x": ["SPD1305X"],
+    ".siglent_sds1072cml": ["SDS1072CML"],
+})
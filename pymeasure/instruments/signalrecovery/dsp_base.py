@@ -27,7 +27,6 @@
 # =============================================================================
 
 import logging
-from time import sleep, time
 import numpy as np
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import modular_range_bidirectional
@@ -539,12 +538,15 @@ class DSPBase(Instrument):
 
     def wait_for_buffer(self, timeout=None, delay=0.1):
         """ Method that waits until the curve buffer is filled
+
+        The buffer status is checked with increasing intervals, starting at
+        `delay`. Returns silently after `timeout` seconds, if it is not None.
         """
-        start = time()
-        while self.curve_buffer_status[0] == 1:
-            sleep(delay)
-            if timeout is not None and time() < start + timeout:
-                break
+        try:
+            self.wait_for_condition(lambda: self.curve_buffer_status[0] != 1, timeout=timeout,
+                                    interval=delay, max_interval=max(delay, 1))
+        except TimeoutError:
+            log.warning("Timed out waiting for the curve buffer.")
 
     def get_buffer(self, quantity=None,
                    convert_to_float=True, wait_for_buffer=True):
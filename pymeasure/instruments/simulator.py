@@ -0,0 +1,338 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import inspect
+import logging
+import os
+import re
+import select
+import socketserver
+import threading
+import time
+from dataclasses import dataclass
+
+from .common_base import DynamicProperty
+
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+# Printf-style format specifiers of set commands, see `CommonBase.control`.
+_FORMAT_SPECIFIER = re.compile(r"%[-+ #0]*(?:\d+|\*)?(?:\.(?:\d+|\*))?[diouxXeEfFgGcrsa]")
+
+
+def _normalize(command):
+    """Return the SCPI command without surrounding whitespace, semicolons and leading colons."""
+    return command.strip().strip(";").strip().lstrip(":")
+
+
+def _parse(text):
+    """Return `text` as int or float, if possible, otherwise unchanged."""
+    for cast in (int, float):
+        try:
+            return cast(text)
+        except ValueError:
+            pass
+    return text
+
+
+@dataclass
+class SimulatedProperty:
+    """Commands and valid values of a property, derived from an instrument class."""
+
+    name: str
+    get_command: str = None
+    set_command: str = None
+    values: object = ()
+    map_values: bool = False
+    validator: object = None
+
+    def default(self):
+        """Return the initial state as it would be written by the instrument class."""
+        values = self.values
+        if self.map_values:
+            if isinstance(values, dict):
+                return str(next(iter(values.values()), 0))
+            return "0"
+        if isinstance(values, (list, tuple, range)) and len(values) > 0:
+            return str(values[0])
+        return "0"
+
+    def set_commands(self):
+        """Return the regular expression matching the set command and capturing its argument,
+        and the list of further fixed commands of a compound set command."""
+        parts = [_normalize(part) for part in self.set_command.split(";") if part.strip()]
+        variable = [part for part in parts if _FORMAT_SPECIFIER.search(part)]
+        main = variable[-1] if variable else parts[-1]
+        return self._pattern(main), [part for part in parts if part not in variable + [main]]
+
+    @staticmethod
+    def _pattern(command):
+        specifiers = list(_FORMAT_SPECIFIER.finditer(command))
+        if not specifiers:
+            return re.compile(re.escape(command.replace("%%", "%")) + "()$", re.IGNORECASE)
+        prefix = command[:specifiers[0].start()].replace("%%", "%")
+        suffix = command[specifiers[-1].end():].replace("%%", "%")
+        return re.compile(re.escape(prefix) + "(.+?)" + re.escape(suffix.strip()) + r"\s*$",
+                          re.IGNORECASE)
+
+
+def derive_properties(instrument_class):
+    """Return the :class:`SimulatedProperty` of each property of `instrument_class`, which is
+    created by :meth:`~pymeasure.instruments.common_base.CommonBase.control`,
+    :meth:`~pymeasure.instruments.common_base.CommonBase.measurement` or
+    :meth:`~pymeasure.instruments.common_base.CommonBase.setting`.
+
+    Properties with channel placeholders (e.g. ``{ch}``) in their commands are skipped.
+    """
+    properties = []
+    for name, prop in inspect.getmembers(instrument_class, lambda p: isinstance(p, property)):
+        parameters = {}
+        for function in (prop.fget, prop.fset):
+            if function is None:
+                continue
+            for key, parameter in inspect.signature(function).parameters.items():
+                if parameter.default is not inspect.Parameter.empty:
+                    parameters.setdefault(key, parameter.default)
+        if "get_command" not in parameters and "set_command" not in parameters:
+            continue  # not created by `control`
+        if isinstance(prop, DynamicProperty):
+            for key in parameters:
+                parameters[key] = getattr(instrument_class, f"{name}_{key}", parameters[key])
+        get_command = parameters.get("get_command")
+        set_command = parameters.get("set_command")
+        if any("{" in c for c in (get_command, set_command) if isinstance(c, str)):
+            continue
+        properties.append(SimulatedProperty(
+            name=name,
+            get_command=get_command or None,
+            set_command=set_command or None,
+            values=parameters.get("values", ()),
+            map_values=parameters.get("map_values", False),
+            validator=parameters.get("validator"),
+        ))
+    return properties
+
+
+class SimulatedDevice:
+    """Stateful simulation of an instrument, derived from the properties of its class.
+
+    Set commands store their argument, which the corresponding get command returns.
+    Arguments rejected by the validator of the property are not stored, but queue an error,
+    which is returned by ``SYST:ERR?``.
+    The common commands ``*IDN?``, ``*RST``, ``*CLS``, ``*OPC?``, ``*ESR?`` and ``*STB?`` are
+    answered as well. Compound messages (separated by ``;``) are supported.
+
+    :param instrument_class: The instrument class to simulate.
+    :param float latency: Time in s before a response is returned.
+    """
+
+    def __init__(self, instrument_class, latency=0):
+        self.instrument_class = instrument_class
+        self.latency = latency
+        self.properties = derive_properties(instrument_class)
+        self._lock = threading.Lock()
+        self._getters = {}
+        self._setters = []
+        self._fixed = set()  # further commands of compound set commands, which are ignored
+        for prop in self.properties:
+            if prop.get_command is not None:
+                self._getters.setdefault(_normalize(prop.get_command).upper(), prop)
+            if prop.set_command is not None:
+                pattern, fixed = prop.set_commands()
+                self._setters.append((pattern, prop))
+                self._fixed.update(command.upper() for command in fixed)
+        # Match the most specific commands first.
+        self._setters.sort(key=lambda s: len(s[0].pattern), reverse=True)
+        self._builtins = {
+            "*IDN?": lambda: f"PyMeasure,Simulated {instrument_class.__name__},0,0",
+            "*OPC?": lambda: "1",
+            "*ESR?": lambda: "0",
+            "*STB?": lambda: "0",
+            "*RST": self.reset,
+            "*CLS": self.errors_clear,
+            "*OPC": lambda: None,
+            "SYST:ERR?": self._next_error,
+            "SYST:ERR:NEXT?": self._next_error,
+            "SYSTEM:ERROR?": self._next_error,
+        }
+        self.reset()
+
+    def reset(self):
+        """Reset the state of all properties to their defaults and clear the errors."""
+        self.state = {prop.name: prop.default() for prop in self.properties}
+        self.errors = []
+
+    def errors_clear(self):
+        """Clear the error queue."""
+        self.errors = []
+
+    def _next_error(self):
+        return self.errors.pop(0) if self.errors else '0,"No error"'
+
+    def handle(self, message):
+        """Process a message and return the response or None, if there is nothing to respond.
+
+        :param str message: Message without termination.
+        """
+        responses = []
+        with self._lock:
+            for command in message.split(";"):
+                if command.strip():
+                    response = self._handle_command(_normalize(command))
+                    if response is not None:
+                        responses.append(response)
+        if not responses:
+            return None
+        if self.latency:
+            time.sleep(self.latency)
+        return ";".join(responses)
+
+    def _handle_command(self, command):
+        builtin = self._builtins.get(command.upper())
+        if builtin is not None:
+            return builtin()
+        prop = self._getters.get(command.upper())
+        if prop is not None:
+            return self.state[prop.name]
+        if command.upper() in self._fixed:
+            return None
+        for pattern, prop in self._setters:
+            match = pattern.match(command)
+            if match:
+                self._set(prop, match.group(1).strip())
+                return None
+        self.errors.append('-113,"Undefined header"')
+        log.debug("Simulated %s: undefined command '%s'.",
+                  self.instrument_class.__name__, command)
+        return None
+
+    def _set(self, prop, argument):
+        if not prop.map_values and prop.validator is not None and prop.values:
+            try:
+                prop.validator(_parse(argument), prop.values)
+            except (ValueError, TypeError):
+                self.errors.append('-222,"Data out of range"')
+                return
+        self.state[prop.name] = argument
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Handle the messages of one TCP connection."""
+
+    def handle(self):
+        device = self.server.device
+        termination = self.server.termination.encode()
+        for line in self.rfile:
+            response = device.handle(line.decode(errors="replace").rstrip("\r\n"))
+            if response is not None:
+                self.wfile.write(response.encode() + termination)
+
+
+class _ThreadingTCPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class SimulatorServer:
+    """Serve a :class:`SimulatedDevice` over a local TCP socket or a pseudo terminal (pty).
+
+    Connect to the TCP server with the :attr:`resource_name` (VISA) or :attr:`address`
+    (socket), and to the pty with a serial adapter at :attr:`port`.
+
+    .. code::
+
+        with SimulatorServer(Keithley2400, latency=0.002, pty=True) as server:
+            instrument = Keithley2400(SerialAdapter(server.port))
+            instrument.source_voltage = 5
+
+    :param instrument_class: The instrument class to simulate.
+    :param float latency: Time in s before a response is returned.
+    :param bool pty: Serve over a pseudo terminal (POSIX only) instead of TCP.
+    :param str host: Host address of the TCP server.
+    :param int port: TCP port, 0 selects a free port.
+    :param str termination: Termination character of the responses.
+    """
+
+    def __init__(self, instrument_class, latency=0, pty=False, host="127.0.0.1", port=0,
+                 termination="\n"):
+        self.device = SimulatedDevice(instrument_class, latency=latency)
+        self.termination = termination
+        self._server = None
+        self._pty = None
+        self._stop = threading.Event()
+        if pty:
+            self._pty = os.openpty()
+            self.port = os.ttyname(self._pty[1])
+            self._thread = threading.Thread(target=self._serve_pty, daemon=True)
+        else:
+            self._server = _ThreadingTCPServer((host, port), _Handler)
+            self._server.device = self.device
+            self._server.termination = termination
+            self.address = self._server.server_address
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def resource_name(self):
+        """VISA resource name of the TCP server."""
+        return f"TCPIP::{self.address[0]}::{self.address[1]}::SOCKET"
+
+    def _serve_pty(self):
+        import tty
+        master = self._pty[0]
+        tty.setraw(self._pty[1])
+        buffer = b""
+        while not self._stop.is_set():
+            if not select.select([master], [], [], 0.05)[0]:
+                continue
+            try:
+                data = os.read(master, 4096)
+            except OSError:
+                return
+            buffer += data
+            *lines, buffer = buffer.replace(b"\r", b"").split(b"\n")
+            for line in lines:
+                response = self.device.handle(line.decode(errors="replace"))
+                if response is not None:
+                    os.write(master, (response + self.termination).encode())
+
+    def close(self):
+        """Stop serving."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._pty is not None:
+            self._stop.set()
+            self._thread.join()
+            for fd in self._pty:
+                os.close(fd)
+            self._pty = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
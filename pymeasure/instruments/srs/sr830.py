@@ -565,13 +565,18 @@ class SR830(Instrument):
     def wait_for_buffer(self, count, has_aborted=lambda: False,
                         timeout=60, timestep=0.01):
         """ Wait for the buffer to fill a certain count
+
+        The buffer count is checked with increasing intervals, starting at
+        `timestep`. The buffer is paused afterwards, also after a timeout.
+
+        :return: False if aborted, None otherwise.
         """
-        i = 0
-        while not self.buffer_count >= count and i < (timeout / timestep):
-            time.sleep(timestep)
-            i += 1
-            if has_aborted():
+        try:
+            if not self.wait_for_condition(lambda: self.buffer_count >= count, has_aborted,
+                                           timeout, timestep, max_interval=max(timestep, 1)):
                 return False
+        except TimeoutError:
+            pass  # Pause the buffer with whatever it acquired so far.
         self.pause_buffer()
 
     def get_buffer(self, channel=1, start=0, end=None):
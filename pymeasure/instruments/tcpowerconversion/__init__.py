@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .tccxn import CXN
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".tccxn": ["CXN"],
+})
@@ -22,5 +22,9 @@
 # THE SOFTWARE.
 #
 
-from .tds2000 import TDS2000
-from .afg3152c import AFG3152C
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".tds2000": ["TDS2000"],
+    ".afg3152c": ["AFG3152C"],
+})
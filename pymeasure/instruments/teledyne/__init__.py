@@ -22,6 +22,10 @@
 # THE SOFTWARE.
 #
 
-from .teledyneT3AFG import TeledyneT3AFG
-from .teledyne_oscilloscope import TeledyneOscilloscope
-from .teledyneMAUI import TeledyneMAUI
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".teledyneT3AFG": ["TeledyneT3AFG"],
+    ".teledyne_oscilloscope": ["TeledyneOscilloscope"],
+    ".teledyneMAUI": ["TeledyneMAUI"],
+})
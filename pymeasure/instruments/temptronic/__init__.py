@@ -22,7 +22,11 @@
 # THE SOFTWARE.
 #
 
-from .temptronic_base import ATSBase
-from .temptronic_ats525 import ATS525
-from .temptronic_ats545 import ATS545
-from .temptronic_eco560 import ECO560
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".temptronic_base": ["ATSBase"],
+    ".temptronic_ats525": ["ATS525"],
+    ".temptronic_ats545": ["ATS545"],
+    ".temptronic_eco560": ["ECO560"],
+})
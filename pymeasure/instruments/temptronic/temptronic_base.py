@@ -39,7 +39,7 @@ No automatic safety measures are part of this driver implementation.
 """
 import logging
 import time
-from pymeasure.instruments import Instrument, SCPIUnknownMixin
+from pymeasure.instruments import Instrument, SCPIUnknownMixin, wait_until
 from pymeasure.instruments.validators import (strict_discrete_set,
                                               truncated_range,
                                               strict_range
@@ -707,42 +707,44 @@ class ATSBase(SCPIUnknownMixin, Instrument):
 
         return self
 
-    def wait_for_settling(self, time_limit=300):
+    def wait_for_settling(self, time_limit=300, should_stop=lambda: False):
         """block script execution until TS is settled.
 
         :param time_limit:
             set the maximum blocking time within TS has to settle (float).
+        :param should_stop:
+            function returning ``True`` in order to stop waiting early.
 
         :returns: self
 
         Script execution is blocked until either TS has settled
-        or time_limit has been exceeded (float).
+        or time_limit has been exceeded (float). The state is checked in
+        increasing intervals up to one second.
         """
 
         time.sleep(1)
-        t = 0
         t_start = time.time()
-        while not self.at_temperature():  # assert at temperature
-            time.sleep(1)
-            t = time.time() - t_start
 
+        def settled():
             tstatus = self.temperature_condition_status_code
-
-            message = ("temp_set= %4.1f deg, "
-                       "temp= %4.1f deg, "
-                       "time= %.2f s, "
-                       "status= %s"
-                       )
-
-            log.info(message,
-                     self.temperature_setpoint,
-                     self.temperature,
-                     t,
-                     tstatus)
-
-            if t > time_limit:
-                log.info('no settling achieved')
-                break
+            if TemperatureStatusCode.AT_TEMPERATURE in tstatus:
+                return True
+            if log.isEnabledFor(logging.INFO):
+                log.info("temp_set= %4.1f deg, "
+                         "temp= %4.1f deg, "
+                         "time= %.2f s, "
+                         "status= %s",
+                         self.temperature_setpoint,
+                         self.temperature,
+                         time.time() - t_start,
+                         tstatus)
+            return False
+
+        try:
+            wait_until(settled, should_stop, time_limit, interval=0.25, max_interval=1,
+                       description="TS to settle")
+        except TimeoutError:
+            log.info('no settling achieved')
         log.info('finished this temperature point')
 
         return self
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .texioPSW360L30 import TexioPSW360L30
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".texioPSW360L30": ["TexioPSW360L30"],
+})
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .thermotron3800 import Thermotron3800
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".thermotron3800": ["Thermotron3800"],
+})
@@ -22,4 +22,8 @@
 # THE SOFTWARE.
 #
 
-from .ibeamsmart import IBeamSmart
+from pymeasure.lazy import lazy_attributes
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+    ".ibeamsmart": ["IBeamSmart"],
+})
@@ -22,6 +22,7 @@
 # THE SOFTWARE.
 #
 
+from bisect import bisect_left
 from decimal import Decimal
 
 
@@ -35,11 +36,12 @@ def strict_range(value, values):
     :param values: A range of values (range, list, etc.)
     :raises: ValueError if the value is out of the range
     """
-    if min(values) <= value <= max(values):
+    low, high = min(values), max(values)
+    if low <= value <= high:
         return value
     else:
         raise ValueError('Value of {:g} is not in range [{:g},{:g}]'.format(
-            value, min(values), max(values)
+            value, low, high
         ))
 
 
@@ -89,12 +91,13 @@ def truncated_range(value, values):
     :param value: A value to test
     :param values: A set of values that are valid
     """
-    if min(values) <= value <= max(values):
+    low, high = min(values), max(values)
+    if low <= value <= high:
         return value
-    elif value > max(values):
-        return max(values)
+    elif value > high:
+        return high
     else:
-        return min(values)
+        return low
 
 
 def modular_range(value, values):
@@ -131,13 +134,9 @@ def truncated_discrete_set(value, values):
     :param values: A set of values that are valid
     """
     # Force the values to be sorted
-    values = list(values)
-    values.sort()
-    for v in values:
-        if value <= v:
-            return v
-
-    return values[-1]
+    values = sorted(values)
+    index = bisect_left(values, value)
+    return values[index] if index < len(values) else values[-1]
 
 
 def joined_validators(*validators):
@@ -178,6 +177,100 @@ def joined_validators(*validators):
     return validate
 
 
+def _compile_strict_range(values):
+    low, high = min(values), max(values)
+
+    def validate(value):
+        if low <= value <= high:
+            return value
+        raise ValueError('Value of {:g} is not in range [{:g},{:g}]'.format(value, low, high))
+    return validate
+
+
+def _compile_truncated_range(values):
+    low, high = min(values), max(values)
+
+    def validate(value):
+        if low <= value <= high:
+            return value
+        return high if value > high else low
+    return validate
+
+
+def _compile_strict_discrete_set(values):
+    members = values
+    if isinstance(values, (list, tuple)):
+        try:
+            members = frozenset(values)
+        except TypeError:
+            pass  # unhashable elements, search the sequence
+
+    def validate(value):
+        try:
+            valid = value in members
+        except TypeError:  # unhashable value
+            valid = value in values
+        if valid:
+            return value
+        raise ValueError('Value of {} is not in the discrete set {}'.format(value, values))
+    return validate
+
+
+def _compile_truncated_discrete_set(values):
+    ordered = sorted(values)
+
+    def validate(value):
+        index = bisect_left(ordered, value)
+        return ordered[index] if index < len(ordered) else ordered[-1]
+    return validate
+
+
+def _compile_modular_range(values):
+    high = max(values)
+    return lambda value: value % high
+
+
+def _compile_modular_range_bidirectional(values):
+    high = max(values)
+    return lambda value: value % high if value > 0 else -1 * (abs(value) % high)
+
+
+_COMPILERS = {
+    strict_range: _compile_strict_range,
+    truncated_range: _compile_truncated_range,
+    strict_discrete_set: _compile_strict_discrete_set,
+    truncated_discrete_set: _compile_truncated_discrete_set,
+    modular_range: _compile_modular_range,
+    modular_range_bidirectional: _compile_modular_range_bidirectional,
+}
+
+
+def compile_validator(validator, values):
+    """Return a function ``validate(value)``, which returns ``validator(value, values)``.
+
+    For the validators of this module, the work depending only on ``values``, like finding the
+    bounds or sorting them, is done once beforehand. Other validators are called as they are.
+    ``values`` must not be modified afterwards.
+
+    :Example:
+
+    >>> from pymeasure.instruments.validators import compile_validator, truncated_discrete_set
+    >>> validate = compile_validator(truncated_discrete_set, [10, 1, 100])
+    >>> validate(5)
+    10
+
+    :param validator: A validator function like :func:`strict_range`.
+    :param values: The valid values for the validator.
+    """
+    compiler = _COMPILERS.get(validator)
+    if compiler is not None:
+        try:
+            return compiler(values)
+        except (TypeError, ValueError):
+            pass  # for example empty values, let the validator raise when it is called
+    return lambda value: validator(value, values)
+
+
 def discreteTruncate(number, discreteSet):
     """ Truncates the number to the closest element in the positive discrete set.
     Returns False if the number is larger than the maximum value or negative.
@@ -0,0 +1,91 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import time
+
+
+def wait_until(condition, should_stop=lambda: False, timeout=60, interval=0.01,
+               max_interval=1, pause=None, description="the condition"):
+    """Wait until `condition` is met, checking it in increasing intervals.
+
+    Each interval is twice as long as the previous one, up to `max_interval`. Short actions
+    are therefore noticed quickly, while long ones (e.g. settling of a temperature) do not
+    cause more queries than checking every `max_interval` seconds. The last interval is
+    shortened to end at the deadline.
+
+    .. code::
+
+        magnet.ramp_to_target()
+        wait_until(lambda: magnet.sweep_status == "at rest", timeout=600, max_interval=1)
+
+    Use :func:`all_of` to wait for several instruments at once.
+
+    :param condition: Callable returning True once the waiting is done.
+    :param should_stop: Callable returning True in order to stop waiting early.
+    :param timeout: Maximum waiting time in seconds, None waits indefinitely.
+    :param interval: Initial time between two checks in seconds.
+    :param max_interval: Maximum time between two checks in seconds.
+    :param pause: Callable, which gets the duration of an interval and waits at most that
+        long, by default :func:`time.sleep`.
+    :param description: Description of what is waited for, used in the timeout message.
+    :returns: True if the condition is met, False if `should_stop` returned True.
+    :raises TimeoutError: If the condition is not met within `timeout`.
+    """
+    if pause is None:
+        pause = time.sleep
+    deadline = None if timeout is None else time.monotonic() + timeout
+    interval = min(interval, max_interval)
+    while not condition():
+        if should_stop():
+            return False
+        delay = interval
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"Timed out after {timeout} s waiting for {description}.")
+            delay = min(delay, remaining)
+        interval = min(2 * interval, max_interval)
+        pause(delay)
+    return True
+
+
+def all_of(*conditions):
+    """Return a condition, which is met once each of the `conditions` has been met.
+
+    This allows to wait for several instruments in one thread with :func:`wait_until`.
+    A condition, which has been met once, is not checked again, which saves queries.
+
+    .. code::
+
+        wait_until(all_of(lambda: magnet.sweep_status == "at rest",
+                          lambda: abs(itc.temperature_error) < 0.01))
+
+    :param conditions: Callables returning True once the waiting for them is done.
+    """
+    pending = list(conditions)
+
+    def condition():
+        pending[:] = [c for c in pending if not c()]
+        return not pending
+    return condition
@@ -22,7 +22,6 @@
 # THE SOFTWARE.
 
 import logging
-from time import time
 
 from pymeasure.instruments import Instrument, SCPIMixin
 from pymeasure.instruments.channel import Channel
@@ -133,19 +132,9 @@ class AQ6370Series(SCPIMixin, Instrument):
         :param should_stop: Function that returns True to stop waiting.
         :param timeout: Maximum waiting time, in seconds.
         :return: True when sweep completed, False if stopped by should_stop.
-        :raises TimeoutError: If the temperature does not stabilize within the timeout period.
+        :raises TimeoutError: If the sweep does not complete within the timeout period.
         """
-
-        t0 = time()
-        while not self.sweep_complete:
-
-            if should_stop():
-                return False
-
-            if time() - t0 > timeout:
-                raise TimeoutError("Timed out waiting for sweep to run.")
-
-        return True
+        return self.wait_for_condition(lambda: self.sweep_complete, should_stop, timeout)
 
     # Leveling -------------------------------------------------------------------------------------
 
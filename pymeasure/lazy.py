@@ -0,0 +1,63 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import importlib
+import sys
+
+
+def lazy_attributes(package, submodules):
+    """Return the ``__getattr__``, ``__dir__`` and ``__all__`` of a package, which imports the
+    attributes from their submodules only when they are accessed the first time.
+
+    That keeps ``from pymeasure.instruments.extreme import Extreme5000`` working, while importing
+    the package does not import all the modules of the package and their dependencies.
+
+    .. code-block:: python
+
+        __getattr__, __dir__, __all__ = lazy_attributes(__name__, {
+            ".extreme5000": ["Extreme5000"],
+            ".extreme6000": ["Extreme6000", "Extreme6001"],
+        })
+
+    :param package: Name of the package, i.e. its ``__name__``.
+    :param submodules: Dictionary of the relative names of the submodules and a list of the
+        names of the attributes imported from them.
+    """
+    origins = {name: submodule for submodule, names in submodules.items() for name in names}
+
+    def __getattr__(name):
+        try:
+            submodule = origins[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(submodule, package), name)
+        # Store the attribute in the package, such that it is looked up directly next time.
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(origins))
+
+    return __getattr__, __dir__, list(origins)
@@ -23,8 +23,10 @@
 #
 
 import logging
+import threading
 from unittest import mock
 
+import numpy as np
 import pytest
 
 from pymeasure.adapters import Adapter, FakeAdapter, ProtocolAdapter
@@ -56,6 +58,30 @@ def test_del(adapter):
     assert adapter.connection.method_calls == [mock.call.close()]
 
 
+def test_transaction_is_reentrant(adapter):
+    with adapter.transaction():
+        with adapter.transaction():
+            pass
+
+
+def test_transaction_blocks_other_threads(fake):
+    events = []
+
+    def write():
+        fake.write("other")
+        events.append("other")
+
+    with fake.transaction():
+        thread = threading.Thread(target=write)
+        thread.start()
+        thread.join(0.05)
+        fake.write("own")
+        events.append("own")
+    thread.join(1)
+    assert events == ["own", "other"]
+    assert fake._buffer == "ownother"
+
+
 def test_write(fake):
     fake.write("abc")
     assert fake._buffer == "abc"
@@ -91,6 +117,51 @@ def test_read_binary_values():
     assert list(a.read_binary_values(dtype=int, sep=" ")) == pytest.approx([1, 2])
 
 
+def test_read_bytes_into():
+    a = ProtocolAdapter([(None, b"abcdef")])
+    buffer = bytearray(4)
+    assert a.read_bytes_into(buffer) == 4
+    assert buffer == b"abcd"
+    assert a.read_bytes(-1) == b"ef"
+
+
+class TestReadBinaryValuesInto:
+    data = np.arange(5, dtype="<u2")
+
+    @pytest.mark.parametrize("response", (b"#210" + data.tobytes() + b"\n",
+                                          b"#0" + data.tobytes() + b"\n",
+                                          data.tobytes() + b"\n"))
+    def test_fill_buffer(self, response):
+        a = ProtocolAdapter([(None, response)])
+        out = np.zeros(5, dtype="<u2")
+        assert a.read_binary_values(out=out, termination_bytes=-1) is out
+        assert list(out) == [0, 1, 2, 3, 4]
+        assert a._read_buffer is None  # termination consumed
+
+    def test_header_bytes(self):
+        a = ProtocolAdapter([(None, b"HEAD" + self.data.tobytes())])
+        out = np.zeros(5, dtype="<u2")
+        a.read_binary_values(header_bytes=4, out=out)
+        assert list(out) == [0, 1, 2, 3, 4]
+
+    def test_shorter_block_returns_view(self):
+        a = ProtocolAdapter([(None, b"#14" + self.data[:2].tobytes())])
+        out = np.zeros((2, 5), dtype="<u2")
+        values = a.read_binary_values(out=out)
+        assert list(values) == [0, 1]
+        assert np.shares_memory(values, out)
+
+    def test_block_too_large(self):
+        a = ProtocolAdapter([(None, b"#220" + bytes(20))])
+        with pytest.raises(ValueError, match="does not fit"):
+            a.read_binary_values(out=np.zeros(5, dtype="<u2"))
+
+    def test_invalid_header(self):
+        a = ProtocolAdapter([(None, b"#x")])
+        with pytest.raises(ValueError, match="Invalid"):
+            a.read_binary_values(out=np.zeros(5))
+
+
 def test_write_binary_values():
     """Test write_binary_values in the ieee header format."""
     a = ProtocolAdapter([(b'CMD#212\x00\x00\x80?\x00\x00\x00@\x00\x00@@\n', None)])
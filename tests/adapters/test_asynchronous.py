@@ -0,0 +1,105 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import asyncio
+import threading
+
+import pytest
+import serial
+
+from pymeasure.adapters import (AsyncAdapter, AsyncProtocolAdapter, AsyncSerialAdapter,
+                                ProtocolAdapter, SerialAdapter)
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+@pytest.fixture
+def adapter():
+    return AsyncAdapter(ProtocolAdapter([("abc", "def"), ("ghi", "1 2")]))
+
+
+def test_write_read(adapter):
+    async def communicate():
+        await adapter.write("abc")
+        return await adapter.read()
+    assert run(communicate()) == "def"
+
+
+def test_read_binary_values(adapter):
+    async def communicate():
+        await adapter.write("abc")
+        await adapter.read_bytes(-1)
+        await adapter.write("ghi")
+        return await adapter.read_binary_values(dtype=int, sep=" ")
+    assert list(run(communicate())) == pytest.approx([1, 2])
+
+
+def test_run_uses_worker_thread(adapter):
+    thread = run(adapter.run(threading.current_thread))
+    assert thread is not threading.current_thread()
+    assert thread.name.startswith("AsyncAdapter")
+
+
+def test_run_keeps_worker_thread(adapter):
+    async def communicate():
+        return {await adapter.run(threading.get_ident) for i in range(5)}
+    assert len(run(communicate())) == 1
+
+
+def test_close(adapter):
+    adapter.adapter.connection = connection = adapter.connection
+    adapter.close()
+    connection.close.assert_called_once_with()
+    with pytest.raises(RuntimeError):
+        run(adapter.run(print))
+
+
+def test_protocol_adapter_runs_inline():
+    adapter = AsyncProtocolAdapter([("abc", "def")])
+    assert run(adapter.run(threading.current_thread)) is threading.current_thread()
+    assert run(adapter.run(adapter.adapter.write, "abc")) is None
+    assert run(adapter.read()) == "def"
+
+
+def test_serial_adapter():
+    adapter = AsyncSerialAdapter(serial.serial_for_url("loop://", timeout=0.2),
+                                 read_termination="\n")
+    assert isinstance(adapter.adapter, SerialAdapter)
+
+    async def communicate():
+        await adapter.write("abc\n")
+        return await adapter.read()
+    assert run(communicate()) == "abc"
+
+
+def test_adapters_overlap():
+    """Blocking calls of different adapters do not block each other."""
+    barrier = threading.Barrier(2, timeout=5)
+    adapters = [AsyncAdapter(ProtocolAdapter()) for i in range(2)]
+
+    async def communicate():
+        await asyncio.gather(*(a.run(barrier.wait) for a in adapters))
+    run(communicate())
@@ -22,9 +22,15 @@
 # THE SOFTWARE.
 #
 
+import socket
+import threading
+
+import numpy as np
 import pytest
 
-from pymeasure.adapters import PrologixAdapter
+from pymeasure.adapters import PrologixAdapter, PrologixEthernetAdapter
+from pymeasure.adapters.prologix import _escape
+from pymeasure.adapters import ProtocolAdapter
 from pymeasure.test import expected_protocol
 
 
@@ -88,6 +94,86 @@ def test_write_address():
         adapter.write("something")
 
 
+def test_address_sent_once():
+    with expected_protocol(
+            PrologixAdapter,
+            init_comm + [("++addr 5", None), ("a", None), ("b", None), ("++read eoi", "c")],
+            address=5,
+    ) as adapter:
+        adapter.write("a")
+        adapter.write("b")
+        assert adapter.read() == "c"
+
+
+def test_address_switching_between_shared_adapters():
+    with expected_protocol(
+            PrologixAdapter,
+            init_comm + [("++addr 5", None), ("a", None),
+                         ("++addr 9", None), ("b", None), ("c", None),
+                         ("++addr 5", None), ("d", None)],
+            address=5,
+    ) as adapter:
+        other = adapter.gpib(9)
+        adapter.write("a")
+        other.write("b")
+        other.write("c")
+        adapter.write("d")
+
+
+def test_address_switching_between_adapters_on_one_connection():
+    connection = ProtocolAdapter(init_comm * 2 + [
+        ("++addr 5", None), ("a", None),
+        ("++addr 7", None), ("b", None),
+        ("++addr 5", None), ("c", None)])
+    first = PrologixAdapter(connection, 5)
+    second = PrologixAdapter(connection, 7)
+    first.write("a")
+    second.write("b")
+    first.write("c")
+    assert connection._index == len(connection.comm_pairs)
+
+
+@pytest.mark.parametrize("command", ("++rst", "++addr 9"))
+def test_address_cache_invalidated(command):
+    with expected_protocol(
+            PrologixAdapter,
+            init_comm + [("++addr 5", None), ("a", None), (command, None),
+                         ("++addr 5", None), ("b", None)],
+            address=5,
+    ) as adapter:
+        adapter.write("a")
+        adapter.write(command)
+        adapter.write("b")
+
+
+def test_read_after_write_skips_read_command():
+    with expected_protocol(
+            PrologixAdapter,
+            [("++auto 1", None), ("++eoi 1", None), ("++eos 2", None),
+             ("write", None), (None, "response")],
+            auto=True,
+    ) as adapter:
+        adapter.write("write")
+        assert adapter.read() == "response"
+
+
+def test_run_grouped():
+    with expected_protocol(
+            PrologixAdapter,
+            init_comm + [("++addr 9", None), ("x", None), ("y", None),
+                         ("++addr 5", None), ("a", None), ("b", None)],
+            address=5,
+    ) as adapter:
+        other = adapter.gpib(9)
+        other.write("x")
+        results = adapter.run_grouped([
+            (adapter, lambda: adapter.write("a") or 1),
+            (other, lambda: other.write("y") or 2),
+            (adapter, lambda: adapter.write("b") or 3),
+        ])
+        assert results == [1, 2, 3]
+
+
 def test_read():
     with expected_protocol(
             PrologixAdapter,
@@ -122,10 +208,112 @@ def test_write_binary_values(test_input, expected):
         adapter.write_binary_values("OUTP", test_input, datatype='B')
 
 
+@pytest.mark.parametrize("auto, comm", ((False, [("++read eoi", b"#13\x01\x02\x03\n")]),
+                                        (True, [(None, b"#13\x01\x02\x03\n")])))
+def test_read_binary_values_into(auto, comm):
+    with expected_protocol(
+            PrologixAdapter,
+            [(f"++auto {auto:d}", None), ("++eoi 1", None), ("++eos 2", None)] + comm,
+            auto=auto,
+    ) as adapter:
+        out = np.zeros(3, dtype=np.uint8)
+        adapter.read_binary_values(out=out, termination_bytes=-1)
+        assert list(out) == [1, 2, 3]
+
+
 def test_wait_for_srq():
     with expected_protocol(
             PrologixAdapter,
             [("++auto 0", None), ("++eoi 1", None), ("++eos 2", None),
-             ("++srq", None), ("++read eoi", "0"), ("++srq", None), ("++read eoi", "1")]
+             ("++srq", "0"), ("++srq", "1")]
     ) as adapter:
-        adapter.wait_for_srq()
+        adapter.wait_for_srq(delay=0)
+
+
+def test_gpib_shares_lock():
+    pytest.importorskip("pyvisa_sim")
+    adapter = PrologixAdapter("ASRL2::INSTR", visa_library="@sim", read_termination="\n")
+    assert adapter.gpib(7).transaction() is adapter.transaction()
+    adapter.close()
+
+
+def test_shared_session_shares_controller_state():
+    pytest.importorskip("pyvisa_sim")
+    adapters = [PrologixAdapter("ASRL2::INSTR", address, visa_library="@sim",
+                                read_termination="\n", shared=True) for address in (5, 7)]
+    assert adapters[0]._controller is adapters[1]._controller
+    for adapter in adapters:
+        adapter.close()
+
+
+def test_escape_matches_bytewise_escaping():
+    block = bytes(range(256)) * 4
+    expected = b"".join(b"\x1b" + bytes((b,)) if b in b"\r\n\x1b+" else bytes((b,))
+                        for b in block)
+    assert _escape(block) == expected
+
+
+class TestEthernet:
+    @pytest.fixture
+    def pair(self):
+        """Return an adapter for GPIB address 5 and the socket of the controller side."""
+        ours, theirs = socket.socketpair()
+        adapter = PrologixEthernetAdapter(ours, 5, timeout=1)
+        assert theirs.recv(100) == b"++auto 0\n++eoi 1\n++eos 2\n"
+        yield adapter, theirs
+        adapter.close()
+        theirs.close()
+
+    def test_address_sent_with_command(self, pair):
+        adapter, controller = pair
+        adapter.write("a")
+        assert controller.recv(100) == b"++addr 5\na\n"
+        adapter.write("b")
+        assert controller.recv(100) == b"b\n"
+
+    def test_address_pipelined_with_read_request(self, pair):
+        adapter, controller = pair
+        other = adapter.gpib(9)
+        assert other._controller is adapter._controller
+        controller.sendall(b"2.5\n")
+        assert other.read() == "2.5"
+        assert controller.recv(100) == b"++addr 9\n++read eoi\n"
+
+    def test_controller_read_does_not_request_data(self, pair):
+        adapter, controller = pair
+        reply = threading.Timer(0.05, controller.sendall, (b"Version 6.0\n",))
+        reply.start()
+        assert adapter.version == "Version 6.0"
+        reply.join()
+        adapter.write("*IDN?")
+        reply = threading.Timer(0.05, controller.sendall, (b"ID\n",))
+        reply.start()
+        assert adapter.read() == "ID"
+        reply.join()
+        controller.settimeout(0.1)
+        sent = b""
+        try:
+            while True:
+                sent += controller.recv(100)
+        except socket.timeout:
+            pass
+        assert sent == b"++ver\n++addr 5\n*IDN?\n++read eoi\n"
+
+    def test_data_available_does_not_block(self, pair):
+        adapter, controller = pair
+        assert adapter._data_available() is False
+        controller.sendall(b"x")
+        assert adapter._data_available() is True
+
+    def test_write_binary_values_escaped(self, pair):
+        adapter, controller = pair
+        adapter.write_binary_values("OUTP", [43, 27, 10, 13, 97], datatype="B")
+        assert controller.recv(100) == b"++addr 5\nOUTP#15\x1b+\x1b\x1b\x1b\n\x1b\ra\n"
+
+    def test_read_binary_values_into(self, pair):
+        adapter, controller = pair
+        controller.sendall(b"#13\x01\x02\x03\n")
+        out = np.zeros(3, dtype=np.uint8)
+        adapter.read_binary_values(out=out, termination_bytes=-1)
+        assert list(out) == [1, 2, 3]
+        assert controller.recv(100) == b"++addr 5\n++read eoi\n"
@@ -0,0 +1,111 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import time
+
+import pytest
+import pyvisa
+
+from pymeasure.adapters import FakeAdapter, ProtocolAdapter, RecordingAdapter, ReplayAdapter
+from pymeasure.adapters.replay import load_recording
+from pymeasure.instruments import Instrument
+
+
+def run(adapter):
+    instr = Instrument(adapter, "test", includeSCPI=False)
+    voltage = instr.ask("VOLT?")
+    instr.write_bytes(b"DATA\xff")
+    data = instr.read_bytes(-1)
+    return voltage, data
+
+
+@pytest.fixture
+def recording():
+    adapter = RecordingAdapter(ProtocolAdapter([("VOLT?", "1.5"), (b"DATA\xff", b"\x00\xfe")]))
+    result = run(adapter)
+    assert result == ("1.5", b"\x00\xfe")
+    return adapter.messages
+
+
+def test_recorded_messages(recording):
+    assert [m[:2] for m in recording] == [["w", "VOLT?"], ["r", "1.5"],
+                                          ["wb", "DATA\xff"], ["rb", "\x00\xfe"]]
+    assert all(m[2] >= 0 for m in recording)
+
+
+@pytest.mark.parametrize("name", ("rec.json", "rec.json.gz"))
+def test_save_on_close(tmp_path, name):
+    path = tmp_path / name
+    adapter = RecordingAdapter(ProtocolAdapter([("VOLT?", "1.5"), (b"DATA\xff", b"\x00")]),
+                               file=path)
+    run(adapter)
+    adapter.close()
+    assert len(load_recording(path)) == 4
+    replay = ReplayAdapter(path, time_scale=0)
+    assert run(replay) == ("1.5", b"\x00")
+    assert replay.remaining == 0
+
+
+def test_replay(recording):
+    assert run(ReplayAdapter(recording, time_scale=0)) == ("1.5", b"\x00\xfe")
+
+
+def test_replay_mismatch(recording):
+    adapter = ReplayAdapter(recording, time_scale=0)
+    with pytest.raises(ValueError, match="does not match"):
+        adapter.write("CURR?")
+    with pytest.raises(ValueError, match="not a 'w' message"):
+        adapter.write("VOLT?")
+
+
+def test_replay_exhausted():
+    with pytest.raises(ValueError, match="No recorded message"):
+        ReplayAdapter([], time_scale=0).read()
+
+
+@pytest.mark.parametrize("time_scale, minimum, maximum",
+                         ((1, 0.1, 1), (0.5, 0.05, 0.09), (0, 0, 0.04)))
+def test_replay_timing(time_scale, minimum, maximum):
+    adapter = ReplayAdapter([["w", "A", 0.02], ["r", "B", 0.08]], time_scale=time_scale)
+    start = time.perf_counter()
+    adapter.write("A")
+    adapter.read()
+    assert minimum <= time.perf_counter() - start < maximum
+
+
+def test_timeout_recorded_and_replayed():
+    class TimeoutAdapter(FakeAdapter):
+        def _read(self, **kwargs):
+            raise pyvisa.errors.VisaIOError(pyvisa.constants.StatusCode.error_timeout)
+
+    adapter = RecordingAdapter(TimeoutAdapter())
+    adapter.write("X")
+    with pytest.raises(pyvisa.errors.VisaIOError):
+        adapter.read()
+    assert adapter.messages[1][0] == "t"
+    replay = ReplayAdapter(adapter.messages, time_scale=0)
+    replay.write("X")
+    with pytest.raises(TimeoutError):
+        replay.read()
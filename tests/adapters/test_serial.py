@@ -22,6 +22,7 @@
 # THE SOFTWARE.
 #
 
+import numpy as np
 import pytest
 import serial
 
@@ -92,3 +93,87 @@ def test_adapter_write_binary_values(adapter, test_input, expected):
     adapter.write_binary_values("OUTP", test_input, datatype='B')
     # Add 10 bytes more, just to check that no extra bytes are present
     assert adapter.connection.read(len(expected) + 10) == expected
+
+
+def test_read_bytes_into(adapter):
+    adapter.write_bytes(b"abcdef")
+    buffer = bytearray(4)
+    assert adapter.read_bytes_into(buffer) == 4
+    assert buffer == b"abcd"
+    assert adapter.read_bytes_into(buffer) == 2  # timeout
+
+
+def test_read_binary_values_into(adapter):
+    values = np.arange(100, dtype=">f4")
+    adapter.write_bytes(b"#3400" + values.tobytes() + b"\n")
+    out = np.empty(100, dtype=">f4")
+    assert adapter.read_binary_values(out=out, termination_bytes=-1) is out
+    assert np.array_equal(out, values)
+    assert adapter.read_bytes(-1) == b""
+
+
+class TestBufferedReading:
+    @pytest.fixture
+    def counted(self, adapter):
+        """Return the adapter and a list of the sizes requested from the port."""
+        sizes = []
+        read = adapter.connection.read
+
+        def counting_read(size=1):
+            sizes.append(size)
+            return read(size)
+        adapter.connection.read = counting_read
+        return adapter, sizes
+
+    def test_read_waiting_bytes_at_once(self, counted):
+        adapter, sizes = counted
+        adapter.read_termination = "\n"
+        adapter.write_bytes(b"1.5\n2.5\n")
+        assert adapter.read() == "1.5"
+        assert adapter.read() == "2.5"
+        assert sizes == [8]  # the second response was kept from the first read
+
+    def test_leftover_used_by_read_bytes(self, counted):
+        adapter, sizes = counted
+        adapter.read_termination = "\n"
+        adapter.write_bytes(b"abc\nFF")
+        assert adapter.read() == "abc"
+        assert adapter.read_bytes(2) == b"FF"
+        assert len(sizes) == 1
+
+    def test_termination_split_between_reads(self, adapter):
+        adapter.read_termination = "\r\n"
+        adapter.write_bytes(b"abc\r")
+        adapter._receive()  # the first part arrives before the termination is complete
+        adapter.write_bytes(b"\ndef\r\n")
+        assert adapter.read() == "abc"
+        assert adapter.read() == "def"
+
+    def test_read_bytes_into_uses_leftover(self, adapter):
+        adapter.read_termination = "\n"
+        adapter.write_bytes(b"x\nabcd")
+        assert adapter.read() == "x"
+        buffer = bytearray(4)
+        assert adapter.read_bytes_into(buffer) == 4
+        assert buffer == b"abcd"
+
+    def test_flush_read_buffer_discards_leftover(self, adapter):
+        adapter.read_termination = "\n"
+        adapter.write_bytes(b"a\nb\n")
+        adapter.read()
+        adapter.flush_read_buffer()
+        assert adapter.read_bytes(-1) == b""
+
+    def test_read_frame(self, adapter):
+        adapter.write_bytes(b"\x01\x03\x02\x00\x07\xaa\xbbrest")
+        assert adapter.read_frame(2, extra=2) == b"\x01\x03\x02\x00\x07\xaa\xbb"
+        assert adapter.read_bytes(4) == b"rest"
+
+    def test_read_frame_little_endian_length(self, adapter):
+        adapter.write_bytes(b"\x03\x00abc")
+        assert adapter.read_frame(0, 2, byteorder="little") == b"\x03\x00abc"
+
+    def test_read_frame_timeout(self, adapter):
+        adapter.write_bytes(b"\x05ab")
+        with pytest.raises(ConnectionError):
+            adapter.read_frame(0)
@@ -0,0 +1,168 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import socket
+import threading
+
+import numpy as np
+import pytest
+
+from pymeasure.adapters import SocketAdapter
+from pymeasure.instruments import Instrument
+from pymeasure.instruments.simulator import SimulatorServer
+
+
+@pytest.fixture
+def pair():
+    """Return an adapter and the socket of the instrument side."""
+    ours, theirs = socket.socketpair()
+    adapter = SocketAdapter(ours, timeout=1)
+    yield adapter, theirs
+    adapter.close()
+    theirs.close()
+
+
+def test_write(pair):
+    adapter, instrument = pair
+    adapter.write("VOLT 1")
+    assert instrument.recv(100) == b"VOLT 1\n"
+
+
+def test_read_splits_on_termination(pair):
+    adapter, instrument = pair
+    instrument.sendall(b"1.5\n2.5\n3")
+    assert adapter.read() == "1.5"
+    assert adapter.read() == "2.5"
+    instrument.sendall(b".5\n")
+    assert adapter.read() == "3.5"
+
+
+def test_read_termination_split_between_chunks(pair):
+    adapter, instrument = pair
+    adapter.read_termination = "\r\n"
+    instrument.sendall(b"abc\r")
+    thread = threading.Timer(0.05, instrument.sendall, (b"\ndef\r\n",))
+    thread.start()
+    assert adapter.read() == "abc"
+    assert adapter.read() == "def"
+
+
+def test_read_bytes_count(pair):
+    adapter, instrument = pair
+    instrument.sendall(b"abc\ndef")
+    assert adapter.read_bytes(5) == b"abc\nd"
+    assert adapter.read_bytes(2) == b"ef"
+
+
+@pytest.mark.parametrize("count", (-1, 10))
+def test_read_bytes_break_on_termchar(pair, count):
+    adapter, instrument = pair
+    instrument.sendall(b"abc\ndef\n")
+    assert adapter.read_bytes(count, break_on_termchar=True) == b"abc\n"
+
+
+def test_read_bytes_all_received(pair):
+    adapter, instrument = pair
+    instrument.sendall(b"abc\ndef")
+    assert adapter.read_bytes(-1) == b"abc\ndef"
+
+
+def test_read_block_in_bulk(pair):
+    adapter, instrument = pair
+    data = bytes(range(256)) * 1000
+    message = b"#6256000" + data + b"\n"
+    thread = threading.Thread(target=instrument.sendall, args=(message,))
+    thread.start()
+    assert adapter.read_bytes(-1) == message
+    thread.join()
+
+
+@pytest.mark.parametrize("termination, sent", (("\n", b""), ("\r\n", b""),
+                                               ("\r\n", b"\n")))
+def test_read_block_without_full_termination(pair, termination, sent):
+    adapter, instrument = pair
+    adapter.read_termination = termination
+    instrument.sendall(b"#13abc" + sent)
+    assert adapter.read_bytes(-1) == b"#13abc" + sent
+    instrument.sendall(b"next" + termination.encode())
+    assert adapter.read() == "next"
+
+
+def test_read_block_termination_arriving_later(pair):
+    adapter, instrument = pair
+    adapter.read_termination = "\r\n"
+    instrument.sendall(b"#13abc\r")
+    thread = threading.Timer(0.01, instrument.sendall, (b"\n",))
+    thread.start()
+    assert adapter.read_bytes(-1) == b"#13abc\r\n"
+    thread.join()
+
+
+def test_read_binary_values_into(pair):
+    adapter, instrument = pair
+    values = np.arange(1000, dtype="<f8")
+    instrument.sendall(b"#48000" + values.tobytes() + b"\n")
+    out = np.empty(1000)
+    adapter.read_binary_values(out=out, termination_bytes=-1)
+    assert np.array_equal(out, values)
+    instrument.sendall(b"next\n")
+    assert adapter.read() == "next"
+
+
+def test_timeout(pair):
+    adapter, instrument = pair
+    adapter.timeout = 0.01
+    with pytest.raises(TimeoutError):
+        adapter.read()
+
+
+def test_flush_read_buffer(pair):
+    adapter, instrument = pair
+    instrument.sendall(b"old\n")
+    adapter.read_bytes(1)
+    adapter.flush_read_buffer()
+    instrument.sendall(b"new\n")
+    assert adapter.read() == "new"
+
+
+def test_closed_connection(pair):
+    adapter, instrument = pair
+    instrument.close()
+    with pytest.raises(ConnectionError):
+        adapter.read()
+
+
+class SimulatedInstrument(Instrument):
+    voltage = Instrument.control("VOLT?", "VOLT %g", """Control the voltage.""")
+
+
+def test_tcp_connection():
+    with SimulatorServer(SimulatedInstrument) as server:
+        adapter = SocketAdapter(*server.address, timeout=2)
+        assert adapter.connection.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        instrument = SimulatedInstrument(adapter, "simulated", includeSCPI=False)
+        instrument.voltage = 3
+        assert instrument.voltage == 3
+        adapter.close()
@@ -0,0 +1,137 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import io
+import json
+
+import pytest
+import pyvisa
+
+from pymeasure.adapters import FakeAdapter, ProtocolAdapter, export_stats, reset_stats
+from pymeasure.adapters.statistics import AdapterStatistics, LATENCY_BINS
+from pymeasure.instruments import Instrument
+
+
+@pytest.fixture
+def adapter():
+    adapter = ProtocolAdapter([("VOLT?", "1.5"), ("VOLT?", "1.6"), (b"DATA\x01", None)])
+    adapter.enable_stats("Voltmeter")
+    return adapter
+
+
+def test_disabled_by_default():
+    adapter = FakeAdapter()
+    adapter.write("abc")
+    assert adapter.stats() == {}
+    assert adapter._monitors == ()
+
+
+def test_counts_per_command(adapter):
+    for i in range(2):
+        adapter.write("VOLT?")
+        adapter.read()
+    adapter.write_bytes(b"DATA\x01")
+    stats = adapter.stats()
+    assert set(stats) == {"VOLT?", "DATA\x01"}
+    assert stats["VOLT?"]["write"]["count"] == 2
+    assert stats["VOLT?"]["write"]["bytes"] == 10
+    assert stats["VOLT?"]["read"]["count"] == 2
+    assert stats["VOLT?"]["read"]["bytes"] == 6
+    assert sum(stats["VOLT?"]["read"]["histogram"]) == 2
+    assert stats["DATA\x01"]["write"]["bytes"] == 5
+
+
+def test_write_counts_encoded_bytes_and_termination():
+    adapter = FakeAdapter()
+    adapter.write_termination = "\r\n"
+    adapter.enable_stats()
+    adapter.write("µ?")
+    assert adapter.stats()["µ?"]["write"]["bytes"] == 5
+
+
+def test_visa_write_counts_termination():
+    pytest.importorskip("pyvisa_sim")
+    from pymeasure.adapters import VISAAdapter
+    adapter = VISAAdapter("ASRL2::INSTR", visa_library="@sim", write_termination="\r\n")
+    adapter.enable_stats()
+    adapter.write("VOLT?")
+    assert adapter.stats()["VOLT?"]["write"]["bytes"] == 7
+    adapter.close()
+
+
+def test_reset(adapter):
+    adapter.write("VOLT?")
+    adapter.reset_stats()
+    assert adapter.stats() == {}
+
+
+def test_disable(adapter):
+    adapter.disable_stats()
+    adapter.write("VOLT?")
+    assert adapter.stats() == {}
+
+
+def test_timeout_counted():
+    class TimeoutAdapter(FakeAdapter):
+        def _read(self, **kwargs):
+            raise pyvisa.errors.VisaIOError(pyvisa.constants.StatusCode.error_timeout)
+
+    adapter = TimeoutAdapter()
+    adapter.enable_stats()
+    adapter.write("X")
+    with pytest.raises(pyvisa.errors.VisaIOError):
+        adapter.read()
+    assert adapter.stats()["X"]["read"]["timeouts"] == 1
+
+
+def test_query_delay_recorded():
+    instr = Instrument(ProtocolAdapter([("VOLT?", "1.5")]), "Voltmeter")
+    instr.adapter.enable_stats(instr.name)
+    instr.ask("VOLT?", query_delay=0.001)
+    delay = instr.adapter.stats()["VOLT?"]["delay"]
+    assert delay["count"] == 1
+    assert delay["total"] >= 0.001
+
+
+def test_histogram_bins():
+    statistics = AdapterStatistics("test")
+    for duration in (0, 5e-4, 100):
+        statistics.record("read", "X", 0, duration)
+    histogram = statistics.as_dict()["X"]["read"]["histogram"]
+    assert len(histogram) == len(LATENCY_BINS) + 1
+    assert histogram[0] == histogram[2] == histogram[-1] == 1
+
+
+def test_export_keyed_by_name():
+    adapters = [FakeAdapter(), FakeAdapter()]
+    for a in adapters:
+        a.enable_stats("Exported")
+    reset_stats()
+    adapters[0].write("A")
+    adapters[1].write("B")
+    file = io.StringIO()
+    exported = export_stats(file)
+    assert {"A", "B"} == set(exported["Exported"]) | set(exported["Exported #2"])
+    assert json.loads(file.getvalue()) == exported
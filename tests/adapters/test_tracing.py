@@ -0,0 +1,89 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import json
+import threading
+
+import pytest
+
+from pymeasure.adapters import FakeAdapter, ProtocolAdapter, Tracer
+from pymeasure.instruments import Instrument
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "trace.json"
+
+
+def load(path):
+    return json.loads(path.read_text())
+
+
+def test_spans_of_instrument(path):
+    instr = Instrument(ProtocolAdapter([("VOLT?", "1.5")]), "Voltmeter")
+    with Tracer(path) as tracer:
+        tracer.attach(instr)
+        instr.ask("VOLT?", query_delay=0.001)
+    spans = [event for event in load(path) if event["ph"] == "X"]
+    assert [span["name"] for span in spans] == ["write VOLT?", "delay VOLT?", "read VOLT?"]
+    assert {span["cat"] for span in spans} == {"Voltmeter"}
+    assert spans[0]["args"]["bytes"] == 5
+    assert spans[1]["dur"] >= 1000
+    assert spans[0]["ts"] <= spans[1]["ts"] <= spans[2]["ts"]
+    assert instr.adapter._monitors == ()
+
+
+def test_threads_named(path):
+    adapter = FakeAdapter()
+    with Tracer(path, interval=0.01) as tracer:
+        tracer.attach(adapter, name="fake")
+        thread = threading.Thread(target=adapter.write, args=("x",), name="worker")
+        thread.start()
+        thread.join()
+        adapter.write("y")
+    events = load(path)
+    names = {e["args"]["name"] for e in events if e["ph"] == "M"}
+    assert "worker" in names
+    assert len({e["tid"] for e in events if e["ph"] == "X"}) == 2
+
+
+def test_ring_buffer_drops_oldest(path):
+    adapter = FakeAdapter()
+    tracer = Tracer(path, capacity=2, interval=10)
+    tracer.attach(adapter)
+    for command in "abc":
+        adapter.write(command)
+    tracer.close()
+    tracer.close()  # closing twice is harmless
+    assert [e["name"] for e in load(path) if e["ph"] == "X"] == ["write b", "write c"]
+
+
+def test_detach(path):
+    adapter = FakeAdapter()
+    with Tracer(path) as tracer:
+        tracer.attach(adapter)
+        tracer.detach(adapter)
+        adapter.write("a")
+    assert load(path) == []
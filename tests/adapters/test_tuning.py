@@ -0,0 +1,149 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import json
+import time
+
+import pytest
+
+from pymeasure.adapters import QueryDelayTuner
+from pymeasure.adapters.tuning import load_profiles
+
+
+def query(tuner, command="VOLT?", default=0.1, size=4, timeout=False):
+    """Simulate a query and return the delay used."""
+    tuner.record("write", command, 0, 1e-4, len(command))
+    delay = tuner.delay(default)
+    tuner.record("read", command, 0, 1e-3, size, timeout)
+    return delay
+
+
+def test_default_used_first():
+    tuner = QueryDelayTuner()
+    assert query(tuner) == 0.1
+
+
+def test_no_default_no_delay():
+    tuner = QueryDelayTuner()
+    assert query(tuner, default=None) is None
+    assert tuner.profile() == {}
+
+
+def test_delay_shortened_after_confirmations():
+    tuner = QueryDelayTuner(confirmations=2)
+    delays = [query(tuner) for i in range(6)]
+    assert delays == [0.1, 0.1, 0.05, 0.05, 0.025, 0.025]
+
+
+def test_delay_shortened_to_zero():
+    tuner = QueryDelayTuner(confirmations=1, minimum=0.02)
+    delays = [query(tuner) for i in range(5)]
+    assert delays == [0.1, 0.05, 0.025, 0, 0]
+
+
+def test_commands_tuned_separately():
+    tuner = QueryDelayTuner(confirmations=1)
+    query(tuner, "A?")
+    assert query(tuner, "A?") == 0.05
+    assert query(tuner, "B?") == 0.1
+
+
+@pytest.mark.parametrize("failure", ({"timeout": True}, {"size": 0}))
+def test_failure_increases_delay(failure):
+    tuner = QueryDelayTuner(confirmations=1, margin=2)
+    query(tuner)
+    assert query(tuner) == 0.05
+    query(tuner, **failure)  # at 0.025
+    assert tuner.profile()["VOLT?"]["failed"] == 0.025
+    assert query(tuner) == 0.05
+    # never shorter than margin times the failed delay
+    assert query(tuner) == 0.05
+
+
+def test_garbled_reply_increases_delay():
+    tuner = QueryDelayTuner(confirmations=1)
+    query(tuner)
+    query(tuner)
+    tuner.record("garbled", "VOLT?", 0, 0)
+    # the last query used 0.05 s
+    assert tuner.profile()["VOLT?"] == {"delay": 0.1, "failed": 0.05, "latency": 1e-3}
+
+
+def test_read_without_query_delay_ignored():
+    tuner = QueryDelayTuner(confirmations=1)
+    query(tuner)
+    tuner.record("write", "VOLT?", 0, 1e-4, 5)
+    tuner.record("read", "VOLT?", 0, 1e-3, 0, True)
+    assert tuner.profile()["VOLT?"]["failed"] is None
+
+
+def test_profile_saved_and_loaded(tmp_path):
+    file = tmp_path / "delays.json"
+    other = QueryDelayTuner(file, "other model")
+    query(other, "X?")
+    other.save()
+    tuner = QueryDelayTuner(file, "model 1.0", confirmations=1)
+    query(tuner)
+    tuner.flush()
+    assert load_profiles(file)["model 1.0"]["VOLT?"]["delay"] == 0.05
+    assert "other model" in load_profiles(file)
+    assert query(QueryDelayTuner(file, "model 1.0")) == 0.05
+
+
+def test_profile_not_saved_while_communicating(tmp_path):
+    file = tmp_path / "delays.json"
+    tuner = QueryDelayTuner(file, confirmations=1, save_interval=None)
+    query(tuner)
+    assert not file.exists()
+    tuner.flush()
+    assert load_profiles(file)["default"]["VOLT?"]["delay"] == 0.05
+
+
+def test_profile_saved_later(tmp_path):
+    file = tmp_path / "delays.json"
+    tuner = QueryDelayTuner(file, confirmations=1, save_interval=0.01)
+    query(tuner)
+    query(tuner)
+    stop = time.monotonic() + 5
+    while load_profiles(file).get("default", {}).get("VOLT?", {}).get("delay") != 0.025:
+        assert time.monotonic() < stop, "profile not saved"
+        time.sleep(0.01)
+
+
+def test_load_missing_file(tmp_path):
+    assert load_profiles(tmp_path / "missing.json") == {}
+
+
+def test_load_wrong_format(tmp_path):
+    file = tmp_path / "delays.json"
+    file.write_text(json.dumps({"format": "something"}))
+    with pytest.raises(ValueError):
+        load_profiles(file)
+
+
+def test_reset():
+    tuner = QueryDelayTuner()
+    query(tuner)
+    tuner.reset()
+    assert tuner.profile() == {}
@@ -22,11 +22,13 @@
 # THE SOFTWARE.
 #
 import importlib.util
+import threading
 
 import pytest
 import pyvisa
 
 from pymeasure.adapters import VISAAdapter
+from pymeasure.adapters.visa import ResourceRegistry, registry
 from pymeasure.test import expected_protocol
 
 # This uses a pyvisa-sim default instrument, we could also define our own.
@@ -63,6 +65,100 @@ def test_nested_adapter():
     assert a.resource_name == SIM_RESOURCE
     assert a.connection == a0.connection
     assert a.manager == a0.manager
+    assert a.transaction() is a0.transaction()
+
+
+class TestShared:
+    @pytest.fixture
+    def adapters(self):
+        adapters = [VISAAdapter(SIM_RESOURCE, visa_library='@sim', shared=True)
+                    for i in range(2)]
+        yield adapters
+        for adapter in adapters:
+            adapter.close()
+
+    def test_session_shared(self, adapters):
+        a0, a1 = adapters
+        assert a0.connection is a1.connection
+        assert a0.transaction() is a1.transaction()
+        assert registry.count(SIM_RESOURCE, '@sim') == 2
+
+    def test_not_shared_by_default(self, adapters):
+        a = VISAAdapter(SIM_RESOURCE, visa_library='@sim')
+        assert a.connection is not adapters[0].connection
+        assert registry.count(SIM_RESOURCE, '@sim') == 2
+
+    def test_close_keeps_session_for_other_users(self, adapters):
+        a0, a1 = adapters
+        connection = a0.connection
+        a0.close()
+        a0.close()  # closing twice does not release twice
+        assert registry.count(SIM_RESOURCE, '@sim') == 1
+        assert connection.session is not None
+        a1.close()
+        assert registry.count(SIM_RESOURCE, '@sim') == 0
+        with pytest.raises(pyvisa.errors.InvalidSession):
+            connection.session
+
+    def test_reopen_after_release(self, adapters):
+        for adapter in adapters:
+            adapter.close()
+        a = VISAAdapter(SIM_RESOURCE, visa_library='@sim', shared=True)
+        assert a.connection.session is not None
+        a.close()
+
+
+class TestResourceRegistry:
+    def test_slow_session_does_not_block_others(self):
+        reg = ResourceRegistry()
+        started, release = threading.Event(), threading.Event()
+
+        def open_slow():
+            started.set()
+            release.wait(5)
+            return "slow"
+
+        thread = threading.Thread(target=reg.acquire, args=("A", open_slow))
+        thread.start()
+        started.wait(5)
+        assert reg.acquire("B", lambda: "fast") == "fast"
+        release.set()
+        thread.join(5)
+        assert reg._entries["A"] == ["slow", 1]
+
+    def test_concurrent_users_share_session(self):
+        reg = ResourceRegistry()
+        started, release = threading.Event(), threading.Event()
+        opened = []
+
+        def open_slow():
+            opened.append(1)
+            started.set()
+            release.wait(5)
+            return object()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(reg.acquire("A", open_slow)))
+                   for i in range(3)]
+        for thread in threads:
+            thread.start()
+        started.wait(5)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        assert len(opened) == 1
+        assert len(results) == 3 and results[0] is results[1] is results[2]
+        assert reg._entries["A"][1] == 3
+
+    def test_failed_open_lets_others_retry(self):
+        reg = ResourceRegistry()
+
+        def fail():
+            raise OSError("unreachable")
+
+        with pytest.raises(OSError):
+            reg.acquire("A", fail)
+        assert reg.acquire("A", lambda: "session") == "session"
 
 
 def test_ProtocolAdapter():
@@ -150,3 +246,73 @@ class TestReadBytes:
         adapter.write("*IDN?")
         # `break_on_termchar=False` is default value
         assert adapter.read_bytes(-1) == b"SCPI,MOCK,VERSION_1.0\nSCPI,MOCK,VERSION_1.0\n"
+
+
+class ChunkedConnection:
+    """Stand-in for a pyvisa resource, which counts the calls of `read_bytes`."""
+
+    def __init__(self, data, report_buffer=True, read_termination=None):
+        self.data = bytearray(data)
+        self.report_buffer = report_buffer
+        self.read_termination = read_termination
+        self.calls = 0
+
+    @property
+    def bytes_in_buffer(self):
+        if not self.report_buffer:
+            raise AttributeError("bytes_in_buffer")
+        return len(self.data)
+
+    def read_bytes(self, count, **kwargs):
+        self.calls += 1
+        if not self.data:
+            raise pyvisa.errors.VisaIOError(pyvisa.constants.StatusCode.error_timeout)
+        chunk, self.data = bytes(self.data[:count]), self.data[count:]
+        return chunk
+
+
+class TestReadUntilTimeout:
+    @pytest.fixture
+    def adapterC(self):
+        adapter = VISAAdapter(SIM_RESOURCE, visa_library='@sim')
+        connection = adapter.connection
+
+        def connect(*args, **kwargs):
+            adapter.connection = ChunkedConnection(*args, **kwargs)
+            return adapter
+        yield connect
+        adapter.connection = connection
+        adapter.close()
+
+    def test_read_buffer_in_one_call(self, adapterC):
+        adapter = adapterC(b"abc\ndef\n")
+        assert adapter.read_bytes(-1) == b"abc\ndef\n"
+        assert adapter.connection.calls == 2  # the data and the timeout
+
+    def test_read_byte_wise_without_buffer_info(self, adapterC):
+        adapter = adapterC(b"abc", report_buffer=False)
+        assert adapter.read_bytes(-1) == b"abc"
+        assert adapter.connection.calls == 4
+
+    @pytest.mark.parametrize("termination, rest", ((None, b""), ("\n", b"\n")))
+    def test_read_block_without_timeout(self, adapterC, termination, rest):
+        adapter = adapterC(b"#210" + bytes(range(10)) + rest, report_buffer=False,
+                           read_termination=termination)
+        assert adapter.read_bytes(-1) == b"#210" + bytes(range(10)) + rest
+        # header byte-wise, then the block and the termination at once
+        assert adapter.connection.calls == 4 + 1 + len(rest)
+
+    def test_read_block_with_termination_buffered(self, adapterC):
+        adapter = adapterC(b"#13abc\n", read_termination="\n")
+        assert adapter.read_bytes(-1) == b"#13abc\n"
+        assert adapter.connection.calls == 1
+
+    @pytest.mark.parametrize("termination", ("\n", "\r\n"))
+    def test_read_block_without_termination(self, adapterC, termination):
+        adapter = adapterC(b"#13abc", report_buffer=False, read_termination=termination)
+        assert adapter.read_bytes(-1) == b"#13abc"
+
+    def test_indefinite_block_read_until_timeout(self, adapterC):
+        adapter = adapterC(b"#0abc", report_buffer=False)
+        assert adapter.read_bytes(-1) == b"#0abc"
+        assert adapter.connection.calls == 6
@@ -480,7 +480,27 @@ def test_wait_for_complete():
             [
                 *initial_comm_pairs(),
                 ("TRIGger:SINGle", None),
-                ("*OPC?", "1")
+                ("*ESE?", "0"),
+                ("*SRE?", "0"),
+                ("*ESE 1;*SRE 32;*OPC", None),
+                ("*ESR?", "0"),
+                ("*ESR?", "1"),
+                ("*ESE 0;*SRE 0", None),
             ]) as inst:
         inst.trigger_single()
-        inst.wait_for_complete()
+        assert inst.wait_for_complete() is True
+
+
+def test_wait_for_complete_deprecated_attempts():
+    with expected_protocol(
+            AgilentE5062A,
+            [
+                *initial_comm_pairs(),
+                ("*ESE?", "0"),
+                ("*SRE?", "0"),
+                ("*ESE 1;*SRE 32;*OPC", None),
+                ("*ESR?", "1"),
+                ("*ESE 0;*SRE 0", None),
+            ]) as inst:
+        with pytest.warns(FutureWarning):
+            assert inst.wait_for_complete(max_attempts=5) is True
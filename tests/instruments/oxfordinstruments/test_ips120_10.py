@@ -75,3 +75,11 @@ def test_control_mode_setter():
                            [("C1", "C")]
                            ) as inst:
         inst.control_mode = "RL"
+
+
+def test_wait_for_idle(monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda delay: None)
+    with expected_protocol(IPS120_10,
+                           [("X", "X00A0C0H0M01P00"), ("X", "X00A0C0H0M00P00")]
+                           ) as inst:
+        assert inst.wait_for_idle() is True
@@ -0,0 +1,233 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from concurrent.futures import CancelledError
+import threading
+
+import pytest
+
+from pymeasure.test import expected_protocol
+from pymeasure.instruments import Instrument, Channel
+from pymeasure.instruments.validators import strict_range
+
+
+class BatchChannel(Channel):
+    voltage = Channel.control("C{ch}:VOLT?", "C{ch}:VOLT %g", "Control the voltage.")
+
+
+class BatchInstrument(Instrument):
+    def __init__(self, adapter, name="BatchInstrument", **kwargs):
+        super().__init__(adapter, name, includeSCPI=False, **kwargs)
+
+    ch_A = Instrument.ChannelCreator(BatchChannel, "A")
+
+    voltage = Instrument.control(
+        "SOUR:VOLT?", "SOUR:VOLT %g", "Control the voltage.",
+        validator=strict_range, values=(0, 10),
+    )
+    mode = Instrument.control(
+        "MODE?", "MODE %s", "Control the mode.",
+        values={"fast": "FST", "slow": "SLW"}, map_values=True, cast=str,
+    )
+    current = Instrument.measurement("MEAS:CURR?", "Measure the current.")
+    output = Instrument.setting("*OUT %d", "Set the output.")
+
+
+def test_setters_joined():
+    with expected_protocol(
+            BatchInstrument,
+            [("SOUR:VOLT 5;*OUT 1;:MODE FST;:CA:VOLT 2", None)],
+    ) as inst:
+        with inst.batch():
+            inst.voltage = 5
+            inst.output = 1
+            inst.mode = "fast"
+            inst.ch_A.voltage = 2
+
+
+def test_getter_sends_queued_setters():
+    with expected_protocol(
+            BatchInstrument,
+            [("SOUR:VOLT 5;:SOUR:VOLT?", "5"), ("MODE SLW", None)],
+    ) as inst:
+        with inst.batch():
+            inst.voltage = 5
+            assert inst.voltage == 5
+            inst.mode = "slow"
+
+
+def test_deferred_getters():
+    with expected_protocol(
+            BatchInstrument,
+            [("SOUR:VOLT 5;:SOUR:VOLT?;:MODE?;:MEAS:CURR?;:CA:VOLT?", "5;SLW;0.1,0.2;7")],
+    ) as inst:
+        with inst.batch() as batch:
+            inst.voltage = 5
+            voltage = batch.get("voltage")
+            mode = batch.get("mode")
+            current = batch.get("current")
+            channel_voltage = batch.get("voltage", obj=inst.ch_A)
+            assert not voltage.done()
+        assert voltage.result() == 5
+        assert mode.result() == "slow"
+        assert current.result() == [0.1, 0.2]
+        assert channel_voltage.result() == 7
+
+
+def test_max_length():
+    with expected_protocol(
+            BatchInstrument,
+            [("SOUR:VOLT 1;:SOUR:VOLT?", "1"), ("MODE?;:MEAS:CURR?", "FST;3")],
+    ) as inst:
+        with inst.batch(max_length=23) as batch:
+            inst.voltage = 1
+            voltage = batch.get("voltage")
+            mode = batch.get("mode")
+            current = batch.get("current")
+        assert voltage.result() == 1
+        assert mode.result() == "fast"
+        assert current.result() == 3
+
+
+def test_parse_error_set_on_future():
+    with expected_protocol(
+            BatchInstrument,
+            [("MODE?;:SOUR:VOLT?", "XYZ;4")],
+    ) as inst:
+        with inst.batch() as batch:
+            mode = batch.get("mode")
+            voltage = batch.get("voltage")
+        with pytest.raises(KeyError):
+            mode.result()
+        assert voltage.result() == 4
+
+
+def test_wrong_number_of_replies():
+    with expected_protocol(
+            BatchInstrument,
+            [("MODE?;:SOUR:VOLT?", "FST")],
+    ) as inst:
+        with pytest.raises(ValueError, match="1 responses for 2"):
+            with inst.batch() as batch:
+                mode = batch.get("mode")
+                batch.get("voltage")
+        with pytest.raises(ValueError):
+            mode.result()
+
+
+def test_exception_discards_queue():
+    with expected_protocol(
+            BatchInstrument,
+            [],
+    ) as inst:
+        with pytest.raises(ZeroDivisionError):
+            with inst.batch() as batch:
+                inst.voltage = 5
+                voltage = batch.get("voltage")
+                1 / 0
+        with pytest.raises(CancelledError):
+            voltage.result()
+
+
+def test_nested_batch():
+    with expected_protocol(
+            BatchInstrument,
+            [("SOUR:VOLT 5;*OUT 0", None)],
+    ) as inst:
+        with inst.batch() as outer:
+            inst.voltage = 5
+            with inst.batch() as inner:
+                inst.output = 0
+            assert inner is outer
+
+
+def test_other_thread_waits_for_batch():
+    with expected_protocol(
+            BatchInstrument,
+            [("SOUR:VOLT 5;*OUT 0", None), ("MODE FST", None)],
+    ) as inst:
+        with inst.batch():
+            inst.voltage = 5
+            thread = threading.Thread(target=setattr, args=(inst, "mode", "fast"))
+            thread.start()
+            thread.join(0.05)
+            assert thread.is_alive()
+            inst.output = 0
+        thread.join(1)
+
+
+def test_unreadable_property_raises_immediately():
+    with expected_protocol(
+            BatchInstrument,
+            [],
+    ) as inst:
+        with inst.batch() as batch:
+            with pytest.raises(LookupError):
+                batch.get("output")
+
+
+def test_binary_flushes_queue():
+    with expected_protocol(
+            BatchInstrument,
+            [("SOUR:VOLT 5", None), (b"\x01\x02", None)],
+    ) as inst:
+        with inst.batch():
+            inst.voltage = 5
+            inst.write_bytes(b"\x01\x02")
+
+
+class TestReadProperties:
+    def test_read_properties(self):
+        with expected_protocol(
+                BatchInstrument,
+                [("SOUR:VOLT?;:MODE?;:CA:VOLT?;:MEAS:CURR?", "5;FST;2.5;0.1,0.2")],
+        ) as inst:
+            assert inst.read_properties(["voltage", "mode", "ch_A.voltage", "current"]) == {
+                "voltage": 5, "mode": "fast", "ch_A.voltage": 2.5, "current": [0.1, 0.2]}
+
+    def test_max_length(self):
+        with expected_protocol(
+                BatchInstrument,
+                [("SOUR:VOLT?", "5"), ("MODE?", "SLW")],
+        ) as inst:
+            assert inst.read_properties(["voltage", "mode"], max_length=10) == {
+                "voltage": 5, "mode": "slow"}
+
+    def test_inside_batch(self):
+        with expected_protocol(
+                BatchInstrument,
+                [("*OUT 1;:SOUR:VOLT?", "5"), ("MODE FST", None)],
+        ) as inst:
+            with inst.batch():
+                inst.output = 1
+                assert inst.read_properties(["voltage"]) == {"voltage": 5}
+                inst.mode = "fast"
+
+    def test_processing_error_raised(self):
+        with expected_protocol(
+                BatchInstrument,
+                [("MODE?", "XYZ")],
+        ) as inst:
+            with pytest.raises(KeyError):
+                inst.read_properties(["mode"])
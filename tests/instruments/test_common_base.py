@@ -23,14 +23,19 @@
 #
 
 import logging
+from inspect import getmembers
+from unittest import mock
 
+import numpy as np
 import pytest
 
 from pymeasure.units import ureg
 from pymeasure.test import expected_protocol
 from pymeasure.instruments.common_base import DynamicProperty, CommonBase
 from pymeasure.adapters import FakeAdapter, ProtocolAdapter
-from pymeasure.instruments.validators import strict_discrete_set, strict_range, truncated_range
+from pymeasure.instruments.validators import (
+    strict_discrete_set, strict_range, truncated_discrete_set, truncated_range
+)
 
 
 class CommonBaseTesting(CommonBase):
@@ -228,6 +233,84 @@ class TestInitWithMultipleChannelCreator:
         assert isinstance(parent.__class__.channels, CommonBase.MultiChannelCreator)
 
 
+class LazyChannelParent(CommonBaseTesting):
+    channels = CommonBase.MultiChannelCreator(GenericBase, range(1, 101), lazy=True)
+    analog = CommonBase.MultiChannelCreator(GenericBase, [1, 2], prefix="an_", lazy=True,
+                                            test=True)
+
+
+class TestLazyMultipleChannelCreator:
+    @pytest.fixture()
+    def parent(self):
+        return LazyChannelParent(ProtocolAdapter())
+
+    def test_no_channel_created_at_instantiation(self, parent):
+        assert len(parent.channels) == 100
+        assert 5 in parent.channels
+        assert 101 not in parent.channels
+        assert "ch_5" not in parent.__dict__
+        assert parent.channels._children == {}
+
+    def test_attribute_access_creates_channel(self, parent):
+        channel = parent.ch_5
+        assert isinstance(channel, GenericBase)
+        assert channel.id == 5
+        assert parent.ch_5 is channel is parent.channels[5]
+        assert list(parent.channels._children) == [5]
+
+    def test_collection_access_creates_channel(self, parent):
+        channel = parent.channels[7]
+        assert parent.ch_7 is channel
+        assert channel._protected
+
+    def test_kwargs_passed(self, parent):
+        assert parent.an_2.test is True
+
+    def test_unknown_channel(self, parent):
+        with pytest.raises(KeyError):
+            parent.channels[101]
+        with pytest.raises(AttributeError):
+            parent.ch_101
+
+    def test_iteration_creates_all(self, parent):
+        channels = list(parent.channels.values())
+        assert [channel.id for channel in channels] == list(range(1, 101))
+
+    def test_removal_of_protected_children_fails(self, parent):
+        with pytest.raises(TypeError, match="cannot remove channels defined at class"):
+            parent.remove_child(parent.ch_1)
+
+    def test_added_child(self, parent):
+        child = parent.add_child(GenericBase, "X")
+        assert parent.channels["X"] is parent.ch_X is child
+        assert len(parent.channels) == 101
+        parent.remove_child(child)
+        assert "X" not in parent.channels
+
+    def test_channel_property(self, parent):
+        parent.parent.comm_pairs = [("C{ch}:control?", "4")]
+        assert parent.ch_3.fake_ctrl == 4
+
+    def test_created_channel_stored_in_instance(self, parent):
+        assert "ch_5" not in parent.__dict__
+        parent.ch_5
+        assert "ch_5" in parent.__dict__
+
+    def test_lazy_requires_prefix(self):
+        with pytest.raises(ValueError):
+            CommonBase.MultiChannelCreator(GenericBase, [1, 2], prefix=None, lazy=True)
+
+
+def test_attribute_error_in_getter_not_hidden():
+    class Faulty(CommonBaseTesting):
+        @property
+        def volt(self):
+            return self.adapterr
+
+    with pytest.raises(AttributeError, match="adapterr"):
+        Faulty(ProtocolAdapter()).volt
+
+
 # Test CommonBase.ChannelCreator child management
 class TestInitWithChannelCreator:
     @pytest.fixture()
@@ -445,6 +528,39 @@ def test_values(value, kwargs, result):
     assert cb.values(value, **kwargs) == result
 
 
+@pytest.mark.parametrize("value, kwargs, result",
+                         (("1.5,-2E-3, 4e+2", {}, [1.5, -2e-3, 400.]),
+                          ("5,6,7", {'cast': int}, [5, 6, 7]),
+                          ("5,6.5", {'cast': int}, [5, '6.5']),
+                          ("1,2,", {}, [1., 2., '']),
+                          ("1,,2", {}, [1., '', 2.]),
+                          ("", {}, ['']),
+                          ("99999999999999999999,1", {'cast': int}, [10**20 - 1, 1]),
+                          ("1;2", {'separator': ';'}, [1., 2.]),
+                          ))
+def test_values_numeric(value, kwargs, result, monkeypatch):
+    monkeypatch.setattr("pymeasure.instruments.common_base._MIN_PARSE_LENGTH", 0)
+    cb = CommonBaseTesting(FakeAdapter(), "test")
+    values = cb.values(value, **kwargs)
+    assert values == result
+    assert [type(v) for v in values] == [type(r) for r in result]
+
+
+def test_values_as_array():
+    cb = CommonBaseTesting(FakeAdapter(), "test")
+    array = cb.values("1.5,2,3", as_array=True)
+    assert isinstance(array, np.ndarray)
+    assert array.dtype == np.float64
+    assert array.tolist() == [1.5, 2, 3]
+
+
+def test_values_as_array_fallback():
+    cb = CommonBaseTesting(FakeAdapter(), "test")
+    array = cb.values("X,Y", as_array=True)
+    assert isinstance(array, np.ndarray)
+    assert array.tolist() == ["X", "Y"]
+
+
 def test_binary_values(fake):
     fake.read_binary_values = fake.read
     assert fake.binary_values("123") == "123"
@@ -638,6 +754,72 @@ def test_control_dict_str_map(dynamic):
     assert fake.read() == '3'
 
 
+def test_control_dict_map_returns_first_key():
+    class Fake(FakeBase):
+        x = CommonBase.control(
+            "", "%d", "",
+            values={'A': 1, 'B': 2, 'C': 1},
+            map_values=True,
+        )
+
+    fake = Fake()
+    fake.parent._buffer = "1"
+    assert fake.x == 'A'
+    fake.parent._buffer = "2"
+    assert fake.x == 'B'
+
+
+def test_control_list_map_uses_first_index():
+    class Fake(FakeBase):
+        x = CommonBase.control(
+            "", "%d", "",
+            values=[4, 5, 4],
+            map_values=True,
+        )
+
+    fake = Fake()
+    fake.x = 4
+    assert fake.read() == '0'
+    with pytest.raises(ValueError):
+        fake.x = 6
+
+
+def test_control_unhashable_map_values():
+    class Fake(FakeBase):
+        x = CommonBase.control(
+            "", "%d", "",
+            values=[[1], [2]],
+            map_values=True,
+            get_process=lambda v: int(v),
+        )
+
+    fake = Fake()
+    fake.x = [2]
+    assert fake.read() == '1'
+    fake.parent._buffer = "0"
+    assert fake.x == [1]
+
+
+def test_control_replaced_values_are_prepared_anew():
+    class Fake(FakeBase):
+        x = CommonBase.control(
+            "", "%d", "",
+            validator=truncated_discrete_set,
+            values=[1, 10, 100],
+            dynamic=True,
+        )
+
+    fake = Fake()
+    fake.x = 5
+    assert fake.read() == '10'
+    fake.x_values = [1, 5, 100]
+    fake.x = 3
+    assert fake.read() == '5'
+    other = Fake()
+    other.x = 3
+    assert other.read() == '10'
+
+
 def test_value_not_in_map(fake):
     fake.parent._buffer = "123"
     with pytest.raises(KeyError, match="not found in mapped values"):
@@ -1013,6 +1195,19 @@ def test_dynamic_property_values_update_in_instance(fake):
     assert fake.fake_measurement == 'X'
 
 
+def test_dynamic_property_values_update_after_access(fake):
+    fake.fake_ctrl = 50
+    assert fake.fake_ctrl == 10
+    fake.fake_ctrl_values = (0, 33)  # the resolved parameters are updated
+    fake.fake_ctrl = 50
+    assert fake.fake_ctrl == 33
+
+
+def test_special_names_frozenset(fake):
+    assert isinstance(fake._special_names, frozenset)
+    assert "fake_ctrl_values" in fake._special_names
+
+
 def test_dynamic_property_values_update_in_one_instance_leaves_other_unchanged():
     generic1 = FakeBase()
     generic2 = FakeBase()
@@ -1046,3 +1241,34 @@ def test_dynamic_property_values_defined_at_superclass_level():
     inst.fake_ctrl2 = 17  # should raise an error if change unsuccessful
     with pytest.raises(ValueError):
         inst.fake_ctrl2 = 2  # should not raise an error if change unsuccessful
+
+
+class TestClassMetadata:
+    def test_computed_once_per_class(self):
+        class Channel(GenericBase):
+            pass
+
+        class Parent(CommonBaseTesting):
+            channels = CommonBase.MultiChannelCreator(Channel, ("A", "B", "C"))
+
+        with mock.patch("pymeasure.instruments.common_base.getmembers",
+                        wraps=getmembers) as patched:
+            Parent(ProtocolAdapter())
+            Parent(ProtocolAdapter())
+        # once for the parent class and once for the channel class
+        assert patched.call_count == 2
+
+    def test_subclass_has_own_metadata(self, fake):
+        class Sub(FakeBase):
+            sub_ctrl = CommonBase.control("", "%d", "docs", dynamic=True)
+        assert "sub_ctrl_values" in Sub()._special_names
+        assert "sub_ctrl_values" not in FakeBase()._special_names
+
+    def test_class_values_read_at_instantiation(self):
+        class Sub(FakeBase):
+            fake_ctrl_values = (1, 5)
+        Sub()
+        Sub.fake_ctrl_values = (1, 7)
+        instance = Sub()
+        instance.fake_ctrl = 10
+        assert instance.fake_ctrl == 7
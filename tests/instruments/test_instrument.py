@@ -22,16 +22,19 @@
 # THE SOFTWARE.
 #
 
-
+import asyncio
 import time
 from unittest import mock
 
+import numpy as np
 import pytest
 
 from pymeasure.test import expected_protocol
 from pymeasure.instruments import Instrument, Channel
-from pymeasure.adapters import FakeAdapter, ProtocolAdapter
+from pymeasure.adapters import AsyncAdapter, AsyncProtocolAdapter, FakeAdapter, ProtocolAdapter
+from pymeasure.adapters import PrologixAdapter
 from pymeasure.instruments.fakes import FakeInstrument
+from pymeasure.instruments.generic_types import SCPIMixin
 from pymeasure.instruments.validators import truncated_range
 
 
@@ -184,6 +187,71 @@ class TestInstrumentCommunication:
         instr.write_binary_values("abc", [5, 6, 7])
         assert instr.adapter.method_calls == [mock.call.write_binary_values("abc", [5, 6, 7])]
 
+    def test_read_bytes_into(self, instr):
+        buffer = bytearray(5)
+        instr.read_bytes_into(buffer)
+        assert instr.adapter.method_calls == [mock.call.read_bytes_into(buffer)]
+
+
+def test_binary_values_into_buffer():
+    out = np.zeros(3, dtype=np.uint8)
+    instr = ChannelInstrument(ProtocolAdapter([("TRAC?", b"#13\x01\x02\x03\n")] * 2))
+    assert instr.binary_values("TRAC?", out=out, termination_bytes=-1) is out
+    assert list(out) == [1, 2, 3]
+    out[:] = 0
+    instr.ch_A.binary_values("TRAC?", out=out, termination_bytes=-1)
+    assert list(out) == [1, 2, 3]
+
+
+def test_ask_holds_transaction():
+    instr = Instrument(ProtocolAdapter([("abc", "def")]), "abc")
+    instr.adapter._lock = mock.MagicMock()
+    assert instr.ask("abc") == "def"
+    assert instr.adapter._lock.__enter__.called
+
+
+def test_channel_transaction():
+    instr = ChannelInstrument(ProtocolAdapter())
+    assert instr.ch_A.transaction() is instr.adapter.transaction()
+
+
+class TestAwaitableCommunication:
+    @pytest.fixture()
+    def adapter(self):
+        return AsyncProtocolAdapter([("*IDN?", "xyz"), ("*CLS", None)])
+
+    def test_async_adapter_given(self, adapter):
+        instr = Instrument(adapter, "abc")
+        assert instr.async_adapter is adapter
+        assert instr.adapter is adapter.adapter
+
+    def test_async_adapter_created(self):
+        instr = Instrument(ProtocolAdapter(), "abc")
+        assert isinstance(instr.async_adapter, AsyncAdapter)
+        assert instr.async_adapter.adapter is instr.adapter
+        assert instr.async_adapter is instr.async_adapter
+
+    def test_aget(self, adapter):
+        instr = Instrument(adapter, "abc")
+        assert asyncio.run(instr.aget("id")) == "xyz"
+
+    def test_aask(self, adapter):
+        instr = Instrument(adapter, "abc")
+        assert asyncio.run(instr.aask("*IDN?")) == "xyz"
+
+    def test_avalues_channel(self):
+        instr = ChannelInstrument(AsyncProtocolAdapter([("C:A:control?", "3,4")]))
+        assert asyncio.run(instr.channels["A"].avalues("C:{ch}:control?")) == [3, 4]
+
+    def test_aset_channel(self):
+        instr = ChannelInstrument(AsyncProtocolAdapter([("CB:control 7", None)]))
+        asyncio.run(instr.ch_B.aset("fake_ctrl", 7))
+        assert instr.adapter._index == 1
+
+    def test_aget_in_worker_thread(self):
+        instr = ChannelInstrument(ProtocolAdapter([("CA:control?", "3")]))
+        assert asyncio.run(instr.ch_A.aget("fake_ctrl")) == 3
+
 
 class TestWaiting:
     @pytest.fixture()
@@ -215,6 +283,248 @@ class TestWaiting:
         assert instr.waited is None
 
 
+class TestWaitForCondition:
+    @pytest.fixture()
+    def sleeps(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr(time, "sleep", sleeps.append)
+        return sleeps
+
+    @pytest.fixture()
+    def instr(self):
+        return Instrument(ProtocolAdapter(), "faked", includeSCPI=False)
+
+    def test_condition_fulfilled(self, instr, sleeps):
+        assert instr.wait_for_condition(lambda: True) is True
+        assert sleeps == []
+
+    def test_intervals_increase(self, instr, sleeps):
+        results = iter((False,) * 5 + (True,))
+        assert instr.wait_for_condition(lambda: next(results), interval=0.25) is True
+        assert sleeps == [0.25, 0.5, 1, 1, 1]
+
+    def test_should_stop(self, instr, sleeps):
+        assert instr.wait_for_condition(lambda: False, should_stop=lambda: len(sleeps) > 1) \
+            is False
+        assert len(sleeps) == 2
+
+    def test_timeout(self, instr):
+        with pytest.raises(TimeoutError):
+            instr.wait_for_condition(lambda: False, timeout=0.02, interval=0.005)
+
+    def test_service_request_ends_interval(self, instr, sleeps):
+        instr.adapter.wait_for_srq = mock.MagicMock()
+        results = iter((False, True))
+        assert instr.wait_for_condition(lambda: next(results), interval=0.5) is True
+        instr.adapter.wait_for_srq.assert_called_once_with(timeout=0.5)
+        assert sleeps == []
+
+    def test_srq_timeout_continues(self, instr, sleeps):
+        instr.adapter.wait_for_srq = mock.MagicMock(side_effect=TimeoutError)
+        results = iter((False, False, True))
+        assert instr.wait_for_condition(lambda: next(results)) is True
+        assert instr.adapter.wait_for_srq.call_count == 2
+
+    def test_stuck_service_request_falls_back_to_polling(self, instr, sleeps):
+        instr.adapter.wait_for_srq = mock.MagicMock()
+        results = iter((False, False, False, True))
+        assert instr.wait_for_condition(lambda: next(results), interval=0.5) is True
+        assert instr.adapter.wait_for_srq.call_count == 1
+        assert sleeps == [1, 1]
+
+    def test_failing_service_request_falls_back_to_polling(self, instr, sleeps):
+        instr.adapter.wait_for_srq = mock.MagicMock(side_effect=NotImplementedError)
+        results = iter((False, False, True))
+        assert instr.wait_for_condition(lambda: next(results), interval=0.5) is True
+        assert instr.adapter.wait_for_srq.call_count == 1
+        assert sleeps == [1]
+
+    def test_prologix_service_request_does_not_address_instrument(self, sleeps):
+        connection = ProtocolAdapter([
+            ("++auto 0", None), ("++eoi 1", None), ("++eos 2", None),
+            ("DONE?", None), ("++read eoi", "0"),
+            ("++srq", "1"),
+            ("DONE?", None), ("++read eoi", "1")])
+        instr = Instrument(PrologixAdapter(connection), "faked", includeSCPI=False)
+        assert instr.wait_for_condition(lambda: instr.ask("DONE?") == "1") is True
+        assert connection._index == len(connection.comm_pairs)
+
+    def test_operation_complete(self, sleeps):
+        class SCPIInstrument(SCPIMixin, Instrument):
+            pass
+
+        with expected_protocol(SCPIInstrument, [("*ESE?", "60"), ("*SRE?", "16"),
+                                                ("*ESE 1;*SRE 32;*OPC", None), ("*ESR?", "32"),
+                                                ("*ESR?", "33"), ("*ESE 60;*SRE 16", None)],
+                               name="faked") as instr:
+            assert instr.wait_for_operation_complete() is True
+
+    def test_operation_complete_restores_registers_after_timeout(self):
+        class SCPIInstrument(SCPIMixin, Instrument):
+            pass
+
+        with expected_protocol(SCPIInstrument, [("*ESE?", "0"), ("*SRE?", "0"),
+                                                ("*ESE 1;*SRE 32;*OPC", None), ("*ESR?", "0"),
+                                                ("*ESE 0;*SRE 0", None)],
+                               name="faked") as instr:
+            with pytest.raises(TimeoutError):
+                instr.wait_for_operation_complete(timeout=0)
+
+
+class TestDelayTuning:
+    @pytest.fixture()
+    def instr(self):
+        class Slept(SCPIMixin, Instrument):
+            slept = []
+
+        instr = Slept(ProtocolAdapter(), "slept")
+        with mock.patch("time.sleep", instr.slept.append):
+            yield instr
+
+    def test_key_from_id(self, instr):
+        instr.adapter.comm_pairs = [("*IDN?", "Maker,Model X,123,1.2")]
+        tuner = instr.enable_delay_tuning()
+        assert tuner.key == "Maker Model X 1.2"
+        assert instr.delay_tuner is tuner
+
+    def test_delay_shortened(self, instr):
+        instr.enable_delay_tuning(key="x", confirmations=1)
+        instr.adapter.comm_pairs = [("V?", "1"), ("V?", "1")]
+        instr.ask("V?", query_delay=0.2)
+        instr.ask("V?", query_delay=0.2)
+        assert instr.slept == [0.2, 0.1]
+
+    def test_reject_reply(self, instr):
+        tuner = instr.enable_delay_tuning(key="x", confirmations=1)
+        instr.adapter.comm_pairs = [("V?", "1"), ("V?", "1")]
+        instr.ask("V?", query_delay=0.2)
+        instr.ask("V?", query_delay=0.2)
+        instr.reject_reply()
+        assert tuner.profile()["V?"]["failed"] == 0.1
+
+    def test_disable(self, instr):
+        tuner = instr.enable_delay_tuning(key="x")
+        instr.disable_delay_tuning()
+        assert instr.delay_tuner is None
+        assert tuner not in instr.adapter._monitors
+
+    def test_disable_saves_profile(self, instr, tmp_path):
+        file = tmp_path / "delays.json"
+        instr.enable_delay_tuning(file, key="x", confirmations=1, save_interval=None)
+        instr.adapter.comm_pairs = [("V?", "1")]
+        instr.ask("V?", query_delay=0.2)
+        assert not file.exists()
+        instr.disable_delay_tuning()
+        assert file.exists()
+
+
+class CachingInstrument(SCPIMixin, Instrument):
+    def __init__(self, adapter, name="Caching", **kwargs):
+        super().__init__(adapter, name, **kwargs)
+
+    nplc = Instrument.control("NPLC?", "NPLC %g", "Control the NPLC.", cache=True)
+    fast = Instrument.control("FAST?", "FAST %g", "Control something.", cache=0.05)
+    mode = Instrument.setting("MODE %s", "Set the mode.", cache=True)
+
+
+class DynamicCachingInstrument(SCPIMixin, Instrument):
+    def __init__(self, adapter, name="Caching", **kwargs):
+        super().__init__(adapter, name, **kwargs)
+
+    nplc = Instrument.control("NPLC?", "NPLC %g", "Control the NPLC.", cache=True,
+                              dynamic=True)
+    points = Instrument.setting("POIN %s", "Set the points.",
+                                set_process=lambda v: ",".join(str(p) for p in v), cache=True)
+
+
+class TestPropertyCache:
+    def test_dynamic_parameter_change_invalidates(self):
+        with expected_protocol(DynamicCachingInstrument,
+                               [("NPLC?", "1"), ("NPLC2?", "2")]) as inst:
+            assert inst.nplc == 1
+            inst.nplc_get_command = "NPLC2?"
+            assert inst.nplc == 2
+            assert inst.nplc == 2
+
+    def test_dynamic_values_change_invalidates(self):
+        with expected_protocol(DynamicCachingInstrument,
+                               [("NPLC?", "1"), ("NPLC?", "1")]) as inst:
+            assert inst.nplc == 1
+            inst.nplc_values = {"low": 1, "high": 10}
+            inst.nplc_map_values = True
+            assert inst.nplc == "low"
+
+    def test_setting_array_value(self):
+        with expected_protocol(DynamicCachingInstrument,
+                               [("POIN 1,2", None), ("POIN 1,3", None)]) as inst:
+            inst.points = np.array([1, 2])
+            inst.points = np.array([1, 2])
+            inst.points = np.array([1, 3])
+
+    def test_value_cached(self):
+        with expected_protocol(CachingInstrument, [("NPLC?", "1")]) as inst:
+            assert inst.nplc == 1
+            assert inst.nplc == 1
+
+    def test_write_invalidates(self):
+        with expected_protocol(CachingInstrument,
+                               [("NPLC?", "1"), ("NPLC 2", None), ("NPLC?", "2")]) as inst:
+            assert inst.nplc == 1
+            inst.nplc = 2
+            assert inst.nplc == 2
+
+    def test_ttl_expires(self):
+        with expected_protocol(CachingInstrument,
+                               [("FAST?", "1"), ("FAST?", "2")]) as inst:
+            assert inst.fast == 1
+            assert inst.fast == 1
+            time.sleep(0.06)
+            assert inst.fast == 2
+
+    @pytest.mark.parametrize("command", ("*RST", "*CLS"))
+    def test_reset_and_clear_invalidate(self, command):
+        with expected_protocol(CachingInstrument,
+                               [("*IDN?", "a,b,c,d"), ("NPLC?", "1"), (command, None),
+                                ("NPLC?", "10")]) as inst:
+            assert inst.id == "a,b,c,d"
+            assert inst.nplc == 1
+            inst.reset() if command == "*RST" else inst.clear()
+            assert inst.nplc == 10
+            assert inst.id == "a,b,c,d"  # static values are kept
+
+    def test_setting_skips_unchanged_value(self):
+        with expected_protocol(CachingInstrument,
+                               [("MODE A", None), ("MODE B", None), ("MODE A", None)]) as inst:
+            inst.mode = "A"
+            inst.mode = "A"
+            inst.mode = "B"
+            inst.mode = "A"
+
+    def test_clear_cache(self):
+        with expected_protocol(CachingInstrument,
+                               [("*OPT?", "x"), ("MODE A", None), ("*OPT?", "y"),
+                                ("MODE A", None)]) as inst:
+            assert inst.options == "x"
+            inst.mode = "A"
+            inst.clear_cache()
+            assert inst.options == "y"
+            inst.mode = "A"
+
+    def test_batch_cancel_invalidates_setting(self):
+        with expected_protocol(CachingInstrument, [("MODE A", None)]) as inst:
+            with pytest.raises(ZeroDivisionError):
+                with inst.batch():
+                    inst.mode = "A"
+                    1 / 0
+            inst.mode = "A"
+
+    def test_deprecated_scpi_id_cached(self):
+        with expected_protocol(Instrument, [("*IDN?", "xyz")], name="x",
+                               includeSCPI=True) as inst:
+            assert inst.id == "xyz"
+            assert inst.id == "xyz"
+
+
 @pytest.mark.parametrize("method, write, reply", (("id", "*IDN?", "xyz"),
                                                   ("complete", "*OPC?", "1"),
                                                   ("status", "*STB?", "189"),
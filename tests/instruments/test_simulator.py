@@ -0,0 +1,143 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import os
+import socket
+import time
+
+import pytest
+
+from pymeasure.instruments import Instrument
+from pymeasure.instruments.simulator import (SimulatedDevice, SimulatorServer,
+                                             derive_properties)
+from pymeasure.instruments.validators import strict_discrete_set, strict_range
+
+
+class SimulatedInstrument(Instrument):
+    def __init__(self, adapter, name="Simulated", **kwargs):
+        super().__init__(adapter, name, includeSCPI=False, **kwargs)
+
+    voltage = Instrument.control(
+        "VOLT?", "VOLT %g", """Control the voltage.""",
+        validator=strict_range, values=(0, 10))
+    output = Instrument.control(
+        "OUTP?", "OUTP %d", """Control the output.""",
+        validator=strict_discrete_set, values={True: 1, False: 0}, map_values=True)
+    current = Instrument.measurement("MEAS:CURR?", """Measure the current.""")
+    trigger = Instrument.setting("TRIG:SOUR %s", """Set the trigger source.""")
+    range = Instrument.control(
+        ":VOLT:RANG?", ":VOLT:RANG:AUTO 0;:VOLT:RANG %g", """Control the range.""")
+    frequency = Instrument.control(
+        "FREQ?", "FREQ %g", """Control the frequency.""",
+        validator=strict_range, values=(1, 20), dynamic=True)
+    channel_voltage = Instrument.control("{ch}:VOLT?", "{ch}:VOLT %g", """Skipped.""")
+
+
+class SimulatedSubclass(SimulatedInstrument):
+    frequency_values = (5, 6)
+
+
+def test_derive_properties():
+    properties = {p.name: p for p in derive_properties(SimulatedInstrument)}
+    assert set(properties) == {"voltage", "output", "current", "trigger", "range", "frequency"}
+    assert properties["current"].set_command is None
+    assert properties["trigger"].get_command is None
+    assert properties["output"].map_values is True
+    assert properties["voltage"].values == (0, 10)
+
+
+def test_dynamic_values_of_subclass():
+    properties = {p.name: p for p in derive_properties(SimulatedSubclass)}
+    assert properties["frequency"].values == (5, 6)
+
+
+class TestSimulatedDevice:
+    @pytest.fixture
+    def device(self):
+        return SimulatedDevice(SimulatedInstrument)
+
+    def test_defaults(self, device):
+        assert device.handle("VOLT?") == "0"
+        assert device.handle("OUTP?") == "1"
+        assert device.handle("FREQ?") == "1"
+
+    def test_set_and_get(self, device):
+        assert device.handle("VOLT 5") is None
+        assert device.handle("VOLT?") == "5"
+
+    def test_compound_message(self, device):
+        assert device.handle(":VOLT 2;:OUTP 0;:VOLT?;:OUTP?") == "2;0"
+
+    def test_compound_set_command(self, device):
+        device.handle(":VOLT:RANG:AUTO 0;:VOLT:RANG 20")
+        assert device.handle("VOLT:RANG?") == "20"
+        assert device.errors == []
+
+    def test_invalid_value_queues_error(self, device):
+        device.handle("VOLT 50")
+        assert device.handle("VOLT?") == "0"
+        assert device.handle("SYST:ERR?") == '-222,"Data out of range"'
+        assert device.handle("SYST:ERR?") == '0,"No error"'
+
+    def test_undefined_header(self, device):
+        assert device.handle("FOO?") is None
+        assert device.errors == ['-113,"Undefined header"']
+
+    def test_common_commands(self, device):
+        device.handle("VOLT 3")
+        assert device.handle("*IDN?") == "PyMeasure,Simulated SimulatedInstrument,0,0"
+        device.handle("*RST")
+        assert device.handle("VOLT?") == "0"
+        assert device.handle("*OPC?") == "1"
+
+    def test_latency(self):
+        device = SimulatedDevice(SimulatedInstrument, latency=0.05)
+        start = time.perf_counter()
+        device.handle("VOLT 1")
+        assert time.perf_counter() - start < 0.05
+        device.handle("VOLT?")
+        assert time.perf_counter() - start >= 0.05
+
+
+def test_tcp_server():
+    with SimulatorServer(SimulatedInstrument) as server:
+        assert server.resource_name == f"TCPIP::127.0.0.1::{server.address[1]}::SOCKET"
+        with socket.create_connection(server.address, timeout=2) as connection:
+            connection.sendall(b"VOLT 4.5\nVOLT?\n")
+            assert connection.makefile("rb").readline() == b"4.5\n"
+
+
+@pytest.mark.skipif(os.name != "posix", reason="pty is only available on POSIX systems.")
+def test_pty_server():
+    from pymeasure.adapters import SerialAdapter
+    with SimulatorServer(SimulatedInstrument, pty=True) as server:
+        adapter = SerialAdapter(server.port, timeout=2, write_termination="\n",
+                                read_termination="\n")
+        instrument = SimulatedInstrument(adapter)
+        instrument.voltage = 7
+        instrument.output = False
+        assert instrument.voltage == 7
+        assert instrument.output is False
+        adapter.close()
@@ -22,12 +22,14 @@
 # THE SOFTWARE.
 #
 
+import re
+
 import pytest
 from pymeasure.instruments.validators import (
     strict_range, strict_discrete_range, strict_discrete_set,
     truncated_range, truncated_discrete_set,
     modular_range, modular_range_bidirectional,
-    joined_validators
+    joined_validators, compile_validator
 )
 
 
@@ -103,3 +105,43 @@ def test_joined_validators():
         tst_validator("OUT", values)
     with pytest.raises(ValueError):
         tst_validator(20, values)
+
+
+@pytest.mark.parametrize("validator, values", (
+    (strict_range, (-5, 5)),
+    (truncated_range, [5, -5]),
+    (strict_discrete_set, [-5, 0, 2.5, 5]),
+    (strict_discrete_set, range(-5, 6)),
+    (truncated_discrete_set, [5, -5, 0, 2.5]),
+    (modular_range, range(6)),
+    (modular_range_bidirectional, range(6)),
+    (joined_validators(strict_discrete_set, strict_range), [["MAX"], [0, 1]]),
+))
+def test_compile_validator_matches_validator(validator, values):
+    validate = compile_validator(validator, values)
+    for value in (-7, -5, -1.5, 0, 0.5, 2.5, 4, 5, 7.2):
+        try:
+            expected = validator(value, values)
+        except ValueError as exc:
+            with pytest.raises(ValueError, match=re.escape(str(exc))):
+                validate(value)
+        else:
+            assert validate(value) == expected
+
+
+def test_compile_validator_unhashable_value():
+    validate = compile_validator(strict_discrete_set, [[1, 2], [3]])
+    assert validate([3]) == [3]
+    with pytest.raises(ValueError):
+        validate([4])
+
+
+def test_compile_validator_string_values():
+    """A string is searched for substrings, as by the validator itself."""
+    assert compile_validator(strict_discrete_set, "ABC")("AB") == "AB"
+
+
+def test_compile_validator_empty_values():
+    validate = compile_validator(strict_range, ())
+    with pytest.raises(ValueError):
+        validate(5)
@@ -0,0 +1,89 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+import time
+
+import pytest
+
+from pymeasure.instruments import all_of, wait_until
+
+
+@pytest.fixture()
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_condition_met(sleeps):
+    assert wait_until(lambda: True) is True
+    assert sleeps == []
+
+
+def test_intervals_increase_up_to_maximum(sleeps):
+    results = iter((False,) * 5 + (True,))
+    assert wait_until(lambda: next(results), interval=0.25, max_interval=1) is True
+    assert sleeps == [0.25, 0.5, 1, 1, 1]
+
+
+def test_interval_limited_by_maximum(sleeps):
+    results = iter((False, False, True))
+    wait_until(lambda: next(results), interval=2, max_interval=0.5)
+    assert sleeps == [0.5, 0.5]
+
+
+def test_should_stop(sleeps):
+    assert wait_until(lambda: False, should_stop=lambda: len(sleeps) == 3) is False
+    assert len(sleeps) == 3
+
+
+def test_timeout():
+    with pytest.raises(TimeoutError, match="the magnet"):
+        wait_until(lambda: False, timeout=0.02, interval=0.005, description="the magnet")
+
+
+def test_last_interval_ends_at_deadline(sleeps):
+    wait_until(lambda: len(sleeps) > 0, timeout=0.5, interval=10, max_interval=10)
+    assert 0.4 < sleeps[0] <= 0.5
+
+
+def test_pause():
+    pauses = []
+    results = iter((False, False, True))
+    wait_until(lambda: next(results), pause=pauses.append, interval=0.1)
+    assert pauses == [0.1, 0.2]
+
+
+def test_all_of_checks_met_conditions_once(sleeps):
+    calls = {"a": 0, "b": 0}
+
+    def condition(name, checks):
+        def check():
+            calls[name] += 1
+            return calls[name] >= checks
+        return check
+
+    assert wait_until(all_of(condition("a", 1), condition("b", 3))) is True
+    assert calls == {"a": 1, "b": 3}
+    assert len(sleeps) == 2
@@ -0,0 +1,76 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2025 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+
+import subprocess
+import sys
+import types
+
+import pytest
+
+from pymeasure.lazy import lazy_attributes
+
+
+@pytest.fixture
+def package(monkeypatch):
+    """A package `fake_package`, whose attribute `Thing` is imported from `.things`."""
+    package = types.ModuleType("fake_package")
+    package.__path__ = []
+    things = types.ModuleType("fake_package.things")
+    things.Thing = object()
+    things.Other = object()
+    monkeypatch.setitem(sys.modules, "fake_package", package)
+    monkeypatch.setitem(sys.modules, "fake_package.things", things)
+    package.__getattr__, package.__dir__, package.__all__ = lazy_attributes(
+        "fake_package", {".things": ["Thing"]})
+    return package
+
+
+def test_attribute_imported_on_access(package):
+    assert "Thing" not in vars(package)
+    assert package.Thing is sys.modules["fake_package.things"].Thing
+    assert "Thing" in vars(package)
+
+
+def test_from_import(package):
+    from fake_package import Thing
+    assert Thing is sys.modules["fake_package.things"].Thing
+
+
+def test_unknown_attribute(package):
+    with pytest.raises(AttributeError, match="has no attribute 'Other'"):
+        package.Other
+
+
+def test_dir_and_all(package):
+    assert "Thing" in dir(package)
+    assert package.__all__ == ["Thing"]
+
+
+def test_vendor_package_does_not_import_drivers():
+    code = ("import sys; import pymeasure.instruments.keithley as k; "
+            "assert 'pymeasure.instruments.keithley.keithley2400' not in sys.modules; "
+            "k.Keithley2400; "
+            "assert 'pymeasure.instruments.keithley.keithley2400' in sys.modules")
+    subprocess.run([sys.executable, "-W", "ignore", "-c", code], check=True)